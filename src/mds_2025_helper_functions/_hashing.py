@@ -0,0 +1,96 @@
+import numbers
+
+import numpy as np
+import pandas as pd
+
+# Mixed into hashes so that values of different types (or float bits that
+# happen to equal an int64) do not share a hash
+_NAN_HASH = np.uint64(0x9E3779B97F4A7C15)
+_FLOAT_TAG = np.uint64(0xC2B2AE3D27D4EB4F)
+
+
+def numeric_hashes(values, mask=None):
+    """
+    Hash integer, boolean or float values so that equal numbers hash equally
+    whatever their dtype: integers (and integral floats, e.g. an int column
+    promoted to float by a NaN in one chunk) are hashed as int64, other
+    floats by their float64 bits, and missing values to one constant.
+    """
+    if values.dtype.kind in "biu":
+        hashes = pd.util.hash_array(values.astype("int64", copy=False))
+    else:
+        values = values.astype("float64", copy=False) + 0.0  # Folds -0.0 into 0.0
+        with np.errstate(invalid="ignore"):
+            integral = (np.trunc(values) == values) & (np.abs(values) < 2.0 ** 63)
+        hashes = pd.util.hash_array(values) ^ _FLOAT_TAG
+        hashes[integral] = pd.util.hash_array(values[integral].astype("int64"))
+        hashes[np.isnan(values)] = _NAN_HASH
+    if mask is not None:
+        hashes[mask] = _NAN_HASH
+    return hashes
+
+
+def _type_tag(value_type, exact=False):
+    if not exact:
+        for base in (str, bytes):
+            if issubclass(value_type, base):
+                value_type = base
+    return pd.util.hash_array(np.array([f"{value_type.__module__}.{value_type.__qualname__}"], dtype=object))[0]
+
+
+def object_hashes(values, exact_types=False):
+    """
+    Hash an object array the way ``DataFrame.duplicated`` compares it: real
+    numbers (including bools) by numeric value, everything else by value
+    and type, so that ``1`` and ``"1"`` stay distinct. Missing values of
+    any kind (None, NaN, NaT, pd.NA) share one hash, as they do when
+    ``DataFrame.duplicated`` compares more than one column.
+
+    With `exact_types`, every value is also tagged with its exact type, so
+    ``1``, ``1.0``, ``True`` and ``None``/``NaN`` all hash differently, as
+    a content fingerprint needs.
+    """
+    if not exact_types and pd.api.types.infer_dtype(values, skipna=False) == "string":
+        return pd.util.hash_array(values) ^ _type_tag(str)
+    missing = np.zeros(len(values), dtype=bool) if exact_types else pd.isna(values)
+    hashes = np.full(len(values), _NAN_HASH, dtype="uint64")
+    codes, types = pd.factorize(np.fromiter(map(type, values), dtype=object, count=len(values)))
+    for code, value_type in enumerate(types):
+        selected = (codes == code) & ~missing
+        if not selected.any():
+            continue
+        group = values[selected]
+        if issubclass(value_type, (numbers.Real, np.bool_)):
+            try:
+                numeric = np.array(group, dtype="int64" if issubclass(value_type, (numbers.Integral, np.bool_))
+                                   else "float64")
+            except OverflowError:
+                numeric = np.array(group, dtype="float64")
+            hashes[selected] = numeric_hashes(numeric)
+            if exact_types:
+                hashes[selected] ^= _type_tag(value_type, exact=True)
+        else:
+            hashes[selected] = pd.util.hash_array(group) ^ _type_tag(value_type, exact_types)
+    return hashes
+
+
+def column_hashes(series):
+    """
+    Hash one column to 64-bit values that are equal exactly when
+    ``DataFrame.duplicated`` treats the values as equal (up to 64-bit
+    collisions). Integer columns keep their full int64 precision.
+    """
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or (
+        pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_complex_dtype(dtype)
+    ):
+        mask = series.isna().to_numpy()
+        if pd.api.types.is_float_dtype(dtype):
+            return numeric_hashes(series.to_numpy(dtype="float64", na_value=np.nan), mask)
+        if pd.api.types.is_unsigned_integer_dtype(dtype):
+            return numeric_hashes(series.to_numpy(dtype="uint64", na_value=0).view("int64"), mask)
+        return numeric_hashes(series.to_numpy(dtype="int64", na_value=0), mask)
+    if (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+            or isinstance(dtype, pd.CategoricalDtype)):
+        return object_hashes(series.to_numpy(dtype=object))
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
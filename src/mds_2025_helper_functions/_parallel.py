@@ -0,0 +1,42 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def resolve_n_jobs(n_jobs):
+    """
+    Map an `n_jobs` argument to a worker count: None means 1, negative
+    values count back from the number of CPUs (-1 for all of them).
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def parallel_map(func, items, n_jobs=None, parallel_backend="threads"):
+    """
+    Yield ``func(*item)`` for every item, in order, using a pool of `n_jobs`
+    workers. At most ``2 * n_jobs`` items are in flight so that large
+    results (such as full-length hash arrays) do not pile up in memory.
+    """
+    if parallel_backend not in ("threads", "processes"):
+        raise ValueError("parallel_backend must be 'threads' or 'processes'")
+    n_jobs = resolve_n_jobs(n_jobs)
+    if n_jobs == 1:
+        for item in items:
+            yield func(*item)
+        return
+
+    executor_class = ThreadPoolExecutor if parallel_backend == "threads" else ProcessPoolExecutor
+    with executor_class(max_workers=n_jobs) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, *item))
+            if len(pending) >= 2 * n_jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
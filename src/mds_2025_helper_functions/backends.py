@@ -0,0 +1,219 @@
+import sys
+
+import numpy as np
+
+
+def native_backend(data):
+    """
+    Name the native backend able to summarize `data` without converting it
+    to pandas: 'arrow' for ``pyarrow.Table``, 'arrow_dataset' for
+    ``pyarrow.dataset.Dataset`` and 'polars' for ``polars.DataFrame``.
+    Returns None for anything else.
+
+    Only libraries the caller has already imported are checked, so neither
+    pyarrow nor polars is imported (or required) by this module.
+    """
+    pyarrow = sys.modules.get("pyarrow")
+    if pyarrow is not None and isinstance(data, pyarrow.Table):
+        return "arrow"
+    dataset = sys.modules.get("pyarrow.dataset")
+    if dataset is not None and isinstance(data, dataset.Dataset):
+        return "arrow_dataset"
+    polars = sys.modules.get("polars")
+    if polars is not None and isinstance(data, polars.DataFrame):
+        return "polars"
+    return None
+
+
+def to_pandas(data):
+    """
+    Convert a supported native table to a pandas DataFrame.
+    """
+    if native_backend(data) == "arrow_dataset":
+        return data.to_table().to_pandas()
+    return data.to_pandas()
+
+
+def _empty_describe(percentiles):
+    return [0.0] + [np.nan] * (len(percentiles) + 4)
+
+
+def _as_float(value):
+    return np.nan if value is None else float(value)
+
+
+def _duplicate_keys(kinds, duplicate_subset):
+    if duplicate_subset is None:
+        return list(kinds)
+    unknown = [column for column in duplicate_subset if column not in kinds]
+    if unknown:
+        raise KeyError(unknown)
+    return list(duplicate_subset)
+
+
+def _arrow_kind(column):
+    """
+    Classify an Arrow column as `_column_kind` would classify its
+    ``to_pandas()`` dtype, or return None for types that become object or
+    timedelta columns there (decimals, dates, times, binary, nested types,
+    booleans with nulls, durations), whose pandas results have no native
+    equivalent.
+    """
+    import pyarrow as pa
+
+    data_type = column.type
+    if pa.types.is_integer(data_type) or pa.types.is_floating(data_type):
+        return "numerical"
+    if pa.types.is_timestamp(data_type) or (pa.types.is_boolean(data_type) and column.null_count == 0):
+        return "other"
+    if (pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+            or pa.types.is_dictionary(data_type) or pa.types.is_null(data_type)):
+        return "categorical"
+    return None
+
+
+def arrow_statistics(table, percentiles, duplicate_subset=None):
+    """
+    Compute per-column statistics of a ``pyarrow.Table`` with Arrow compute
+    kernels.
+
+    NaN is counted as missing in floating point columns, as in pandas.
+
+    Returns
+    -------
+    tuple or None
+        ``(kinds, stats, duplicates)`` in the layout used by
+        `dataset_summary`, where `duplicates` is None if Arrow cannot group
+        the key columns. None if a column type has no native equivalent of
+        the pandas result, so that the caller falls back to pandas.
+
+    Raises
+    ------
+    KeyError
+        If a column in `duplicate_subset` is not in the table.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    kinds = {name: _arrow_kind(table.column(name)) for name in table.column_names}
+    keys = _duplicate_keys(kinds, duplicate_subset)
+    if None in kinds.values():
+        return None
+
+    stats = {}
+    for name, kind in kinds.items():
+        column = table.column(name)
+        if kind == "numerical":
+            # Count, min and max on the native type; integers beyond 2**53 would
+            # make a safe cast to float64 fail
+            values = column
+            if pa.types.is_floating(column.type):
+                values = pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column)
+            count = pc.count(values).as_py()
+            missing = len(values) - count
+            if count == 0:
+                stats[name] = {"missing": missing, "describe": _empty_describe(percentiles)}
+                continue
+            min_max = pc.min_max(values).as_py()
+            # Moments and quantiles are float64 in pandas too, so rounding is fine here
+            values = pc.cast(values, pa.float64(), safe=False)
+            quantiles = pc.quantile(values, q=percentiles, interpolation="linear").to_pylist()
+            stats[name] = {
+                "missing": missing,
+                "describe": [
+                    float(count), _as_float(pc.mean(values).as_py()), _as_float(pc.stddev(values, ddof=1).as_py()),
+                    _as_float(min_max["min"]), *quantiles, _as_float(min_max["max"]),
+                ],
+            }
+        elif kind == "categorical":
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            unique = 0 if pa.types.is_null(column.type) else pc.count_distinct(column, mode="only_valid").as_py()
+            stats[name] = {"missing": column.null_count, "unique": unique}
+        else:
+            stats[name] = {"missing": column.null_count}
+
+    try:
+        duplicates = table.num_rows - table.select(keys).group_by(keys).aggregate([]).num_rows
+    except pa.ArrowException:
+        duplicates = None
+    return kinds, stats, duplicates
+
+
+def _polars_kind(series):
+    """
+    Classify a Polars column like `_arrow_kind`: by the dtype it gets from
+    ``to_pandas()``, or None if the pandas result has no native equivalent.
+    """
+    import polars as pl
+
+    data_type = series.dtype
+    if data_type.is_integer() or data_type.is_float():
+        return "numerical"
+    if data_type in (pl.Date, pl.Datetime) or (data_type == pl.Boolean and series.null_count() == 0):
+        return "other"
+    if data_type in (pl.String, pl.Categorical, pl.Enum, pl.Object, pl.Null):
+        return "categorical"
+    return None
+
+
+def polars_statistics(frame, percentiles, duplicate_subset=None):
+    """
+    Compute per-column statistics of a ``polars.DataFrame`` in a single
+    multi-threaded ``select``.
+
+    NaN is counted as missing in floating point columns, as in pandas.
+    Returns the same tuple as `arrow_statistics`.
+    """
+    import polars as pl
+
+    kinds = {name: _polars_kind(frame.get_column(name)) for name in frame.columns}
+    keys = _duplicate_keys(kinds, duplicate_subset)
+    if None in kinds.values():
+        return None
+
+    # Alias by position so that every expression has a unique output name
+    expressions = []
+    for i, (name, kind) in enumerate(kinds.items()):
+        column = pl.col(name)
+        if kind == "numerical":
+            values = column.cast(pl.Float64).fill_nan(None)
+            expressions += [
+                values.null_count().alias(f"{i}_missing"),
+                values.count().alias(f"{i}_count"),
+                values.mean().alias(f"{i}_mean"),
+                values.std().alias(f"{i}_std"),
+                values.min().alias(f"{i}_min"),
+                values.max().alias(f"{i}_max"),
+            ]
+            expressions += [
+                values.quantile(p, interpolation="linear").alias(f"{i}_q{j}") for j, p in enumerate(percentiles)
+            ]
+        elif kind == "categorical":
+            expressions += [
+                column.null_count().alias(f"{i}_missing"),
+                column.drop_nulls().n_unique().alias(f"{i}_unique"),
+            ]
+        else:
+            expressions.append(column.null_count().alias(f"{i}_missing"))
+    row = frame.select(expressions).row(0, named=True) if expressions else {}
+
+    stats = {}
+    for i, (name, kind) in enumerate(kinds.items()):
+        stats[name] = {"missing": int(row[f"{i}_missing"])}
+        if kind == "numerical":
+            if row[f"{i}_count"] == 0:
+                stats[name]["describe"] = _empty_describe(percentiles)
+            else:
+                stats[name]["describe"] = [
+                    float(row[f"{i}_count"]), _as_float(row[f"{i}_mean"]), _as_float(row[f"{i}_std"]),
+                    row[f"{i}_min"], *[row[f"{i}_q{j}"] for j in range(len(percentiles))], row[f"{i}_max"],
+                ]
+        elif kind == "categorical":
+            stats[name]["unique"] = int(row[f"{i}_unique"])
+
+    try:
+        duplicates = frame.height - frame.select(keys).n_unique()
+    except pl.exceptions.PolarsError:
+        duplicates = None
+    return kinds, stats, duplicates
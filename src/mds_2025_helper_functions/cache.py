@@ -0,0 +1,209 @@
+import copy
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from mds_2025_helper_functions._hashing import object_hashes
+
+
+def frame_fingerprint(data):
+    """
+    Compute a cheap content fingerprint of a DataFrame.
+
+    The fingerprint covers the shape, column names, dtypes, index and the
+    contents of every column. NumPy-backed numerical and datetime columns
+    are hashed straight from their buffers. Object and categorical values
+    are hashed together with their exact Python type, so ``1`` and ``"1"``
+    (or column labels ``1`` and ``"1"``) give different fingerprints; other
+    columns are hashed with ``pandas.util.hash_pandas_object``.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The DataFrame to fingerprint.
+
+    Returns
+    -------
+    str
+        A hexadecimal BLAKE2b digest.
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> from mds_2025_helper_functions.cache import frame_fingerprint
+    >>> df = pd.DataFrame({'a': [1, 2, 3]})
+    >>> frame_fingerprint(df) == frame_fingerprint(df.copy())
+    True
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((data.shape, list(map(repr, data.columns)), list(map(str, data.dtypes)))).encode())
+    if isinstance(data.index, pd.RangeIndex):
+        digest.update(repr(data.index).encode())
+    else:
+        digest.update(_series_hashes(data.index.to_series()).tobytes())
+    for _, series in data.items():
+        values = series.to_numpy() if isinstance(series.dtype, np.dtype) else None
+        if values is not None and values.dtype.kind in "biufcmM":
+            digest.update(np.ascontiguousarray(values).view("uint8").data)
+        else:
+            digest.update(_series_hashes(series).tobytes())
+    return digest.hexdigest()
+
+
+def _series_hashes(series):
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        # The categories (including unused ones) and the codes pointing at them
+        categories = object_hashes(dtype.categories.to_numpy(dtype=object), exact_types=True)
+        return np.concatenate([categories, series.cat.codes.to_numpy().astype("uint64")])
+    if pd.api.types.is_object_dtype(dtype):
+        return object_hashes(series.to_numpy(), exact_types=True)
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+
+class ResultCache:
+    """
+    Two-tier LRU cache for summary results keyed by DataFrame fingerprints.
+
+    Results live in an in-memory LRU tier of at most `max_entries` items and,
+    if `directory` is given, are also pickled to disk, where the least
+    recently used files are evicted once the tier exceeds `max_disk_bytes`.
+    Cached values are deep-copied on the way in and out, so callers can
+    modify returned DataFrames freely.
+
+    Parameters
+    ----------
+    max_entries : int, default=128
+        Maximum number of results kept in memory.
+    directory : str or os.PathLike, optional
+        Directory for the on-disk tier. Disabled when None.
+    max_disk_bytes : int, default=1 GiB
+        Size limit of the on-disk tier.
+
+    Attributes
+    ----------
+    hits, disk_hits, misses : int
+        Number of lookups answered from memory, from disk, or not at all.
+
+    Example
+    -------
+    >>> from mds_2025_helper_functions.cache import ResultCache
+    >>> from mds_2025_helper_functions.dataset_summary import dataset_summary
+    >>> cache = ResultCache(directory=".summary_cache")
+    >>> summary = dataset_summary(df, cache=cache)  # computed
+    >>> summary = dataset_summary(df, cache=cache)  # served from the cache
+    >>> cache.stats()
+    {'hits': 1, 'disk_hits': 0, 'misses': 1, 'entries': 1}
+    """
+
+    def __init__(self, max_entries=128, directory=None, max_disk_bytes=2 ** 30):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.directory = None if directory is None else os.fspath(directory)
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(name, data, **params):
+        """
+        Build a cache key from a function name, a DataFrame and the call's
+        other parameters.
+        """
+        return hashlib.blake2b(
+            repr((name, frame_fingerprint(data), sorted(params.items()))).encode(), digest_size=16
+        ).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for `key`, or `default` on a miss.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(self._memory[key])
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with open(self._path(key), "rb") as f:
+                value = pickle.load(f)
+            os.utime(self._path(key))
+            self.disk_hits += 1
+            self._remember(key, value)
+            return copy.deepcopy(value)
+        self.misses += 1
+        return default
+
+    def set(self, key, value):
+        """
+        Store `value` under `key` in both tiers.
+        """
+        value = copy.deepcopy(value)
+        self._remember(key, value)
+        if self.directory is not None:
+            with open(self._path(key), "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._evict_disk()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                info = os.stat(os.path.join(self.directory, name))
+                entries.append((info.st_mtime, info.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+    def clear(self):
+        """
+        Drop every entry from both tiers and reset the counters.
+        """
+        self._memory.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+        self.hits = self.disk_hits = self.misses = 0
+
+    def stats(self):
+        """
+        Return the hit/miss counters and the number of in-memory entries.
+        """
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses, "entries": len(self._memory)}
+
+
+default_cache = ResultCache()
+
+
+def resolve_cache(cache):
+    """
+    Map the `cache` argument of the summary functions to a cache object:
+    None/False disable caching, True selects the shared `default_cache`.
+    """
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        return default_cache
+    if isinstance(cache, ResultCache):
+        return cache
+    raise TypeError("cache must be a bool or a ResultCache")
@@ -1,7 +1,25 @@
+import os
+from functools import partial
+
+import numpy as np
 import pandas as pd
+from scipy import stats as st
+
+from mds_2025_helper_functions._hashing import column_hashes
+from mds_2025_helper_functions._parallel import parallel_map
+from mds_2025_helper_functions.backends import arrow_statistics, native_backend, polars_statistics, to_pandas
+from mds_2025_helper_functions.cache import resolve_cache
+from mds_2025_helper_functions.sketches import BloomFilter, HyperLogLog, KLLSketch
 
+DESCRIBE_PERCENTILES = (0.25, 0.5, 0.75)
+# Fixed seed of the KLL compaction offsets, so that sketched percentiles are
+# the same on every call with the same data
+_SKETCH_SEED = 0
 
-def dataset_summary(data):
+
+def dataset_summary(data, approx=False, hll_precision=14, percentiles=None, approx_quantiles=False, sketch_k=200,
+                    duplicate_subset=None, n_jobs=None, parallel_backend="threads", sample=None, random_state=None,
+                    confidence=0.95, cache=None, memory_report=False, categorical_threshold=0.5):
     """
     Generates a comprehensive summary of a dataset.
 
@@ -14,8 +32,68 @@ def dataset_summary(data):
 
     Parameters
     ----------
-    data : pandas.DataFrame
-        The dataset to analyze. Must be a pandas DataFrame.
+    data : pandas.DataFrame, pyarrow.Table, pyarrow.dataset.Dataset or polars.DataFrame
+        The dataset to analyze. Arrow tables, Arrow (e.g. Parquet) datasets
+        and Polars DataFrames are summarized with the library's own
+        columnar kernels, without a copy to pandas, unless `approx`,
+        `approx_quantiles`, `sample`, `cache` or `memory_report` is set or a
+        column holds durations; those cases convert to pandas first.
+        `n_jobs` and `parallel_backend` do not apply to the native path.
+    approx : bool, default=False
+        If True, estimate the unique value counts of categorical columns
+        with a HyperLogLog sketch, which uses fixed memory instead of a hash
+        set holding every distinct value.
+    hll_precision : int, default=14
+        Precision of the HyperLogLog sketch (between 4 and 18) when
+        `approx=True`. Each column uses ``2 ** hll_precision`` bytes and the
+        relative standard error is ``1.04 / sqrt(2 ** hll_precision)``.
+    percentiles : list of float, optional
+        Percentiles (between 0 and 1) to include in the numerical summary.
+        Defaults to the quartiles; the median is always included, as in
+        ``DataFrame.describe``.
+    approx_quantiles : bool, default=False
+        If True, compute the percentiles from a mergeable KLL quantile sketch
+        in one pass with memory bounded by `sketch_k` instead of
+        partitioning each column. The sketch is seeded, so repeated calls on
+        the same data give the same percentiles.
+    sketch_k : int, default=200
+        Accuracy parameter of the KLL sketch when `approx_quantiles=True`.
+    duplicate_subset : list, optional
+        Only consider these columns when counting duplicate rows. Defaults to
+        all columns.
+    n_jobs : int, optional
+        Number of workers that scan and hash columns concurrently. None or 1
+        runs serially, -1 uses all cores. Results are identical to the
+        serial path.
+    parallel_backend : {'threads', 'processes'}, default='threads'
+        Threads suit numerical columns, whose NumPy reductions release the
+        GIL; processes suit frames dominated by object columns, at the cost
+        of pickling each column to a worker.
+    sample : int or float, optional
+        Summarize a uniform random sample instead of every row: an int
+        draws that many rows without replacement, a float in (0, 1) keeps
+        each row with that probability. Missing percentages, counts, means
+        and percentiles are then estimates with confidence intervals. If the
+        sample would cover every row, the exact summary is returned.
+    random_state : int or numpy.random.Generator, optional
+        Seed for the sample.
+    confidence : float, default=0.95
+        Confidence level of the intervals reported with `sample`.
+    cache : bool or ResultCache, optional
+        Reuse results for unchanged data. True uses the shared
+        `mds_2025_helper_functions.cache.default_cache`; pass a
+        `ResultCache` to control its size, add an on-disk tier or inspect
+        hits and misses. Results are keyed by a content fingerprint of the
+        frame and the other arguments. Samples that are unseeded or drawn
+        from a ``numpy.random.Generator`` are never cached.
+    memory_report : bool, default=False
+        If True, add a 'memory_usage' entry with each column's
+        ``memory_usage(deep=True)`` and a recommended compact dtype derived
+        from the min/max and unique counts computed for the summary. Use
+        `optimize_dtypes` to apply the recommendations.
+    categorical_threshold : float, default=0.5
+        With `memory_report`, object columns whose ratio of unique values
+        to rows is at most this value are recommended as 'category'.
 
     Returns
     -------
@@ -28,18 +106,38 @@ def dataset_summary(data):
             Counts of numerical and categorical features in the dataset.
             Format: {'numerical_features': int, 'categorical_features': int}.
         - 'duplicates' (int):
-            The number of duplicate rows in the dataset.
+            The number of duplicate rows in the dataset, counted on 64-bit
+            row fingerprints (see `count_duplicates`).
         - 'numerical_summary' (pd.DataFrame):
-            Descriptive statistics for numerical columns.
+            Descriptive statistics for numerical columns. With
+            `approx_quantiles=True` the worst normalized rank error of the
+            sketched percentiles is stored in
+            ``numerical_summary.attrs['quantile_rank_error']``.
         - 'categorical_summary' (pd.DataFrame):
-            Unique value counts for categorical columns.
+            Unique value counts for categorical columns. With `approx=True`
+            the counts are estimates and a 'relative_error' column reports
+            the sketch's relative standard error.
+        - 'memory_usage' (pd.DataFrame, only with `memory_report`):
+            One row per column with 'column', 'dtype', 'memory_bytes' and
+            'recommended_dtype'.
+        - 'sampling' (dict, only with `sample`):
+            'sample_size', 'population_size', 'confidence' and 'fields',
+            which marks every other key as 'exact', 'estimate' (scaled to
+            the full dataset, with '*_ci_low' / '*_ci_high' interval
+            columns) or 'sample' (computed on the sample only: duplicates
+            and unique values, which cannot be extrapolated reliably).
 
     Raises
     ------
     TypeError
-        If the input is not a pandas DataFrame.
+        If the input is not one of the supported table types, or `cache` is
+        not a bool or a `ResultCache`.
     ValueError
-        If the DataFrame is empty or contains unsupported data types.
+        If the DataFrame is empty or contains unsupported data types, a
+        percentile is outside [0, 1], `n_jobs` is 0, `parallel_backend` is
+        unknown, `sample` / `confidence` is out of range, or `memory_report`
+        is combined with `sample` (sampled min/max cannot justify a
+        downcast).
 
     Example
     -------
@@ -79,46 +177,210 @@ def dataset_summary(data):
     >>> # 'duplicates' :
     # 1 (One duplicate row based on the data)
     """
+    # Arrow and Polars tables are summarized natively unless an option needs pandas
+    backend = native_backend(data)
+    if backend is not None:
+        if not (approx or approx_quantiles or sample is not None or memory_report or resolve_cache(cache)):
+            summary = _native_summary(data, backend, percentiles, duplicate_subset)
+            if summary is not None:
+                return summary
+        data = to_pandas(data)
+
     # Check input type
     if not isinstance(data, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame")
 
+    if memory_report and sample is not None:
+        raise ValueError("memory_report cannot be combined with sample")
+
     # Handle empty DataFrame
     if data.empty:
-        return {
-            "missing_values": pd.DataFrame(columns=["column", "missing_count", "missing_percentage"]),
-            "feature_types": {"numerical_features": 0, "categorical_features": 0},
-            "duplicates": 0,
-            "numerical_summary": pd.DataFrame(),
-            "categorical_summary": pd.DataFrame(),
-        }
+        summary = _empty_summary()
+        if memory_report:
+            summary["memory_usage"] = pd.DataFrame(columns=["column", "dtype", "memory_bytes", "recommended_dtype"])
+        return summary
 
-    # Missing value statistics
-    missing_values = data.isnull().sum().reset_index()
-    missing_values.columns = ["column", "missing_count"]
-    missing_values["missing_percentage"] = (missing_values["missing_count"] / len(data)) * 100
+    params = dict(
+        approx=approx, hll_precision=hll_precision, percentiles=percentiles, approx_quantiles=approx_quantiles,
+        sketch_k=sketch_k, duplicate_subset=duplicate_subset, n_jobs=n_jobs, parallel_backend=parallel_backend,
+        sample=sample, random_state=random_state, confidence=confidence, memory_report=memory_report,
+        categorical_threshold=categorical_threshold,
+    )
+    result_cache = resolve_cache(cache)
+    # A Generator draws a different sample on every call and its repr holds a
+    # memory address, so samples from one are treated as unseeded
+    unseeded = random_state is None or isinstance(random_state, (np.random.Generator, np.random.BitGenerator))
+    if result_cache is not None and not (sample is not None and unseeded):
+        # Worker settings do not change the result, so keep them out of the key
+        key = result_cache.make_key(
+            "dataset_summary", data,
+            **{name: value for name, value in params.items() if name not in ("n_jobs", "parallel_backend")}
+        )
+        summary = result_cache.get(key)
+        if summary is None:
+            summary = dataset_summary(data, **params)
+            result_cache.set(key, summary)
+        return summary
 
-    # Count feature types
-    numerical_features = data.select_dtypes(include="number").shape[1]
-    categorical_features = data.select_dtypes(exclude="number").shape[1]
-    feature_types = {"numerical_features": numerical_features, "categorical_features": categorical_features}
+    if sample is not None:
+        sampled = _draw_sample(data, sample, random_state)
+        if sampled is not None:
+            summary = dataset_summary(
+                sampled, approx=approx, hll_precision=hll_precision, percentiles=percentiles,
+                approx_quantiles=approx_quantiles, sketch_k=sketch_k, duplicate_subset=duplicate_subset,
+                n_jobs=n_jobs, parallel_backend=parallel_backend,
+            )
+            return _extrapolate_sample(summary, sampled, len(data), confidence)
+
+    percentiles = _validate_percentiles(percentiles)
+
+    # Classify every column once and scan each column's buffer a single time
+    kinds = _column_kinds(data)
+    scan = partial(
+        _scan_column,
+        percentiles=percentiles,
+        hll_precision=hll_precision if approx else None,
+        sketch_k=sketch_k if approx_quantiles else None,
+    )
+    columns = ((data[column], kind) for column, kind in kinds.items())
+    stats = dict(zip(kinds, parallel_map(scan, columns, n_jobs, parallel_backend)))
 
     # Duplicate rows
-    duplicates = data.duplicated().sum()
+    duplicates = count_duplicates(data, subset=duplicate_subset, n_jobs=n_jobs, parallel_backend=parallel_backend)
+
+    summary = _assemble_summary(kinds, stats, len(data), duplicates, percentiles, approx_quantiles)
+    if memory_report:
+        summary["memory_usage"] = _memory_report(
+            data, summary["numerical_summary"], summary["categorical_summary"], categorical_threshold
+        )
+    return summary
+
+
+def dataset_summary_stream(source, chunksize=100_000, sketch_k=200, approx=False, hll_precision=14,
+                           percentiles=None, duplicate_subset=None, bloom_capacity=None, bloom_error_rate=0.001,
+                           **read_kwargs):
+    """
+    Generates the same summary as `dataset_summary` from data read in chunks.
+
+    Each chunk is folded into a `SummaryState` (missing counts, moments,
+    quantile sketches and value fingerprints), so only one chunk is held in
+    memory at a time.
+
+    Parameters
+    ----------
+    source : str, os.PathLike, pyarrow.dataset.Dataset or iterable of pandas.DataFrame
+        A path to a CSV or Parquet file (``.parquet`` / ``.pq``), an Arrow
+        dataset (read in record batches of `chunksize` rows), or any
+        iterable yielding DataFrame chunks with the same columns.
+    chunksize : int, default=100_000
+        Number of rows per chunk when reading from a path.
+    sketch_k : int, default=200
+        Accuracy parameter of the quantile sketch used for the percentile
+        columns of the numerical summary.
+    approx : bool, default=False
+        If True, count unique categorical values with mergeable HyperLogLog
+        sketches, so their memory is fixed instead of growing with the
+        number of distinct values.
+    hll_precision : int, default=14
+        Precision of the HyperLogLog sketches when `approx=True`.
+    percentiles : list of float, optional
+        Percentiles to include in the numerical summary, as in
+        `dataset_summary`.
+    duplicate_subset : list, optional
+        Only consider these columns when counting duplicate rows.
+    bloom_capacity : int, optional
+        If given, track seen rows in a Bloom filter sized for this many
+        distinct rows instead of keeping every row fingerprint, so duplicate
+        counting uses fixed memory. Rows falsely reported as seen make the
+        duplicate count an overestimate by about `bloom_error_rate` times
+        the number of distinct rows.
+    bloom_error_rate : float, default=0.001
+        False positive rate of the Bloom filter at `bloom_capacity` rows.
+    **read_kwargs
+        Additional arguments passed to `pandas.read_csv` (CSV paths only).
+
+    Returns
+    -------
+    dict
+        A dictionary with the same keys and layout as `dataset_summary`.
+
+        Missing values, feature types, counts, means, standard deviations,
+        minima, maxima and (unless `approx=True`) unique value counts are
+        exact. Duplicate rows (unless `bloom_capacity` is set) and exact
+        unique values are counted on 64-bit fingerprints, so their memory
+        grows with the number of distinct rows/values rather than the number
+        of rows. The percentiles are exact while a column has fewer than
+        `sketch_k` values and come from a seeded, hence reproducible,
+        quantile sketch otherwise; the worst normalized rank error is stored
+        in ``numerical_summary.attrs['quantile_rank_error']``.
+
+    Raises
+    ------
+    TypeError
+        If `source` is not a path or an iterable of pandas DataFrames.
+    ValueError
+        If the chunks do not share the same columns, a numerical column
+        holds non-numerical data in a later chunk, or a percentile is
+        outside [0, 1].
+
+    Example
+    -------
+    >>> from mds_2025_helper_functions.dataset_summary import dataset_summary_stream
+    >>> summary = dataset_summary_stream("daily_extract.csv", chunksize=500_000)
+    >>> print(summary['numerical_summary'])
+
+    >>> # Any iterator of DataFrames works too
+    >>> chunks = (df.iloc[i:i + 1000] for i in range(0, len(df), 1000))
+    >>> summary = dataset_summary_stream(chunks)
+    """
+    percentiles = _validate_percentiles(percentiles)
+    state = SummaryState(
+        sketch_k=sketch_k, approx=approx, hll_precision=hll_precision, duplicate_subset=duplicate_subset,
+        bloom_capacity=bloom_capacity, bloom_error_rate=bloom_error_rate,
+    )
+    for chunk in _iter_chunks(source, chunksize, **read_kwargs):
+        state.update(chunk)
+    return state.result(percentiles)
+
+
+def _assemble_summary(kinds, stats, n_rows, duplicates, percentiles, approx_quantiles=False):
+    """
+    Build the summary dict from per-column statistics in the layout returned
+    by `_scan_column`, whichever backend computed them.
+    """
+    columns = list(kinds)
+
+    # Missing value statistics
+    missing_values = pd.DataFrame({
+        "column": columns,
+        "missing_count": np.array([stats[c]["missing"] for c in columns], dtype="int64"),
+    })
+    missing_values["missing_percentage"] = (missing_values["missing_count"] / n_rows) * 100
+
+    # Count feature types
+    numerical_columns = [c for c, kind in kinds.items() if kind == "numerical"]
+    categorical_columns = [c for c, kind in kinds.items() if kind == "categorical"]
+    feature_types = {
+        "numerical_features": len(numerical_columns),
+        "categorical_features": len(kinds) - len(numerical_columns),
+    }
 
     # Descriptive statistics for numerical features
-    if numerical_features > 0:
-        numerical_summary = data.describe(include="number").transpose()
+    if numerical_columns:
+        numerical_summary = pd.DataFrame(
+            [stats[c]["describe"] for c in numerical_columns],
+            index=numerical_columns,
+            columns=_describe_columns(percentiles),
+        )
+        if approx_quantiles:
+            numerical_summary.attrs["quantile_rank_error"] = max(
+                stats[c].get("rank_error", 0.0) for c in numerical_columns
+            )
     else:
         numerical_summary = pd.DataFrame()
 
     # Unique value counts for categorical features
-    categorical_columns = data.select_dtypes(include=["object", "category"]).columns
-    if not categorical_columns.empty:
-        categorical_summary = data[categorical_columns].nunique().reset_index()
-        categorical_summary.columns = ["column", "unique_values"]
-    else:
-        categorical_summary = pd.DataFrame()
+    categorical_summary = _categorical_summary({c: stats[c]["unique"] for c in categorical_columns})
 
     return {
         "missing_values": missing_values,
@@ -126,4 +388,782 @@ def dataset_summary(data):
         "duplicates": duplicates,
         "numerical_summary": numerical_summary,
         "categorical_summary": categorical_summary
-    }
\ No newline at end of file
+    }
+
+
+def _native_summary(data, backend, percentiles=None, duplicate_subset=None):
+    """
+    Summarize a pyarrow Table/Dataset or Polars DataFrame with the library's
+    own columnar kernels. Returns None if a column type needs the pandas
+    path.
+    """
+    if backend == "arrow_dataset":
+        data, backend = data.to_table(), "arrow"
+    percentiles = _validate_percentiles(percentiles)
+    if 0 in data.shape:
+        return _empty_summary()
+    compute = arrow_statistics if backend == "arrow" else polars_statistics
+    result = compute(data, percentiles, duplicate_subset)
+    if result is None:
+        return None
+    kinds, stats, duplicates = result
+    if duplicates is None:
+        duplicates = count_duplicates(to_pandas(data.select(list(duplicate_subset or kinds))))
+    return _assemble_summary(kinds, stats, data.shape[0], duplicates, percentiles)
+
+
+def _categorical_summary(unique):
+    """
+    Build the categorical summary from a mapping of column to exact unique
+    count, exact fingerprint array or HyperLogLog sketch.
+    """
+    if not unique:
+        return pd.DataFrame()
+    counts = []
+    errors = []
+    for value in unique.values():
+        if isinstance(value, HyperLogLog):
+            counts.append(int(round(value.count())))
+            errors.append(value.relative_error)
+        else:
+            counts.append(value if isinstance(value, int) else len(value))
+    categorical_summary = pd.DataFrame({"column": list(unique), "unique_values": counts})
+    if errors:
+        categorical_summary["relative_error"] = errors
+    return categorical_summary
+
+
+_INTEGER_DTYPES = ["int8", "int16", "int32", "int64"]
+_UNSIGNED_DTYPES = ["uint8", "uint16", "uint32", "uint64"]
+
+
+def _recommend_dtype(dtype, vmin, vmax, unique_ratio, categorical_threshold, float32_exact=False):
+    """
+    Pick the smallest dtype that holds a column with the given min/max, or
+    'category' for repetitive object columns. Float columns are only
+    recommended as float32 when `float32_exact` says every value survives
+    the conversion unchanged. Returns the current dtype when nothing smaller
+    applies.
+    """
+    current = str(dtype)
+    nullable = isinstance(dtype, pd.api.extensions.ExtensionDtype)
+    if pd.api.types.is_integer_dtype(dtype) and not np.isnan(vmin):
+        # Keep signedness, like pandas.to_numeric(downcast=...)
+        candidates = _UNSIGNED_DTYPES if pd.api.types.is_unsigned_integer_dtype(dtype) else _INTEGER_DTYPES
+        for candidate in candidates:
+            info = np.iinfo(candidate)
+            if info.min <= vmin and vmax <= info.max and info.bits < dtype.itemsize * 8:
+                return candidate.capitalize().replace("Uint", "UInt") if nullable else candidate
+    elif pd.api.types.is_float_dtype(dtype) and dtype.itemsize > 4 and not np.isnan(vmin):
+        if float32_exact:
+            return "Float32" if nullable else "float32"
+    elif pd.api.types.is_object_dtype(dtype) and unique_ratio is not None and unique_ratio <= categorical_threshold:
+        return "category"
+    return current
+
+
+def _memory_report(data, numerical_summary, categorical_summary, categorical_threshold):
+    memory = data.memory_usage(deep=True, index=False)
+    unique = {}
+    if not categorical_summary.empty:
+        unique = dict(zip(categorical_summary["column"], categorical_summary["unique_values"]))
+    recommended = []
+    for column, dtype in data.dtypes.items():
+        vmin = vmax = np.nan
+        if column in numerical_summary.index:
+            vmin, vmax = numerical_summary.loc[column, "min"], numerical_summary.loc[column, "max"]
+        unique_ratio = unique[column] / len(data) if column in unique else None
+        float32_exact = False
+        if pd.api.types.is_float_dtype(dtype) and dtype.itemsize > 4 and not np.isnan(vmin):
+            values = data[column].to_numpy(dtype="float64", na_value=np.nan)
+            values = values[~np.isnan(values)]
+            float32_exact = bool((values.astype("float32") == values).all())
+        recommended.append(_recommend_dtype(dtype, vmin, vmax, unique_ratio, categorical_threshold, float32_exact))
+    return pd.DataFrame({
+        "column": data.columns,
+        "dtype": [str(dtype) for dtype in data.dtypes],
+        "memory_bytes": memory.to_numpy(),
+        "recommended_dtype": recommended,
+    })
+
+
+def optimize_dtypes(data, summary=None, categorical_threshold=0.5):
+    """
+    Downcast columns to the compact dtypes recommended by `dataset_summary`.
+
+    Integer columns move to the smallest integer type that holds their
+    min/max, float64 columns to float32 when every value converts exactly
+    (so the conversion never changes a value), and object columns with few
+    distinct values to 'category'.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The dataset to shrink.
+    summary : dict, optional
+        A result of ``dataset_summary(data, memory_report=True)`` to reuse.
+        Computed when not given.
+    categorical_threshold : float, default=0.5
+        Maximum ratio of unique values to rows for converting an object
+        column to 'category' (only used when `summary` is not given).
+
+    Returns
+    -------
+    tuple
+        ``(optimized, bytes_saved)``: the converted copy of `data` and the
+        reduction in ``memory_usage(deep=True)`` in bytes.
+
+    Raises
+    ------
+    TypeError
+        If the input is not a pandas DataFrame.
+    ValueError
+        If `summary` has no 'memory_usage' entry.
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> from mds_2025_helper_functions.dataset_summary import optimize_dtypes
+    >>> df = pd.DataFrame({'small': [1, 2, 3, 4], 'label': ['a', 'a', 'a', 'b']})
+    >>> optimized, bytes_saved = optimize_dtypes(df)
+    >>> optimized.dtypes
+    small        int8
+    label    category
+    dtype: object
+    """
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame")
+    if summary is None:
+        summary = dataset_summary(data, memory_report=True, categorical_threshold=categorical_threshold)
+    if "memory_usage" not in summary:
+        raise ValueError("summary must be computed with memory_report=True")
+
+    report = summary["memory_usage"]
+    changes = {
+        column: recommended
+        for column, dtype, recommended in zip(report["column"], report["dtype"], report["recommended_dtype"])
+        if recommended != dtype
+    }
+    optimized = data.astype(changes) if changes else data.copy()
+    bytes_saved = int(report["memory_bytes"].sum() - optimized.memory_usage(deep=True, index=False).sum())
+    return optimized, bytes_saved
+
+
+def _draw_sample(data, sample, random_state):
+    """
+    Return a uniform random sample of rows, or None if it would contain
+    every row. Row positions are drawn directly, so the cost depends on the
+    sample size rather than on the number of rows.
+    """
+    rng = np.random.default_rng(random_state)
+    n_rows = len(data)
+    if isinstance(sample, (int, np.integer)) and not isinstance(sample, bool):
+        if sample <= 0:
+            raise ValueError("sample must be a positive number of rows or a fraction in (0, 1)")
+        size = sample
+    elif isinstance(sample, (float, np.floating)) and 0 < sample < 1:
+        size = rng.binomial(n_rows, sample)
+    else:
+        raise ValueError("sample must be a positive number of rows or a fraction in (0, 1)")
+    if size >= n_rows:
+        return None
+    positions = np.sort(rng.choice(n_rows, size=max(size, 1), replace=False))
+    return data.iloc[positions]
+
+
+def _extrapolate_sample(summary, sampled, population_size, confidence):
+    """
+    Scale a summary of `sampled` up to `population_size` rows and add
+    confidence intervals: Wilson intervals for missing percentages,
+    t intervals with finite population correction for means and
+    order-statistic intervals for percentiles.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    sample_size = len(sampled)
+    scale = population_size / sample_size
+    z = st.norm.ppf((1 + confidence) / 2)
+    fpc = np.sqrt((population_size - sample_size) / (population_size - 1))
+
+    missing_values = summary["missing_values"]
+    share = missing_values["missing_count"].to_numpy() / sample_size
+    centre = (share + z ** 2 / (2 * sample_size)) / (1 + z ** 2 / sample_size)
+    half_width = z / (1 + z ** 2 / sample_size) * np.sqrt(
+        share * (1 - share) / sample_size + z ** 2 / (4 * sample_size ** 2)
+    )
+    missing_values["missing_count"] = np.round(share * population_size).astype("int64")
+    missing_values["missing_percentage_ci_low"] = np.where(share > 0, np.clip(centre - half_width, 0, 1), 0) * 100
+    missing_values["missing_percentage_ci_high"] = np.clip(centre + half_width, 0, 1) * 100
+
+    numerical_summary = summary["numerical_summary"]
+    if not numerical_summary.empty:
+        percentile_columns = list(numerical_summary.columns[4:-1])
+        bounds = {name: [] for name in ["mean_ci_low", "mean_ci_high"]}
+        bounds.update({f"{label}_{side}": [] for label in percentile_columns for side in ["ci_low", "ci_high"]})
+        for column in numerical_summary.index:
+            values = sampled[column].to_numpy(dtype="float64", na_value=np.nan)
+            values = np.sort(values[~np.isnan(values)])
+            count = values.size
+            mean, std = numerical_summary.loc[column, ["mean", "std"]]
+            margin = st.t.ppf((1 + confidence) / 2, count - 1) * std / np.sqrt(count) * fpc if count > 1 else np.nan
+            bounds["mean_ci_low"].append(mean - margin)
+            bounds["mean_ci_high"].append(mean + margin)
+            for label in percentile_columns:
+                p = float(label.rstrip("%")) / 100
+                spread = z * np.sqrt(count * p * (1 - p))
+                low = int(np.clip(np.floor(count * p - spread), 0, max(count - 1, 0)))
+                high = int(np.clip(np.ceil(count * p + spread), 0, max(count - 1, 0)))
+                bounds[f"{label}_ci_low"].append(values[low] if count else np.nan)
+                bounds[f"{label}_ci_high"].append(values[high] if count else np.nan)
+        numerical_summary["count"] = numerical_summary["count"] * scale
+        for name, column_bounds in bounds.items():
+            numerical_summary[name] = column_bounds
+
+    summary["sampling"] = {
+        "sample_size": sample_size,
+        "population_size": population_size,
+        "confidence": confidence,
+        "fields": {
+            "missing_values": "estimate",
+            "feature_types": "exact",
+            "duplicates": "sample",
+            "numerical_summary": "estimate",
+            "categorical_summary": "sample",
+        },
+    }
+    return summary
+
+
+def _empty_summary():
+    return {
+        "missing_values": pd.DataFrame(columns=["column", "missing_count", "missing_percentage"]),
+        "feature_types": {"numerical_features": 0, "categorical_features": 0},
+        "duplicates": 0,
+        "numerical_summary": pd.DataFrame(),
+        "categorical_summary": pd.DataFrame(),
+    }
+
+
+def _iter_chunks(source, chunksize, **read_kwargs):
+    if isinstance(source, pd.DataFrame):
+        yield source
+        return
+    if native_backend(source) == "arrow_dataset":
+        for batch in source.to_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+        return
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.endswith((".parquet", ".pq")):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Reading Parquet files in chunks requires pyarrow.") from e
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(path, chunksize=chunksize, **read_kwargs)
+        return
+    try:
+        yield from source
+    except TypeError as e:
+        raise TypeError("Input must be a file path or an iterable of pandas DataFrames") from e
+
+
+def _column_kind(dtype):
+    """
+    Classify a dtype the way ``select_dtypes`` does: 'numerical' for
+    ``include="number"``, 'categorical' for object/category (reported in the
+    categorical summary) and 'other' for the remaining non-numerical dtypes
+    such as datetimes and booleans.
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        return "other"
+    if pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype):
+        return "numerical"
+    if pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return "categorical"
+    return "other"
+
+
+def _column_kinds(data):
+    return {column: _column_kind(dtype) for column, dtype in data.dtypes.items()}
+
+
+def _validate_percentiles(percentiles):
+    """
+    Return sorted unique percentiles with the median added, like
+    ``DataFrame.describe``.
+    """
+    if percentiles is None:
+        return list(DESCRIBE_PERCENTILES)
+    percentiles = np.asarray(percentiles, dtype="float64").ravel()
+    if np.any((percentiles < 0) | (percentiles > 1)):
+        raise ValueError("percentiles should all be in the interval [0, 1]")
+    return sorted(set(percentiles.tolist()) | {0.5})
+
+
+def _describe_columns(percentiles):
+    return ["count", "mean", "std", "min", *[f"{p * 100:g}%" for p in percentiles], "max"]
+
+
+def _describe_values(values, percentiles):
+    """
+    Count, mean, std, min, percentiles and max of a float64 array without
+    NaNs, matching ``DataFrame.describe``. The percentiles use linear
+    interpolation on a single multi-pivot partition instead of a full sort.
+    """
+    count = values.size
+    if count == 0:
+        return [0.0] + [np.nan] * (len(percentiles) + 4)
+    positions = np.asarray(percentiles) * (count - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+    partitioned = np.partition(values, np.unique(np.concatenate([[0, count - 1], lower, upper])))
+    quantiles = partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (positions - lower)
+    mean = values.mean()
+    std = np.sqrt(((values - mean) ** 2).sum() / (count - 1)) if count > 1 else np.nan
+    return [float(count), mean, std, partitioned[0], *quantiles, partitioned[count - 1]]
+
+
+def _describe_sketched(values, percentiles, sketch_k):
+    """
+    Same statistics as `_describe_values`, with the percentiles read from a
+    KLL sketch built in one pass over `values`.
+    """
+    count = values.size
+    if count == 0:
+        return [0.0] + [np.nan] * (len(percentiles) + 4), 0.0
+    sketch = KLLSketch(k=sketch_k, seed=_SKETCH_SEED).update(values)
+    mean = values.mean()
+    std = np.sqrt(((values - mean) ** 2).sum() / (count - 1)) if count > 1 else np.nan
+    describe = [float(count), mean, std, sketch.min, *sketch.quantile(percentiles), sketch.max]
+    return describe, sketch.normalized_rank_error
+
+
+def _scan_column(series, kind, percentiles=DESCRIBE_PERCENTILES, hll_precision=None, sketch_k=None):
+    """
+    Compute every per-column statistic `dataset_summary` needs from one
+    column: the missing count for all columns, describe statistics for
+    numerical columns (percentiles from a KLL sketch when `sketch_k` is
+    given) and the number of unique values for categorical ones (a
+    HyperLogLog sketch instead of an exact count when `hll_precision` is
+    given).
+    """
+    if kind == "numerical" and (
+        pd.api.types.is_timedelta64_dtype(series.dtype) or pd.api.types.is_complex_dtype(series.dtype)
+    ):
+        # Not representable as float64, so fall back to pandas for these rare dtypes
+        return {"missing": int(series.isna().sum()), "describe": series.describe(percentiles).tolist()}
+
+    if kind == "numerical":
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+        mask = np.isnan(values)
+        if sketch_k is not None:
+            describe, rank_error = _describe_sketched(values[~mask], percentiles, sketch_k)
+            return {"missing": int(mask.sum()), "describe": describe, "rank_error": rank_error}
+        return {"missing": int(mask.sum()), "describe": _describe_values(values[~mask], percentiles)}
+
+    if kind == "categorical" and hll_precision is not None:
+        values = series.dropna()
+        return {
+            "missing": len(series) - len(values),
+            "unique": HyperLogLog(hll_precision).update_hashes(column_hashes(values)),
+        }
+
+    if kind == "categorical" and isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        mask = codes < 0
+        present = np.bincount(codes[~mask], minlength=len(series.cat.categories))
+        return {"missing": int(mask.sum()), "unique": int(np.count_nonzero(present))}
+
+    values = series.to_numpy()
+    mask = pd.isna(values)
+    if kind == "categorical":
+        return {"missing": int(mask.sum()), "unique": len(pd.unique(values[~mask]))}
+    return {"missing": int(mask.sum())}
+
+
+def _row_fingerprints(data, subset=None, n_jobs=None, parallel_backend="threads"):
+    """
+    Hash every row to a 64-bit fingerprint, one column at a time, so the
+    only full-length allocations are the fingerprint array and the hashes
+    of the columns in flight. Columns are combined in order with the same
+    mixing scheme as ``pandas.util.hash_pandas_object``.
+    """
+    columns = list(data.columns) if subset is None else list(subset)
+    fingerprints = np.full(len(data), 0x345678, dtype="uint64")
+    multiplier = np.uint64(1000003)
+    series = ((data[column],) for column in columns)
+    for i, hashes in enumerate(parallel_map(column_hashes, series, n_jobs, parallel_backend)):
+        fingerprints ^= hashes
+        fingerprints *= multiplier
+        multiplier += np.uint64(82520 + 2 * (len(columns) - i))
+    fingerprints += np.uint64(97531)
+    return fingerprints
+
+
+def count_duplicates(data, subset=None, n_jobs=None, parallel_backend="threads"):
+    """
+    Count duplicate rows by hashing each row to a 64-bit fingerprint.
+
+    Unlike ``DataFrame.duplicated``, no hash table over full row tuples is
+    built: rows are hashed column by column into one uint64 array and the
+    repeated fingerprints are counted. Two different rows share a
+    fingerprint with probability 2**-64, so over ``n`` rows the expected
+    number of falsely reported duplicates is about ``n**2 / 2**65``
+    (under 0.03 for a billion rows).
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The dataset to check.
+    subset : list, optional
+        Only consider these columns. Defaults to all columns.
+    n_jobs : int, optional
+        Number of workers hashing columns concurrently, as in
+        `dataset_summary`.
+    parallel_backend : {'threads', 'processes'}, default='threads'
+        Pool type used when `n_jobs` is greater than 1.
+
+    Returns
+    -------
+    int
+        The number of rows that repeat an earlier row, as
+        ``data.duplicated(subset).sum()``.
+
+    Raises
+    ------
+    KeyError
+        If a column in `subset` is not in the DataFrame.
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> from mds_2025_helper_functions.dataset_summary import count_duplicates
+    >>> df = pd.DataFrame({'a': [1, 1, 2], 'b': ['x', 'x', 'y']})
+    >>> count_duplicates(df)
+    1
+    >>> count_duplicates(df, subset=['a'])
+    1
+    """
+    if len(data) == 0 or (subset is None and len(data.columns) == 0):
+        return 0
+    fingerprints = np.sort(_row_fingerprints(data, subset, n_jobs, parallel_backend))
+    return int(np.count_nonzero(fingerprints[1:] == fingerprints[:-1]))
+
+
+class _FingerprintSet:
+    """
+    Set of uint64 fingerprints kept as disjoint sorted runs, each more than
+    twice as long as the next (a log-structured merge). Adding k values
+    probes the O(log n) runs with binary searches and appends the new ones
+    as a run; runs are merged only when a smaller one catches up, so each
+    fingerprint is copied O(log n) times in total and an update costs
+    O(k log n) amortized instead of copying the n fingerprints already seen.
+    """
+
+    def __init__(self, values=None):
+        self.runs = []
+        self.size = 0
+        if values is not None:
+            self.add(values)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, values):
+        """
+        Add `values` and return the sorted array of those not seen before.
+        """
+        new = np.unique(values)
+        for run in self.runs:
+            if new.size == 0:
+                break
+            positions = np.searchsorted(run, new)
+            new = new[run[np.minimum(positions, run.size - 1)] != new]
+        if new.size:
+            self.runs.append(new)
+            self.size += new.size
+            while len(self.runs) > 1 and self.runs[-2].size <= 2 * self.runs[-1].size:
+                last = self.runs.pop()
+                # Two sorted runs: the stable sort (timsort) merges them in linear time
+                self.runs[-1] = np.sort(np.concatenate([self.runs[-1], last]), kind="stable")
+        return new
+
+    def values(self):
+        """
+        Return all fingerprints as one array (unique, not sorted).
+        """
+        return np.concatenate(self.runs) if self.runs else np.empty(0, dtype="uint64")
+
+
+def _merge_moments(a, b):
+    # Chan et al. parallel update of count, mean and sum of squared deviations
+    count_a, mean_a, m2_a, min_a, max_a = a
+    count_b, mean_b, m2_b, min_b, max_b = b
+    count = count_a + count_b
+    if count == 0:
+        return a
+    delta = mean_b - mean_a
+    mean = mean_a + delta * count_b / count
+    m2 = m2_a + m2_b + delta ** 2 * count_a * count_b / count
+    return (count, mean, m2, np.fmin(min_a, min_b), np.fmax(max_a, max_b))
+
+
+_EMPTY_MOMENTS = (0, 0.0, 0.0, np.nan, np.nan)
+
+
+class SummaryState:
+    """
+    Mergeable partial state behind `dataset_summary_stream`.
+
+    The state keeps, per column, the missing count, the count/mean/sum of
+    squared deviations/min/max of numerical columns (merged with the
+    numerically stable parallel update rather than raw sums of squares),
+    a quantile sketch, 64-bit fingerprints of distinct rows, and either
+    fingerprints of distinct categorical values or, with `approx=True`, a
+    fixed-size HyperLogLog sketch per categorical column. Fingerprints are
+    kept as sorted runs merged geometrically, so adding a batch of k rows
+    with `update` costs O(k log n) amortized in the n distinct values seen
+    so far rather than O(n), and states built on different workers can be
+    combined with `merge`.
+
+    Parameters
+    ----------
+    sketch_k : int, default=200
+        Accuracy parameter of the quantile sketches.
+    approx : bool, default=False
+        If True, estimate unique categorical values with HyperLogLog sketches.
+    hll_precision : int, default=14
+        Precision of the HyperLogLog sketches when `approx=True`.
+    duplicate_subset : list, optional
+        Only consider these columns when counting duplicate rows.
+    bloom_capacity : int, optional
+        If given, remember seen rows in a fixed-size `BloomFilter` sized for
+        this many distinct rows instead of keeping every row fingerprint.
+        Duplicates may then be overcounted at about `bloom_error_rate`, and
+        merging two Bloom-filter states estimates the distinct rows from
+        the filled bits.
+    bloom_error_rate : float, default=0.001
+        False positive rate of the Bloom filter at `bloom_capacity` rows.
+
+    Example
+    -------
+    >>> from mds_2025_helper_functions.dataset_summary import SummaryState
+    >>> state = SummaryState()
+    >>> state.update(first_batch)
+    >>> state.update(second_batch)
+    >>> summary = state.result()  # same layout as dataset_summary
+
+    >>> # Combine states built on different workers
+    >>> state = SummaryState().update(part_a).merge(SummaryState().update(part_b))
+    """
+
+    def __init__(self, sketch_k=200, approx=False, hll_precision=14, duplicate_subset=None, bloom_capacity=None,
+                 bloom_error_rate=0.001):
+        self.sketch_k = sketch_k
+        self.approx = approx
+        self.hll_precision = hll_precision
+        self.duplicate_subset = duplicate_subset
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.n_rows = 0
+        self.columns = None
+        self.kinds = {}
+        self.missing = {}
+        self.moments = {}
+        self.quantiles = {}
+        self.distinct = {}
+        self.distinct_rows = 0
+        if bloom_capacity is None:
+            self.rows = _FingerprintSet()
+        else:
+            self.rows = BloomFilter(bloom_capacity, bloom_error_rate)
+
+    def update(self, data):
+        """
+        Add a batch of rows to the state and return ``self``.
+
+        Raises
+        ------
+        TypeError
+            If the batch is not a pandas DataFrame.
+        ValueError
+            If the batch columns differ from the columns already seen, or a
+            numerical column holds non-numerical data.
+        """
+        if not isinstance(data, pd.DataFrame):
+            raise TypeError("Chunks must be pandas DataFrames")
+        return self.merge(self._from_frame(data))
+
+    def _from_frame(self, data):
+        # Batch states always hold exact fingerprints; a Bloom filter only
+        # lives in the accumulating state
+        state = SummaryState(self.sketch_k, self.approx, self.hll_precision, self.duplicate_subset)
+        state.n_rows = len(data)
+        state.columns = list(data.columns)
+        state.kinds = _column_kinds(data)
+        state.missing = data.isnull().sum().to_dict()
+        if state.columns:
+            state.rows = _FingerprintSet(_row_fingerprints(data, self.duplicate_subset))
+            state.distinct_rows = len(state.rows)
+        for column, kind in state.kinds.items():
+            if kind == "numerical":
+                values = data[column].to_numpy(dtype="float64", na_value=np.nan)
+                values = values[~np.isnan(values)]
+                count = values.size
+                if count:
+                    mean = values.mean()
+                    state.moments[column] = (count, mean, ((values - mean) ** 2).sum(), values.min(), values.max())
+                else:
+                    state.moments[column] = _EMPTY_MOMENTS
+                state.quantiles[column] = KLLSketch(k=self.sketch_k, seed=_SKETCH_SEED).update(values)
+            elif kind == "categorical":
+                hashes = column_hashes(data[column].dropna())
+                if self.approx:
+                    state.distinct[column] = HyperLogLog(self.hll_precision).update_hashes(hashes)
+                else:
+                    state.distinct[column] = _FingerprintSet(hashes)
+        return state
+
+    def merge(self, other):
+        """
+        Fold another state into this one and return ``self``. `other` is
+        left unchanged.
+
+        Raises
+        ------
+        ValueError
+            If the two states were built from different columns, or a column
+            is numerical in one state and non-numerical in the other.
+        """
+        if other.approx != self.approx:
+            raise ValueError("Cannot merge exact and approximate summary states")
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.columns = list(other.columns)
+            self.kinds = {column: other.kinds[column] for column in other.columns}
+            self.missing = {column: 0 for column in other.columns}
+        elif self.columns != other.columns:
+            raise ValueError("All chunks must have the same columns")
+
+        for column in self.columns:
+            self._merge_kind(column, other)
+            self.missing[column] += other.missing[column]
+
+        for column, kind in self.kinds.items():
+            if kind == "numerical":
+                self.moments[column] = _merge_moments(
+                    self.moments.get(column, _EMPTY_MOMENTS), other.moments.get(column, _EMPTY_MOMENTS)
+                )
+                sketch = self.quantiles.get(column)
+                if sketch is None:
+                    sketch = self.quantiles[column] = KLLSketch(k=self.sketch_k, seed=_SKETCH_SEED)
+                if column in other.quantiles:
+                    sketch.merge(other.quantiles[column])
+            elif kind == "categorical" and self.approx:
+                sketch = self.distinct.get(column)
+                if sketch is None:
+                    sketch = self.distinct[column] = HyperLogLog(self.hll_precision)
+                if column in other.distinct:
+                    sketch.merge(other.distinct[column])
+            elif kind == "categorical":
+                distinct = self.distinct.get(column)
+                if distinct is None:
+                    distinct = self.distinct[column] = _FingerprintSet()
+                if column in other.distinct:
+                    distinct.add(other.distinct[column].values())
+
+        self._merge_rows(other)
+        self.n_rows += other.n_rows
+        return self
+
+    def _merge_rows(self, other):
+        if isinstance(other.rows, BloomFilter):
+            if not isinstance(self.rows, BloomFilter):
+                raise ValueError("Cannot merge a Bloom-filter state into an exact state")
+            self.rows.merge(other.rows)
+            if self.n_rows == 0:
+                self.distinct_rows = other.distinct_rows
+            else:
+                self.distinct_rows = min(int(round(self.rows.count())), self.n_rows + other.n_rows)
+        elif isinstance(self.rows, BloomFilter):
+            rows = other.rows.values()
+            new = rows[~self.rows.contains_hashes(rows)] if len(rows) else rows
+            self.rows.add_hashes(new)
+            self.distinct_rows += len(new)
+        else:
+            self.rows.add(other.rows.values())
+            self.distinct_rows = len(self.rows)
+
+    def _merge_kind(self, column, other):
+        kind, other_kind = self.kinds[column], other.kinds[column]
+        # A column with no values so far carries no type information
+        self_empty = self.missing[column] == self.n_rows
+        other_empty = other.missing[column] == other.n_rows
+        if kind == other_kind or other_empty:
+            return
+        if self_empty:
+            self.kinds[column] = other_kind
+            self.moments.pop(column, None)
+            self.quantiles.pop(column, None)
+            self.distinct.pop(column, None)
+            return
+        if "numerical" in (kind, other_kind):
+            raise ValueError(f"Column '{column}' is numerical in one chunk and non-numerical in another")
+
+    def result(self, percentiles=None):
+        """
+        Build the `dataset_summary` result dictionary from the current state,
+        with the given `percentiles` (the quartiles by default) read from the
+        quantile sketches.
+        """
+        percentiles = _validate_percentiles(percentiles)
+        if self.n_rows == 0 or not self.columns:
+            return _empty_summary()
+
+        missing_values = pd.DataFrame({
+            "column": self.columns,
+            "missing_count": [self.missing[c] for c in self.columns],
+        })
+        missing_values["missing_percentage"] = (missing_values["missing_count"] / self.n_rows) * 100
+
+        numerical_columns = [c for c in self.columns if self.kinds[c] == "numerical"]
+        categorical_columns = [c for c in self.columns if self.kinds[c] == "categorical"]
+        feature_types = {
+            "numerical_features": len(numerical_columns),
+            "categorical_features": len(self.columns) - len(numerical_columns),
+        }
+
+        duplicates = self.n_rows - self.distinct_rows
+
+        if numerical_columns:
+            rows = []
+            for column in numerical_columns:
+                count, mean, m2, vmin, vmax = self.moments[column]
+                std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+                quantiles = self.quantiles[column].quantile(percentiles)
+                rows.append([count, mean if count else np.nan, std, vmin, *quantiles, vmax])
+            numerical_summary = pd.DataFrame(
+                rows,
+                index=numerical_columns,
+                columns=_describe_columns(percentiles),
+                dtype="float64",
+            )
+            numerical_summary.attrs["quantile_rank_error"] = max(
+                self.quantiles[column].normalized_rank_error for column in numerical_columns
+            )
+        else:
+            numerical_summary = pd.DataFrame()
+
+        categorical_summary = _categorical_summary({c: self.distinct[c] for c in categorical_columns})
+
+        return {
+            "missing_values": missing_values,
+            "feature_types": feature_types,
+            "duplicates": duplicates,
+            "numerical_summary": numerical_summary,
+            "categorical_summary": categorical_summary
+        }
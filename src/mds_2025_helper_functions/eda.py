@@ -1,9 +1,317 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-def perform_eda(dataframe, rows=5, cols=2):
+from mds_2025_helper_functions._parallel import resolve_n_jobs
+from mds_2025_helper_functions.cache import resolve_cache
+
+FIGURE_FORMATS = ("png", "svg")
+# Frames with more numeric columns than this get a blocked correlation matrix
+CORRELATION_BLOCK_SIZE = 256
+# Approximate number of cells converted to a missingness mask at a time
+MISSING_CHUNK_CELLS = 2 ** 22
+# Default cut-offs: IQR multiplier, |z-score| and |modified z-score|
+OUTLIER_THRESHOLDS = {"iqr": 1.5, "zscore": 3.0, "mad": 3.5}
+
+
+@dataclass(repr=False)
+class EDAResult:
+    """
+    Everything `perform_eda` reports, computed once by `compute_eda`.
+
+    Attributes:
+        info (str): The output of ``DataFrame.info()``.
+        statistics (pd.DataFrame): ``describe(include='all')``, one row per column.
+        missing_values (pd.Series): Number of missing values per column.
+        correlation (pd.DataFrame or None): Correlation matrix of the numeric
+            columns, or None if there are fewer than two.
+        value_counts (dict): Column name to ``value_counts()`` for every column
+            drawn as a count or time series plot (non int64/float64 columns).
+        outliers (dict): Column name to the number of outliers found by
+            `detect_outliers`, for every numeric column.
+        numeric_columns (list): Names of the numeric columns.
+        missing_blocks (pd.DataFrame or None): Fraction of missing values per
+            block of consecutive rows (index: first row position of the
+            block) and column, or None if nothing is missing.
+        co_missing (pd.DataFrame or None): Number of rows in which both
+            columns are missing, for the columns with missing values, or None
+            if nothing is missing.
+        figures (dict): Figure name to file path, filled in when
+            `perform_eda` writes the figures to an output directory.
+    """
+    info: str
+    statistics: pd.DataFrame
+    missing_values: pd.Series
+    correlation: pd.DataFrame
+    value_counts: dict
+    outliers: dict
+    numeric_columns: list
+    missing_blocks: pd.DataFrame = None
+    co_missing: pd.DataFrame = None
+    figures: dict = field(default_factory=dict)
+
+    def __repr__(self):
+        # Kept to one line so that a notebook cell ending in perform_eda(...)
+        # does not echo every table after the plots
+        return (
+            f"EDAResult(columns={len(self.missing_values)}, numeric_columns={len(self.numeric_columns)}, "
+            f"missing_values={int(self.missing_values.sum())}, outliers={sum(self.outliers.values())}, "
+            f"figures={len(self.figures)})"
+        )
+
+
+def _is_histogram_column(series):
+    return series.dtype in [np.float64, np.int64]
+
+
+def _eda_statistics(dataframe, missing_resolution=200, outlier_method="iqr"):
+    buffer = io.StringIO()
+    dataframe.info(buf=buffer)
+    numeric_cols = dataframe.select_dtypes(include=[np.number]).columns
+    outliers = detect_outliers(dataframe, method=outlier_method)
+    missing_values, missing_blocks, co_missing = _missingness(dataframe, missing_resolution)
+
+    return EDAResult(
+        info=buffer.getvalue(),
+        statistics=dataframe.describe(include='all').transpose(),
+        missing_values=missing_values,
+        correlation=_correlation(dataframe[numeric_cols]) if len(numeric_cols) > 1 else None,
+        value_counts={
+            col: dataframe[col].value_counts() for col in dataframe.columns
+            if not _is_histogram_column(dataframe[col])
+        },
+        outliers=outliers,
+        numeric_columns=list(numeric_cols),
+        missing_blocks=missing_blocks,
+        co_missing=co_missing,
+    )
+
+
+def detect_outliers(dataframe, method="iqr", threshold=None, return_indices=False):
+    """
+    Count outliers in every numeric column at once.
+
+    The location and scale of all columns come from single vectorized calls
+    (one ``quantile([0.25, 0.75])`` for the IQR method), and outliers are
+    counted with column-wise boolean reductions, without copying rows.
+    Missing values are never outliers.
+
+    Parameters:
+        dataframe (pd.DataFrame): The input dataset; non-numeric columns are ignored.
+        method (str): 'iqr' flags values more than `threshold` IQRs outside
+            the quartiles; 'zscore' flags values whose distance from the mean
+            exceeds `threshold` standard deviations; 'mad' flags values whose
+            modified z-score ``0.6745 * (x - median) / MAD`` exceeds
+            `threshold` in absolute value. Columns with zero spread have no
+            outliers under 'zscore' and 'mad'.
+        threshold (float, optional): Cut-off for the method; defaults to 1.5,
+            3 and 3.5 respectively.
+        return_indices (bool): Also return the index labels of the outlying
+            rows of each column.
+
+    Returns:
+        dict: Column name to number of outliers. With `return_indices`, a
+            tuple of that dict and a dict of column name to pd.Index of rows.
+
+    Example:
+        >>> import pandas as pd
+        >>> from mds_2025_helper_functions.eda import detect_outliers
+        >>> df = pd.DataFrame({'a': [1, 2, 3, 4, 100], 'b': [5, 6, 7, 8, 9]})
+        >>> detect_outliers(df)
+        {'a': 1, 'b': 0}
+        >>> detect_outliers(df, method="mad", return_indices=True)
+        ({'a': 1, 'b': 0}, {'a': Index([4], dtype='int64'), 'b': Index([], dtype='int64')})
+    """
+    if not isinstance(dataframe, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame.")
+    if method not in OUTLIER_THRESHOLDS:
+        raise ValueError(f"method must be one of {tuple(OUTLIER_THRESHOLDS)}")
+    if threshold is None:
+        threshold = OUTLIER_THRESHOLDS[method]
+
+    numeric = dataframe.select_dtypes(include=[np.number])
+    if method == "iqr":
+        quartiles = numeric.quantile([0.25, 0.75])
+        iqr = quartiles.loc[0.75] - quartiles.loc[0.25]
+        flags = numeric.lt(quartiles.loc[0.25] - threshold * iqr) | numeric.gt(quartiles.loc[0.75] + threshold * iqr)
+    else:
+        if method == "zscore":
+            center, scale = numeric.mean(), numeric.std()
+        else:
+            center = numeric.median()
+            scale = numeric.sub(center).abs().median() / 0.6745
+        scale = scale.where(scale > 0)
+        flags = numeric.sub(center).abs().gt(threshold * scale)
+
+    counts = {col: int(count) for col, count in flags.sum().items()}
+    if not return_indices:
+        return counts
+    return counts, {col: dataframe.index[flags[col].to_numpy(dtype=bool, na_value=False)] for col in flags.columns}
+
+
+def _row_chunks(dataframe, positions, chunk_rows):
+    for start in range(0, len(dataframe), chunk_rows):
+        yield start, dataframe.iloc[start:start + chunk_rows].iloc[:, positions].isnull().to_numpy()
+
+
+def _missingness(dataframe, resolution):
+    """
+    Count missing values per column, and for the columns with any, the
+    missing fraction per block of rows (at most `resolution` blocks) and
+    the co-missingness counts. Rows are converted to a boolean mask at most
+    `MISSING_CHUNK_CELLS` cells at a time, whatever the block size, so
+    memory does not grow with the row count.
+    """
+    n_rows, n_columns = dataframe.shape
+    block_size = max(1, -(-n_rows // resolution))
+    chunk_rows = max(1, MISSING_CHUNK_CELLS // max(n_columns, 1))
+
+    counts = np.zeros(n_columns, dtype="int64")
+    for _, mask in _row_chunks(dataframe, np.arange(n_columns), chunk_rows):
+        counts += mask.sum(axis=0)
+    missing_values = pd.Series(counts, index=dataframe.columns)
+    if not counts.any():
+        return missing_values, None, None
+
+    positions = np.flatnonzero(counts)
+    missing_columns = dataframe.columns[positions]
+    starts = np.arange(0, n_rows, block_size)
+    block_counts = np.zeros((len(starts), len(positions)), dtype="int64")
+    co_missing = np.zeros((len(positions), len(positions)), dtype="int64")
+    for start, mask in _row_chunks(dataframe, positions, chunk_rows):
+        # Chunks need not line up with blocks: sum each chunk per block and
+        # add the partial sums, so a block may span several chunks
+        first, last = start // block_size, (start + len(mask) - 1) // block_size
+        bounds = np.maximum(starts[first:last + 1] - start, 0)
+        block_counts[first:last + 1] += np.add.reduceat(mask, bounds, axis=0)
+        # float32 products are exact for counts below 2**24, and a chunk has
+        # at most MISSING_CHUNK_CELLS rows
+        mask = mask.astype("float32")
+        co_missing += np.rint(mask.T @ mask).astype("int64")
+
+    block_rows = np.diff(np.append(starts, n_rows))
+    missing_blocks = np.zeros((len(starts), n_columns))
+    missing_blocks[:, positions] = block_counts / block_rows[:, None]
+    missing_blocks = pd.DataFrame(missing_blocks, index=starts, columns=dataframe.columns)
+    co_missing = pd.DataFrame(co_missing, index=missing_columns, columns=missing_columns)
+    return missing_values, missing_blocks, co_missing
+
+
+def _correlation(numeric):
+    """
+    Pearson correlation matrix with pairwise-complete observations, like
+    ``DataFrame.corr()``. Frames wider than `CORRELATION_BLOCK_SIZE` are
+    computed from matrix products over blocks of columns, so each step
+    touches a bounded slice of the moment matrices.
+    """
+    if numeric.shape[1] <= CORRELATION_BLOCK_SIZE:
+        return numeric.corr()
+
+    values = numeric.to_numpy(dtype="float64", na_value=np.nan)
+    present = ~np.isnan(values)
+    # Centre each column first to keep the raw moment sums well conditioned
+    with np.errstate(invalid="ignore"):
+        means = np.where(present, values, 0.0).sum(axis=0) / present.sum(axis=0)
+    values = np.where(present, values - means, 0.0)
+    present = present.astype("float64")
+    squares = values ** 2
+
+    n_columns = values.shape[1]
+    correlation = np.empty((n_columns, n_columns))
+    for start in range(0, n_columns, CORRELATION_BLOCK_SIZE):
+        block = slice(start, start + CORRELATION_BLOCK_SIZE)
+        # Sums over the rows where both the block column and the other column are present
+        n = present[:, block].T @ present
+        sum_x = values[:, block].T @ present
+        sum_y = present[:, block].T @ values
+        sum_xy = values[:, block].T @ values
+        sum_xx = squares[:, block].T @ present
+        sum_yy = present[:, block].T @ squares
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = n * sum_xy - sum_x * sum_y
+            variance = (n * sum_xx - sum_x ** 2) * (n * sum_yy - sum_y ** 2)
+            block_correlation = covariance / np.sqrt(variance)
+        block_correlation[(n < 2) | ~(variance > 0)] = np.nan
+        correlation[block] = np.clip(block_correlation, -1, 1)
+    np.fill_diagonal(correlation, np.where(np.isnan(np.diag(correlation)), np.nan, 1.0))
+    return pd.DataFrame(correlation, index=numeric.columns, columns=numeric.columns)
+
+
+def _check_max_scatter_pairs(max_scatter_pairs):
+    if max_scatter_pairs is not None and max_scatter_pairs < 1:
+        raise ValueError("max_scatter_pairs must be at least 1, or None to draw every pair.")
+
+
+def _top_correlated_pairs(correlation, k):
+    """
+    Return up to `k` column pairs, strongest absolute correlation first
+    (pairs with an undefined correlation last). With k=None, or no more
+    pairs than k, every pair is returned in column order.
+    """
+    columns = list(correlation.columns)
+    first, second = np.triu_indices(len(columns), 1)
+    if k is None or len(first) <= k:
+        return [(columns[i], columns[j]) for i, j in zip(first, second)]
+    strength = np.nan_to_num(np.abs(correlation.to_numpy()[first, second]), nan=-1.0)
+    top = np.argpartition(-strength, k - 1)[:k]
+    top = top[np.argsort(-strength[top], kind="stable")]
+    return [(columns[first[i]], columns[second[i]]) for i in top]
+
+
+def compute_eda(dataframe, cache=None, missing_resolution=200, outlier_method="iqr"):
+    """
+    Compute the statistics reported by `perform_eda` without printing or plotting.
+
+    Use this in batch jobs that only need the numbers; matplotlib and seaborn
+    are not imported. Pass the result to `render_eda` to display it.
+
+    Parameters:
+        dataframe (pd.DataFrame): The input dataset for EDA.
+        cache (bool or ResultCache, optional): Reuse the result for unchanged
+            data. True uses the shared
+            `mds_2025_helper_functions.cache.default_cache`.
+        missing_resolution (int): Maximum number of row blocks in the
+            missingness map; each block reports the fraction of missing
+            values in its rows.
+        outlier_method (str): 'iqr', 'zscore' or 'mad'; see `detect_outliers`.
+
+    Returns:
+        EDAResult: The info output, statistics, missing value counts and
+            missingness map, correlation matrix, value counts and outlier
+            counts.
+
+    Example:
+        >>> from mds_2025_helper_functions.eda import compute_eda
+        >>> result = compute_eda(df)
+        >>> result.outliers
+        {'Age': 0, 'Salary': 0, 'Bonus': 0}
+    """
+    if not isinstance(dataframe, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame.")
+
+    if missing_resolution < 1:
+        raise ValueError("missing_resolution must be at least 1.")
+
+    result_cache = resolve_cache(cache)
+    if result_cache is None:
+        return _eda_statistics(dataframe, missing_resolution, outlier_method)
+    key = result_cache.make_key(
+        "compute_eda", dataframe, missing_resolution=missing_resolution, outlier_method=outlier_method
+    )
+    result = result_cache.get(key)
+    if result is None:
+        result = _eda_statistics(dataframe, missing_resolution, outlier_method)
+        result_cache.set(key, result)
+    return result
+
+
+def perform_eda(dataframe, rows=5, cols=2, cache=None, plots=True, output_dir=None, fig_format="png", n_jobs=None,
+                scatter_threshold=100_000, scatter_bins=100, max_scatter_pairs=30, missing_resolution=200,
+                outlier_method="iqr", max_categories=20):
     """
     A universal EDA function to generate data summaries and visualize features.
 
@@ -11,9 +319,39 @@ def perform_eda(dataframe, rows=5, cols=2):
         dataframe (pd.DataFrame): The input dataset for EDA.
         rows (int): Number of rows in the grid layout for visualizations.
         cols (int): Number of columns in the grid layout for visualizations.
+        cache (bool or ResultCache, optional): Reuse the computed statistics for
+            unchanged data. True uses the shared
+            `mds_2025_helper_functions.cache.default_cache`. Plots are always drawn
+            from the current data.
+        plots (bool): If False, only print the text reports; matplotlib is
+            not used at all.
+        output_dir (str or os.PathLike, optional): Write the figures to this
+            directory with `save_eda_figures` instead of showing them, for
+            headless batch jobs.
+        fig_format (str): 'png' or 'svg', when `output_dir` is given.
+        n_jobs (int, optional): Number of processes rendering figures when
+            `output_dir` is given. None or 1 renders in this process, -1 uses
+            all cores.
+        scatter_threshold (int or None): Above this many rows, numeric pairs
+            are drawn as binned 2D densities (counts per bin on a log color
+            scale) instead of one marker per row, so rendering time no longer
+            grows with the row count. None always draws every point.
+        scatter_bins (int): Number of bins along each axis of the densities.
+        max_scatter_pairs (int or None): Draw at most this many numeric pairs
+            (at least 1), choosing those with the largest absolute
+            correlation, so wide frames do not build one subplot per pair.
+            None draws every pair.
+        missing_resolution (int): Maximum number of row blocks in the missing
+            values heatmap, which shows the fraction missing per block.
+        outlier_method (str): 'iqr', 'zscore' or 'mad'; see `detect_outliers`.
+        max_categories (int or None): Count plots show the most frequent
+            categories up to this number plus one 'Other' bar for the rest,
+            so high-cardinality columns stay readable. None draws every
+            category.
 
     Returns:
-        None
+        EDAResult: The computed statistics (see `compute_eda`). With
+            `output_dir`, `figures` maps each figure name to its file path.
 
     Example:
         >>> import pandas as pd
@@ -42,42 +380,243 @@ def perform_eda(dataframe, rows=5, cols=2):
         # Note: Visualizations will be shown as matplotlib and seaborn plots.
     """
 
-    if not isinstance(dataframe, pd.DataFrame):
-        raise TypeError("Input must be a pandas DataFrame.")
+    _check_max_scatter_pairs(max_scatter_pairs)
+    result = compute_eda(
+        dataframe, cache=cache, missing_resolution=missing_resolution, outlier_method=outlier_method
+    )
+    render_eda(
+        dataframe, result, rows=rows, cols=cols, plots=plots and output_dir is None,
+        scatter_threshold=scatter_threshold, scatter_bins=scatter_bins, max_scatter_pairs=max_scatter_pairs,
+        max_categories=max_categories,
+    )
+    if plots and output_dir is not None:
+        result.figures = save_eda_figures(
+            dataframe, result, output_dir, rows=rows, cols=cols, fig_format=fig_format, n_jobs=n_jobs,
+            scatter_threshold=scatter_threshold, scatter_bins=scatter_bins, max_scatter_pairs=max_scatter_pairs,
+            max_categories=max_categories,
+        )
+    return result
 
+
+def render_eda(dataframe, result, rows=5, cols=2, plots=True, scatter_threshold=100_000, scatter_bins=100,
+               max_scatter_pairs=30, max_categories=20):
+    """
+    Print and plot an `EDAResult` computed by `compute_eda`.
+
+    No statistic is recomputed; `dataframe` is only needed for the plots of
+    the raw values (missing value heatmap, histograms and scatterplots).
+
+    Parameters:
+        dataframe (pd.DataFrame): The dataset `result` was computed from.
+        result (EDAResult): The output of `compute_eda`.
+        rows (int): Number of rows in the grid layout for visualizations.
+        cols (int): Number of columns in the grid layout for visualizations.
+        plots (bool): If False, only print the text reports.
+        scatter_threshold (int or None): Row count above which numeric pairs are
+            drawn as binned 2D densities, as in `perform_eda`.
+        scatter_bins (int): Number of bins along each axis of the densities.
+        max_scatter_pairs (int or None): Maximum number of numeric pairs drawn,
+            as in `perform_eda`.
+        max_categories (int or None): Maximum number of bars per count plot
+            before the rest are grouped as 'Other', as in `perform_eda`.
+
+    Returns:
+        None
+
+    Example:
+        >>> from mds_2025_helper_functions.eda import compute_eda, render_eda
+        >>> result = compute_eda(df)
+        >>> render_eda(df, result, rows=2, cols=2)
+    """
+    _check_max_scatter_pairs(max_scatter_pairs)
     print("===== Dataset Overview =====")
-    print(dataframe.info())
+    print(result.info, end="")
 
     print("\n===== Basic Statistics =====")
-    print(dataframe.describe(include='all').transpose())
+    print(result.statistics)
 
     # Missing value report
     print("\n===== Missing Values Report =====")
-    missing_values = dataframe.isnull().sum()
+    missing_values = result.missing_values
     print(missing_values[missing_values > 0])
 
+    if plots:
+        import matplotlib.pyplot as plt
+
     # Plot missing value heatmap (if missing values exist)
-    if dataframe.isnull().values.any():
-        plt.figure(figsize=(10, 6))
-        sns.heatmap(dataframe.isnull(), cbar=False, cmap="viridis")
-        plt.title("Missing Values Heatmap")
-        plt.show()
+    if missing_values.any():
+        if plots:
+            _plot_missing_values(result.missing_blocks, result.co_missing)
+            plt.show()
     else:
         print("No missing values in the dataset.")
 
     # Correlation heatmap for numeric features
-    numeric_cols = dataframe.select_dtypes(include=[np.number]).columns
-    if len(numeric_cols) > 1:
-        plt.figure(figsize=(12, 10))
-        mask = np.triu(np.ones_like(dataframe[numeric_cols].corr(), dtype=bool))
-        sns.heatmap(dataframe[numeric_cols].corr(), mask=mask, annot=True, fmt=".2f", cmap="coolwarm", square=True)
-        plt.title("Correlation Heatmap")
-        plt.show()
+    if result.correlation is not None:
+        if plots:
+            _plot_correlation(result.correlation)
+            plt.show()
     else:
         print("Not enough numeric columns for correlation heatmap.")
 
     # Dynamic Grid Plot for All Features
     print("\n===== Feature Visualizations =====")
+    if plots:
+        _plot_features(dataframe, result.value_counts, rows, cols, max_categories)
+        plt.show()
+
+    # Scatterplots for Numeric Feature Pairs
+    print("\n===== Scatterplots for Numeric Features =====")
+    if len(result.numeric_columns) > 1:
+        if plots:
+            pairs = _top_correlated_pairs(result.correlation, max_scatter_pairs)
+            _plot_scatter_pairs(dataframe, pairs, cols, scatter_threshold, scatter_bins)
+            plt.show()
+    else:
+        print("Not enough numeric columns for scatterplots.")
+
+    # Outliers Detection Report
+    print("\n===== Outliers Report =====")
+    for col, count in result.outliers.items():
+        print(f"{col}: {count} potential outliers")
+
+
+def save_eda_figures(dataframe, result, output_dir, rows=5, cols=2, fig_format="png", n_jobs=None,
+                     scatter_threshold=100_000, scatter_bins=100, max_scatter_pairs=30, max_categories=20):
+    """
+    Render the figures of an `EDAResult` to files without displaying them.
+
+    With `n_jobs` above 1, figures are drawn in a pool of worker processes
+    (one figure per task) that use the non-interactive Agg backend. Otherwise
+    they are drawn in this process with its current matplotlib backend, with
+    interactive mode off so that no window is shown. Each figure is closed
+    as soon as it is saved, so repeated calls over many tables do not
+    accumulate open figures.
+
+    Parameters:
+        dataframe (pd.DataFrame): The dataset `result` was computed from.
+        result (EDAResult): The output of `compute_eda`.
+        output_dir (str or os.PathLike): Directory for the figure files; it is
+            created if needed and existing files with the same names are
+            overwritten.
+        rows (int): Number of rows in the grid layout for visualizations.
+        cols (int): Number of columns in the grid layout for visualizations.
+        fig_format (str): 'png' or 'svg'.
+        n_jobs (int, optional): Number of worker processes. None or 1 renders
+            in this process, -1 uses all cores.
+        scatter_threshold (int or None): Row count above which numeric pairs are
+            drawn as binned 2D densities, as in `perform_eda`.
+        scatter_bins (int): Number of bins along each axis of the densities.
+        max_scatter_pairs (int or None): Maximum number of numeric pairs drawn,
+            as in `perform_eda`.
+        max_categories (int or None): Maximum number of bars per count plot
+            before the rest are grouped as 'Other', as in `perform_eda`.
+
+    Returns:
+        dict: Figure name ('missing_values', 'correlation', 'features',
+            'scatter') to file path, for the figures that apply to the data.
+
+    Example:
+        >>> from mds_2025_helper_functions.eda import compute_eda, save_eda_figures
+        >>> result = compute_eda(df)
+        >>> save_eda_figures(df, result, "reports/sales", n_jobs=4)
+        {'correlation': 'reports/sales/correlation.png', 'features': 'reports/sales/features.png', ...}
+    """
+    if fig_format not in FIGURE_FORMATS:
+        raise ValueError(f"fig_format must be one of {FIGURE_FORMATS}")
+    _check_max_scatter_pairs(max_scatter_pairs)
+    output_dir = os.fspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Ship each task only the columns its figure needs
+    tasks = []
+    if result.missing_values.any():
+        tasks.append(("missing_values", _plot_missing_values, (result.missing_blocks, result.co_missing)))
+    if result.correlation is not None:
+        tasks.append(("correlation", _plot_correlation, (result.correlation,)))
+    tasks.append(("features", _plot_features, (dataframe, result.value_counts, rows, cols, max_categories)))
+    if len(result.numeric_columns) > 1:
+        pairs = _top_correlated_pairs(result.correlation, max_scatter_pairs)
+        numeric = dataframe[list(dict.fromkeys(col for pair in pairs for col in pair))]
+        tasks.append(("scatter", _plot_scatter_pairs, (numeric, pairs, cols, scatter_threshold, scatter_bins)))
+    tasks = [
+        (plot, args, os.path.join(output_dir, f"{name}.{fig_format}")) for name, plot, args in tasks
+    ]
+
+    n_jobs = min(resolve_n_jobs(n_jobs), len(tasks))
+    if n_jobs == 1:
+        paths = [_save_figure(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_use_headless_backend) as executor:
+            paths = list(executor.map(_save_figure, *zip(*tasks)))
+    return {os.path.splitext(os.path.basename(path))[0]: path for path in paths}
+
+
+def _use_headless_backend():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _save_figure(plot, args, path):
+    import matplotlib.pyplot as plt
+
+    # Never pop up a window, whatever backend the calling process uses
+    with plt.ioff():
+        fig = plot(*args)
+        try:
+            fig.savefig(path)
+        finally:
+            plt.close(fig)
+    return path
+
+
+def _plot_missing_values(missing_blocks, co_missing):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    fig, (blocks_ax, co_ax) = plt.subplots(
+        1, 2, figsize=(18, 6), gridspec_kw={"width_ratios": [3, 2]}, tight_layout=True
+    )
+    sns.heatmap(
+        missing_blocks, vmin=0, vmax=1, cmap="viridis", ax=blocks_ax, cbar_kws={"label": "Fraction missing"}
+    )
+    blocks_ax.set_title("Missing Values Heatmap")
+    blocks_ax.set_ylabel("First row of block")
+    sns.heatmap(co_missing, annot=len(co_missing) <= 15, fmt="d", cmap="viridis", square=True, ax=co_ax)
+    co_ax.set_title("Co-missingness (rows missing both)")
+    return fig
+
+
+def _plot_correlation(correlation):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    fig = plt.figure(figsize=(12, 10))
+    mask = np.triu(np.ones_like(correlation, dtype=bool))
+    sns.heatmap(correlation, mask=mask, annot=True, fmt=".2f", cmap="coolwarm", square=True)
+    plt.title("Correlation Heatmap")
+    return fig
+
+
+def _top_categories(counts, max_categories):
+    """
+    Keep the `max_categories` most frequent categories of a ``value_counts``
+    result and add their remainder as a single 'Other' entry.
+
+    The index keeps the original category values, so ``1`` and ``"1"``
+    stay separate entries; only the tick labels are converted to strings.
+    """
+    if max_categories is None or len(counts) <= max_categories:
+        return counts
+    top = counts.iloc[:max_categories]
+    other = pd.Series([counts.iloc[max_categories:].sum()], index=[f"Other ({len(counts) - max_categories})"])
+    return pd.concat([top, other])
+
+
+def _plot_features(dataframe, value_counts, rows, cols, max_categories=20):
+    import matplotlib.pyplot as plt
+
     total_features = len(dataframe.columns)
     total_plots = rows * cols
 
@@ -85,66 +624,160 @@ def perform_eda(dataframe, rows=5, cols=2):
     axes = axes.ravel()
 
     for i, feature in enumerate(dataframe.columns):
-        if dataframe[feature].dtype in [np.float64, np.int64]:  # Numeric columns
-            sns.histplot(dataframe[feature], kde=True, bins=20, ax=axes[i])
-            axes[i].set_title(f"Distribution of {feature}")
-            axes[i].set_xlabel(feature)
-            axes[i].set_ylabel("Frequency")
-        elif pd.api.types.is_datetime64_any_dtype(dataframe[feature]):  # Datetime columns
-            dataframe[feature].value_counts().sort_index().plot(kind="line", marker="o", ax=axes[i])
-            axes[i].set_title(f"Time Series of {feature}")
-            axes[i].set_xlabel(feature)
-            axes[i].set_ylabel("Count")
-        else:
-            sns.countplot(
-                x=dataframe[feature],
-                ax=axes[i],
-                order=dataframe[feature].value_counts().index,
-                palette="viridis",
-                hue=None,
-                legend=False
-            )
-            axes[i].tick_params(axis='x', rotation=45)
-            axes[i].set_title(f"Count Plot for {feature}")
-            axes[i].set_xlabel(feature)
-            axes[i].set_ylabel("Count")
+        _plot_feature(axes[i], dataframe[feature], value_counts.get(feature), max_categories)
 
     for j in range(total_features, total_plots):
         fig.delaxes(axes[j])
+    return fig
 
-    plt.show()
 
-    # Scatterplots for Numeric Feature Pairs
-    print("\n===== Scatterplots for Numeric Features =====")
-    if len(numeric_cols) > 1:
-        num_pairs = len(numeric_cols) * (len(numeric_cols) - 1) // 2  # Total number of unique pairs
-        rows_scatter = (num_pairs // cols) + (1 if num_pairs % cols != 0 else 0)  # Dynamic row count
-        fig, axes = plt.subplots(rows_scatter, cols, figsize=(cols * 6, rows_scatter * 4), tight_layout=True)
-        axes = axes.ravel()
-
-        pair_idx = 0
-        for i, col1 in enumerate(numeric_cols):
-            for col2 in numeric_cols[i + 1:]:
-                if pair_idx >= len(axes):
-                    break
-                sns.scatterplot(x=dataframe[col1], y=dataframe[col2], ax=axes[pair_idx], alpha=0.7)
-                axes[pair_idx].set_title(f"{col1} vs {col2}")
-                axes[pair_idx].set_xlabel(col1)
-                axes[pair_idx].set_ylabel(col2)
-                pair_idx += 1
-
-        for j in range(pair_idx, len(axes)):
-            fig.delaxes(axes[j])
+def _plot_feature(ax, series, counts, max_categories=20):
+    """
+    Draw one column on `ax`: a histogram with a KDE for int64/float64
+    columns, or a time series / count plot from its precomputed
+    ``value_counts`` otherwise.
+    """
+    import seaborn as sns
 
-        plt.show()
+    feature = series.name
+    if _is_histogram_column(series):  # Numeric columns
+        sns.histplot(series, bins=20, color="C0", ax=ax)
+        kde = _binned_kde(series.to_numpy(dtype="float64", na_value=np.nan))
+        if kde is not None:
+            # Scale the density to the histogram's counts, as histplot(kde=True) does
+            grid, density, n = kde
+            ax.plot(grid, density * n * (grid[-1] - grid[0]) / 20, color="C0")
+        ax.set_title(f"Distribution of {feature}")
+        ax.set_xlabel(feature)
+        ax.set_ylabel("Frequency")
+    elif pd.api.types.is_datetime64_any_dtype(series):  # Datetime columns
+        counts.sort_index().plot(kind="line", marker="o", ax=ax)
+        ax.set_title(f"Time Series of {feature}")
+        ax.set_xlabel(feature)
+        ax.set_ylabel("Count")
     else:
-        print("Not enough numeric columns for scatterplots.")
+        # Bars come from the precomputed counts; nothing is recounted here
+        counts = _top_categories(counts, max_categories)
+        # Bars are placed by position so distinct values with the same text get their own bar
+        positions = np.arange(len(counts))
+        sns.barplot(
+            x=positions,
+            y=counts.to_numpy(),
+            ax=ax,
+            hue=positions,
+            palette="viridis",
+            legend=False
+        )
+        ax.set_xticks(positions, labels=[str(label) for label in counts.index])
+        ax.tick_params(axis='x', rotation=45)
+        ax.set_title(f"Count Plot for {feature}")
+        ax.set_xlabel(feature)
+        ax.set_ylabel("Count")
 
-    # Outliers Detection Report
-    print("\n===== Outliers Report =====")
-    for col in numeric_cols:
-        Q1 = dataframe[col].quantile(0.25)
-        Q3 = dataframe[col].quantile(0.75)
-        IQR = Q3 - Q1
-        outliers = dataframe[(dataframe[col] < Q1 - 1.5 * IQR) | (dataframe[col] > Q3 + 1.5 * IQR)]
-        print(f"{col}: {len(outliers)} potential outliers")
\ No newline at end of file
+
+def _binned_kde(values, gridsize=1024, cut=0):
+    """
+    Gaussian KDE of a 1D array evaluated on an even grid from linearly
+    binned counts convolved with the kernel by FFT, so the cost depends on
+    `gridsize` rather than the number of values.
+
+    The bandwidth is Scott's rule as in ``scipy.stats.gaussian_kde`` (used
+    by seaborn), and the grid spans the data range extended by `cut`
+    bandwidths (seaborn's histplot uses ``cut=0``). Returns
+    ``(grid, density, n)``, or None if there are fewer than two distinct
+    finite values.
+    """
+    from scipy.signal import fftconvolve
+
+    values = values[np.isfinite(values)]
+    n = values.size
+    if n < 2:
+        return None
+    std = values.std(ddof=1)
+    if std == 0:
+        return None
+    bw = std * n ** (-1 / 5)
+
+    low, high = values.min() - cut * bw, values.max() + cut * bw
+    grid = np.linspace(low, high, gridsize)
+    delta = grid[1] - grid[0]
+
+    # Linear binning: split each value between its two neighbouring grid points
+    positions = (values - low) / delta
+    left = np.minimum(np.floor(positions).astype("int64"), gridsize - 2)
+    right_weight = positions - left
+    counts = (
+        np.bincount(left, weights=1 - right_weight, minlength=gridsize)
+        + np.bincount(left + 1, weights=right_weight, minlength=gridsize)
+    )
+
+    # Truncate the kernel at 4 bandwidths (or the grid width, if smaller)
+    half_width = min(int(np.ceil(4 * bw / delta)), gridsize - 1)
+    offsets = np.arange(-half_width, half_width + 1) * delta
+    kernel = np.exp(-0.5 * (offsets / bw) ** 2) / (np.sqrt(2 * np.pi) * bw * n)
+    density = np.clip(fftconvolve(counts, kernel, mode="same"), 0, None)
+    return grid, density, n
+
+
+def _bin_indices(values, bins):
+    """
+    Map a float array to equal-width bin indices over its finite range in
+    one vectorized pass. Returns the indices (-1 for NaN) and the bin edges.
+    """
+    finite = np.isfinite(values)
+    if not finite.any():
+        return np.full(values.shape, -1, dtype="int64"), np.linspace(0, 1, bins + 1)
+    low, high = values[finite].min(), values[finite].max()
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    edges = np.linspace(low, high, bins + 1)
+    indices = np.full(values.shape, -1, dtype="int64")
+    indices[finite] = np.minimum(((values[finite] - low) * (bins / (high - low))).astype("int64"), bins - 1)
+    return indices, edges
+
+
+def _binned_counts_2d(x_indices, y_indices, bins):
+    """
+    Count the rows falling in each 2D bin with a single ``bincount``;
+    rows with a missing coordinate are skipped.
+    """
+    valid = (x_indices >= 0) & (y_indices >= 0)
+    counts = np.bincount(x_indices[valid] * bins + y_indices[valid], minlength=bins * bins)
+    return counts.reshape(bins, bins)
+
+
+def _plot_scatter_pairs(dataframe, pairs, cols, scatter_threshold=100_000, scatter_bins=100):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from matplotlib.colors import LogNorm
+
+    num_pairs = len(pairs)
+    rows_scatter = (num_pairs // cols) + (1 if num_pairs % cols != 0 else 0)  # Dynamic row count
+    fig, axes = plt.subplots(rows_scatter, cols, figsize=(cols * 6, rows_scatter * 4), tight_layout=True)
+    axes = axes.ravel()
+
+    # Above the threshold draw binned densities; each column is binned once and reused for every pair
+    binned = {}
+    if scatter_threshold is not None and len(dataframe) > scatter_threshold:
+        binned = {
+            col: _bin_indices(dataframe[col].to_numpy(dtype="float64", na_value=np.nan), scatter_bins)
+            for col in dict.fromkeys(col for pair in pairs for col in pair)
+        }
+
+    for pair_idx, (col1, col2) in enumerate(pairs):
+        if binned:
+            (x_indices, x_edges), (y_indices, y_edges) = binned[col1], binned[col2]
+            counts = _binned_counts_2d(x_indices, y_indices, scatter_bins)
+            mesh = axes[pair_idx].pcolormesh(
+                x_edges, y_edges, np.ma.masked_equal(counts, 0).T, cmap="viridis", norm=LogNorm()
+            )
+            fig.colorbar(mesh, ax=axes[pair_idx], label="Count")
+        else:
+            sns.scatterplot(x=dataframe[col1], y=dataframe[col2], ax=axes[pair_idx], alpha=0.7)
+        axes[pair_idx].set_title(f"{col1} vs {col2}")
+        axes[pair_idx].set_xlabel(col1)
+        axes[pair_idx].set_ylabel(col2)
+
+    for j in range(num_pairs, len(axes)):
+        fig.delaxes(axes[j])
+    return fig
@@ -1,6 +1,14 @@
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import norm, t, chi2, f
+from matplotlib.collections import PolyCollection
+
+from mds_2025_helper_functions.power import _distributions, power_analysis
+
+# Number of points on the x grid, and the probability left out in each tail of it
+GRID_POINTS = 1000
+GRID_TAIL = 1e-4
 
 def htv(test_output, test_type="z", alpha=0.05, tail="two-tailed"):
     """
@@ -22,6 +30,15 @@ def htv(test_output, test_type="z", alpha=0.05, tail="two-tailed"):
     Returns:
         tuple: (fig, ax) Matplotlib figure and axes objects.
 
+    The critical values and the Type II error rate shown in the legend are
+    computed by `power_analysis`, which evaluates them without plotting.
+    Except for z tests, the alternative curve is illustrative, so its Type
+    II error is not the power of a real design (see `power_curve`). The
+    curves are drawn on a grid spanning both distributions (from their ppf)
+    and denser around the critical values; grids and critical values are
+    kept in an LRU cache, so repeated calls with the same parameters skip
+    all scipy work.
+
     Example:
         >>> import numpy as np
         >>> from mds_2025_helper_functions.htv import htv
@@ -51,93 +68,272 @@ def htv(test_output, test_type="z", alpha=0.05, tail="two-tailed"):
 
         # This will plot a one-tailed t-test diagram with appropriate critical regions.
     """
-    mu0 = test_output.get("mu0", 0)
-    mu1 = test_output.get("mu1", 1)
-    sigma = test_output.get("sigma", 1)
-    sample_size = test_output.get("sample_size", 30)
-    df = test_output.get("df", None)
-    df1 = test_output.get("df1", None)
-    df2 = test_output.get("df2", None)
-
-    # Define critical values and distributions based on the test type
-    if test_type == "z":
-        std_error = sigma / np.sqrt(sample_size)
-        if tail == "two-tailed":
-            critical_value_low = norm.ppf(alpha / 2, loc=mu0, scale=std_error)
-            critical_value_high = norm.ppf(1 - alpha / 2, loc=mu0, scale=std_error)
-        else:
-            critical_value = norm.ppf(1 - alpha, loc=mu0, scale=std_error)
-        dist_null = lambda x: norm.pdf(x, loc=mu0, scale=std_error)
-        dist_alt = lambda x: norm.pdf(x, loc=mu1, scale=std_error)
-
-    elif test_type == "t":
-        if df is None:
-            df = sample_size - 1  # Default degrees of freedom
-        if tail == "two-tailed":
-            critical_value_low = t.ppf(alpha / 2, df=df)
-            critical_value_high = t.ppf(1 - alpha / 2, df=df)
+    visualizer = HTVisualizer(test_output, test_type=test_type, alpha=alpha, tail=tail, blit=False)
+    return visualizer.fig, visualizer.ax
+
+
+class HTVisualizer:
+    """
+    Updatable `htv` plot for interactive use.
+
+    The figure and its artists are created once; `update` changes the
+    parameters and moves the curves, shaded error regions, critical value
+    lines and legend in place instead of creating a new figure. When the
+    axis limits and legend layout stay the same and the canvas supports it,
+    only the changing artists are redrawn onto a cached background
+    (blitting), which keeps slider-driven updates at interactive frame
+    rates.
+
+    Parameters:
+        test_output (dict): Hypothesis test parameters, as in `htv`.
+        test_type (str): Type of test ('z', 't', 'chi2', 'anova').
+        alpha (float): Significance level (Type I error rate).
+        tail (str): One-tailed or two-tailed test ("one-tailed" or "two-tailed").
+        ax (matplotlib.axes.Axes, optional): Axes to draw on. A new
+            figure is created if None.
+        blit (bool): Use blitting for updates where the backend supports it.
+
+    Attributes:
+        fig, ax: The Matplotlib figure and axes being updated.
+
+    Example:
+        >>> from matplotlib.widgets import Slider
+        >>> from mds_2025_helper_functions.htv import HTVisualizer
+        >>> visualizer = HTVisualizer({'mu0': 100, 'mu1': 105, 'sigma': 15, 'sample_size': 30})
+        >>> slider = Slider(slider_ax, "n", 5, 200, valinit=30, valstep=1)
+        >>> slider.on_changed(lambda n: visualizer.update({'sample_size': n}, rescale=False))
+    """
+
+    def __init__(self, test_output, test_type="z", alpha=0.05, tail="two-tailed", ax=None, blit=True):
+        self.test_output = dict(test_output)
+        self.test_type = test_type
+        self.alpha = alpha
+        self.tail = tail
+        # Computed before creating the figure, so invalid parameters leave no figure behind
+        curves = self._curves()
+
+        if ax is None:
+            self.fig, self.ax = plt.subplots(figsize=(12, 6))
         else:
-            critical_value = t.ppf(1 - alpha, df=df)
-        dist_null = lambda x: t.pdf(x, df=df)
-        dist_alt = lambda x: t.pdf(x, df=df, loc=mu1 - mu0)
-
-    elif test_type == "chi2":
-        if df is None:
-            raise ValueError("Degrees of freedom (df) must be specified for chi-squared tests.")
-        if tail == "two-tailed":
-            critical_value_low = chi2.ppf(alpha / 2, df=df)
-            critical_value_high = chi2.ppf(1 - alpha / 2, df=df)
+            self.fig, self.ax = ax.figure, ax
+        self.blit = blit
+        self._background = None
+        self._capturing = False
+        self._legend = None
+        self._legend_handles = []
+
+        ax = self.ax
+        self._null_line, = ax.plot([], [], label="Null Distribution (H0)", color="blue")
+        self._alt_line, = ax.plot([], [], label="Alternative Distribution (H1)", color="red")
+        self._type1 = PolyCollection([], color="orange", alpha=0.5, label="Type I Error (α)")
+        self._type2 = PolyCollection([], color="green", alpha=0.5)
+        ax.add_collection(self._type1, autolim=False)
+        ax.add_collection(self._type2, autolim=False)
+        self._critical_low = ax.axvline(x=0, color="black", linestyle="--")
+        self._critical_high = ax.axvline(x=0, color="black", linestyle="--")
+        ax.set_xlabel("Test Statistic", fontsize=14)
+        ax.set_ylabel("Probability Density", fontsize=14)
+        ax.grid(alpha=0.3)
+        # Any full redraw (resize, zoom, savefig) may change what lies under the artists
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+        self._apply(curves, rescale=True)
+
+    def update(self, test_output=None, test_type=None, alpha=None, tail=None, rescale=True):
+        """
+        Change some of the parameters and redraw in place.
+
+        Parameters:
+            test_output (dict, optional): Parameters to change; entries are
+                merged into the current ones.
+            test_type, alpha, tail (optional): New test type, significance
+                level or tail. Unchanged if None.
+            rescale (bool): Fit the axis limits to the new curves. Keeping the
+                limits fixed lets every update be blitted.
+
+        Returns:
+            HTVisualizer: self, for chaining.
+
+        Raises:
+            ValueError: If the new parameters are invalid; the plot is left
+                unchanged.
+        """
+        previous = (self.test_output, self.test_type, self.alpha, self.tail)
+        if test_output is not None:
+            self.test_output = {**self.test_output, **test_output}
+        self.test_type = self.test_type if test_type is None else test_type
+        self.alpha = self.alpha if alpha is None else alpha
+        self.tail = self.tail if tail is None else tail
+        try:
+            curves = self._curves()
+        except ValueError:
+            self.test_output, self.test_type, self.alpha, self.tail = previous
+            raise
+        self._apply(curves, rescale)
+        return self
+
+    def close(self):
+        """
+        Close the figure.
+        """
+        plt.close(self.fig)
+
+    def _curves(self):
+        params = self.test_output
+        tail = "two-tailed" if self.tail == "two-tailed" else "one-tailed"
+        return _htv_curves(
+            self.test_type, _as_key(self.alpha), tail, _as_key(params.get("mu0", 0)), _as_key(params.get("mu1", 1)),
+            _as_key(params.get("sigma", 1)), _as_key(params.get("sample_size", 30)), _as_key(params.get("df")),
+            _as_key(params.get("df1")), _as_key(params.get("df2")),
+        )
+
+    def _apply(self, curves, rescale):
+        x, y_null, y_alt, critical_value_low, critical_value_high, beta = curves
+        two_tailed = self.tail == "two-tailed"
+        ax = self.ax
+
+        self._null_line.set_data(x, y_null)
+        self._alt_line.set_data(x, y_alt)
+        # For one-tailed tests the low critical value is -inf
+        accepted = (x > critical_value_low) & (x < critical_value_high)
+        self._type1.set_verts(_fill_vertices(x, y_null, ~accepted))
+        self._type2.set_verts(_fill_vertices(x, y_alt, accepted))
+        self._type2.set_label(f"Type II Error (β = {beta:.3f}, power = {1 - beta:.3f})")
+        self._critical_low.set_xdata([critical_value_low if two_tailed else critical_value_high] * 2)
+        self._critical_low.set_visible(two_tailed)
+        self._critical_high.set_xdata([critical_value_high] * 2)
+        if two_tailed:
+            self._critical_low.set_label(f"Critical Value (Low) = {critical_value_low:.2f}")
+            self._critical_high.set_label(f"Critical Value (High) = {critical_value_high:.2f}")
         else:
-            critical_value = chi2.ppf(1 - alpha, df=df)
-        dist_null = lambda x: chi2.pdf(x, df=df)
-        dist_alt = lambda x: chi2.pdf(x, df=df + 1)  # Alternative hypothesis
-
-    elif test_type == "anova":
-        if df1 is None or df2 is None:
-            raise ValueError("Degrees of freedom (df1 and df2) must be specified for ANOVA tests.")
-        if tail == "two-tailed":
-            critical_value_low = f.ppf(alpha / 2, dfn=df1, dfd=df2)
-            critical_value_high = f.ppf(1 - alpha / 2, dfn=df1, dfd=df2)
+            self._critical_high.set_label(f"Critical Value = {critical_value_high:.2f}")
+
+        full_redraw = False
+        title = f"Type I and Type II Errors for {self.test_type.upper()} Test"
+        if ax.get_title() != title:
+            ax.set_title(title, fontsize=16)
+            full_redraw = True
+        if rescale:
+            limits = (ax.get_xlim(), ax.get_ylim())
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
+            full_redraw = full_redraw or limits != (ax.get_xlim(), ax.get_ylim())
+
+        handles = [self._null_line, self._alt_line, self._type1, self._type2]
+        handles += [self._critical_low, self._critical_high] if two_tailed else [self._critical_high]
+        if handles != self._legend_handles:
+            self._legend_handles = handles
+            full_redraw = True
+
+        self._render(full_redraw)
+
+    def _render(self, full_redraw):
+        canvas = self.fig.canvas
+        blit = self.blit and canvas.supports_blit
+        if full_redraw or self._legend is None or (blit and self._background is None):
+            self._legend = self.ax.legend(handles=self._legend_handles, fontsize=12)
+            if not blit:
+                canvas.draw_idle()
+                return
+            # 'best' legend placement scans all the data on every draw, so find
+            # it once and pin the legend there for the blitted updates
+            canvas.draw()
+            x0, y0 = self.ax.transAxes.inverted().transform(self._legend.get_window_extent().p0)
+            self._legend = self.ax.legend(handles=self._legend_handles, fontsize=12, loc="lower left",
+                                          bbox_to_anchor=(x0, y0), borderaxespad=0)
+            self._capture_background()
         else:
-            critical_value = f.ppf(1 - alpha, dfn=df1, dfd=df2)
-        dist_null = lambda x: f.pdf(x, dfn=df1, dfd=df2)
-        dist_alt = lambda x: f.pdf(x, dfn=df1, dfd=df2 + 1)  # Alternative hypothesis
+            for handle, text in zip(self._legend_handles, self._legend.get_texts()):
+                text.set_text(handle.get_label())
+            if not blit:
+                canvas.draw_idle()
+                return
+
+        canvas.restore_region(self._background)
+        for artist in self._dynamic_artists():
+            if artist.get_visible():
+                self.fig.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+    def _dynamic_artists(self):
+        return [self._type1, self._type2, self._null_line, self._alt_line, self._critical_low,
+                self._critical_high, self._legend]
+
+    def _capture_background(self):
+        # Draw everything except the artists that move, and keep the pixels
+        artists = self._dynamic_artists()
+        visible = [artist.get_visible() for artist in artists]
+        for artist in artists:
+            artist.set_visible(False)
+        self._capturing = True
+        try:
+            self.fig.canvas.draw()
+            self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        finally:
+            self._capturing = False
+            for artist, was_visible in zip(artists, visible):
+                artist.set_visible(was_visible)
 
-    else:
-        raise ValueError("Invalid test type. Choose 'z', 't', 'chi2', or 'anova'.")
+    def _on_draw(self, event):
+        if not self._capturing:
+            self._background = None
 
-    # Generate x values
-    x = np.linspace(mu0 - 4 * sigma, mu1 + 4 * sigma, 1000)
 
-    # Null and alternative distributions
-    y_null = dist_null(x)
-    y_alt = dist_alt(x)
+def _fill_vertices(x, y, where):
+    """
+    Polygons filling between 0 and `y` over each run of consecutive points
+    where `where` is True, as ``fill_between(x, 0, y, where=where)`` draws.
+    """
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], where.astype("int8"), [0]])))
+    polygons = []
+    for start, stop in zip(edges[::2], edges[1::2]):
+        xs, ys = x[start:stop], y[start:stop]
+        polygons.append(np.column_stack([
+            np.concatenate([xs[:1], xs, xs[-1:]]), np.concatenate([[0], ys, [0]]),
+        ]))
+    return polygons
+
 
-    # Plot distributions
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.plot(x, y_null, label="Null Distribution (H0)", color="blue")
-    ax.plot(x, y_alt, label="Alternative Distribution (H1)", color="red")
+def _as_key(value):
+    # Cache keys must be hashable and equal for 5, 5.0 and np.float64(5)
+    return None if value is None else float(value)
 
-    # Fill Type I and Type II error regions
+
+@lru_cache(maxsize=128)
+def _htv_curves(test_type, alpha, tail, mu0, mu1, sigma, sample_size, df, df1, df2):
+    """
+    Grid, pdf curves, critical values and Type II error of one `htv` plot.
+    The arrays are read-only because they are shared between calls.
+    """
+    dist_null, dist_alt = _distributions(test_type, mu0, mu1, sigma, sample_size, df, df1, df2)
+    errors = power_analysis(mu0, mu1, sigma, sample_size, alpha, test_type, tail, df, df1, df2)
+    critical_values = [float(errors["critical_value_high"])]
     if tail == "two-tailed":
-        ax.fill_between(x, 0, y_null, where=(x <= critical_value_low) | (x >= critical_value_high),
-                        color="orange", alpha=0.5, label="Type I Error (α)")
-        ax.fill_between(x, 0, y_alt, where=(x > critical_value_low) & (x < critical_value_high),
-                        color="green", alpha=0.5, label="Type II Error (β)")
-        ax.axvline(x=critical_value_low, color="black", linestyle="--",
-                   label=f"Critical Value (Low) = {critical_value_low:.2f}")
-        ax.axvline(x=critical_value_high, color="black", linestyle="--",
-                   label=f"Critical Value (High) = {critical_value_high:.2f}")
-    else:
-        ax.fill_between(x, 0, y_null, where=(x >= critical_value), color="orange", alpha=0.5, label="Type I Error (α)")
-        ax.fill_between(x, 0, y_alt, where=(x < critical_value), color="green", alpha=0.5, label="Type II Error (β)")
-        ax.axvline(x=critical_value, color="black", linestyle="--", label=f"Critical Value = {critical_value:.2f}")
-
-    # Add legend and grid
-    ax.set_title(f"Type I and Type II Errors for {test_type.upper()} Test", fontsize=16)
-    ax.set_xlabel("Test Statistic", fontsize=14)
-    ax.set_ylabel("Probability Density", fontsize=14)
-    ax.legend(fontsize=12)
-    ax.grid(alpha=0.3)
-
-    return fig, ax
\ No newline at end of file
+        critical_values.insert(0, float(errors["critical_value_low"]))
+
+    x = _adaptive_grid(dist_null, dist_alt, critical_values)
+    curves = [x, dist_null.pdf(x), dist_alt.pdf(x)]
+    for curve in curves:
+        curve.flags.writeable = False
+    return (*curves, float(errors["critical_value_low"]), float(errors["critical_value_high"]),
+            float(errors["beta"]))
+
+
+def _adaptive_grid(dist_null, dist_alt, critical_values, n_points=GRID_POINTS):
+    """
+    Sorted x values covering all but `GRID_TAIL` of each tail of both
+    distributions. Half of the points are spread evenly; the other half are
+    packed into windows around the critical values, which are included
+    exactly so that the shaded regions end on them.
+    """
+    low = min(dist_null.ppf(GRID_TAIL), dist_alt.ppf(GRID_TAIL))
+    high = max(dist_null.isf(GRID_TAIL), dist_alt.isf(GRID_TAIL))
+    low, high = min(low, *critical_values), max(high, *critical_values)
+    half_width = (high - low) / 20
+
+    parts = [np.linspace(low, high, n_points // 2), critical_values]
+    per_window = (n_points - n_points // 2 - len(critical_values)) // len(critical_values)
+    for value in critical_values:
+        parts.append(np.linspace(max(low, value - half_width), min(high, value + half_width), per_window))
+    return np.unique(np.concatenate(parts))
@@ -0,0 +1,543 @@
+import numpy as np
+from scipy.stats import chi2, f, nct, ncf, ncx2, norm, t
+
+from mds_2025_helper_functions._parallel import parallel_map
+
+
+def _distributions(test_type, mu0=0, mu1=1, sigma=1, sample_size=30, df=None, df1=None, df2=None):
+    """
+    Frozen null and alternative distributions of the test statistic, as drawn
+    by `htv`. Parameters may be arrays; scipy broadcasts them.
+    """
+    if test_type == "z":
+        std_error = np.asarray(sigma, dtype="float64") / np.sqrt(sample_size)
+        return norm(loc=mu0, scale=std_error), norm(loc=mu1, scale=std_error)
+
+    if test_type == "t":
+        if df is None:
+            df = np.asarray(sample_size) - 1  # Default degrees of freedom
+        return t(df=df), t(df=df, loc=np.subtract(mu1, mu0))
+
+    if test_type == "chi2":
+        if df is None:
+            raise ValueError("Degrees of freedom (df) must be specified for chi-squared tests.")
+        return chi2(df=df), chi2(df=np.add(df, 1))
+
+    if test_type == "anova":
+        if df1 is None or df2 is None:
+            raise ValueError("Degrees of freedom (df1 and df2) must be specified for ANOVA tests.")
+        return f(dfn=df1, dfd=df2), f(dfn=df1, dfd=np.add(df2, 1))
+
+    raise ValueError("Invalid test type. Choose 'z', 't', 'chi2', or 'anova'.")
+
+
+def _critical_values(null, alpha, tail):
+    """
+    Bounds of the acceptance region under the null; the lower bound of a
+    one-tailed (upper) test is -inf.
+    """
+    alpha = np.asarray(alpha, dtype="float64")
+    if np.any((alpha <= 0) | (alpha >= 1)):
+        raise ValueError("alpha must be between 0 and 1.")
+    if tail == "two-tailed":
+        return null.ppf(alpha / 2), null.ppf(1 - alpha / 2)
+    if tail == "one-tailed":
+        high = null.ppf(1 - alpha)
+        return np.full(np.shape(high), -np.inf), high
+    raise ValueError("Invalid tail. Choose 'one-tailed' or 'two-tailed'.")
+
+
+def power_analysis(mu0=0, mu1=1, sigma=1, sample_size=30, alpha=0.05, test_type="z", tail="two-tailed",
+                   df=None, df1=None, df2=None):
+    """
+    Compute critical values, Type II error and power without plotting.
+
+    Every numeric argument may be a NumPy array; all of them are broadcast
+    together, so one call evaluates any grid of designs. The null and
+    alternative distributions are the ones `htv` draws:
+
+    - 'z': Normal(mu0, sigma / sqrt(sample_size)) vs Normal(mu1, same scale).
+    - 't': t(df) vs t(df) shifted by ``mu1 - mu0``; df defaults to
+      ``sample_size - 1``.
+    - 'chi2': chi2(df) vs chi2(df + 1).
+    - 'anova': F(df1, df2) vs F(df1, df2 + 1).
+
+    Only the z results are the power of a real design. The t, chi2 and
+    ANOVA alternatives above are the illustrative curves `htv` draws (the
+    t alternative ignores `sigma` and `sample_size`, and the chi2 and ANOVA
+    ones have no effect size at all), so their 'beta' and 'power' describe
+    those pictures, not a study. For design power use `power_curve`,
+    `solve_sample_size` or `minimum_detectable_effect`, which use the
+    noncentral t, chi-squared and F distributions.
+
+    Parameters:
+        mu0 (float or array): Mean under the null hypothesis (H0).
+        mu1 (float or array): Mean under the alternative hypothesis (H1).
+        sigma (float or array): Standard deviation (z tests).
+        sample_size (int or array): Sample size (z tests, and t tests without df).
+        alpha (float or array): Significance level (Type I error rate).
+        test_type (str): Type of test ('z', 't', 'chi2', 'anova').
+        tail (str): "one-tailed" (reject above the critical value) or "two-tailed".
+        df (int or array, optional): Degrees of freedom (t and chi-squared tests).
+        df1 (int or array, optional): Numerator degrees of freedom (ANOVA).
+        df2 (int or array, optional): Denominator degrees of freedom (ANOVA).
+
+    Returns:
+        dict: Arrays with the broadcast shape of the inputs:
+            - 'critical_value_low', 'critical_value_high': Bounds of the
+              acceptance region (low is -inf for one-tailed tests).
+            - 'alpha': Type I error rate.
+            - 'beta': Type II error rate, the probability under H1 of
+              falling inside the acceptance region (of the illustrative
+              curves for t, chi2 and ANOVA tests).
+            - 'power': ``1 - beta``.
+
+    Raises:
+        ValueError: If the test type or tail is invalid, alpha is not in
+            (0, 1), or the degrees of freedom a test needs are missing.
+
+    Example:
+        >>> import numpy as np
+        >>> from mds_2025_helper_functions.power import power_analysis
+        >>> result = power_analysis(mu0=100, mu1=105, sigma=15, sample_size=np.arange(10, 201, 10))
+        >>> result['power'].round(2)
+        array([0.18, 0.32, 0.45, ...])
+    """
+    null, alt = _distributions(test_type, mu0, mu1, sigma, sample_size, df, df1, df2)
+    low, high = _critical_values(null, alpha, tail)
+    # alt.cdf(-inf) is 0, so the one-tailed case needs no special handling
+    beta = alt.cdf(high) - alt.cdf(low)
+    low, high, alpha, beta = np.broadcast_arrays(low, high, np.asarray(alpha, dtype="float64"), beta)
+    return {
+        "critical_value_low": low,
+        "critical_value_high": high,
+        "alpha": alpha,
+        "beta": beta,
+        "power": 1 - beta,
+    }
+
+
+# Smallest sample size each design is defined for, and the largest one searched
+_MIN_SAMPLE_SIZE = {"z": 1, "t": 2, "chi2": 1}
+MAX_SAMPLE_SIZE = 10**7
+
+
+def _effect_distributions(test_type, effect_size, sample_size, df=None, df1=None):
+    """
+    Frozen null and alternative distributions of the standardized test
+    statistic of a design with `sample_size` observations and a standardized
+    `effect_size`.
+    """
+    effect_size = np.asarray(effect_size, dtype="float64")
+    sample_size = np.asarray(sample_size, dtype="float64")
+
+    if test_type == "z":
+        return norm(), norm(loc=effect_size * np.sqrt(sample_size))
+
+    if test_type == "t":
+        return t(df=sample_size - 1), nct(df=sample_size - 1, nc=effect_size * np.sqrt(sample_size))
+
+    if test_type == "chi2":
+        if df is None:
+            raise ValueError("Degrees of freedom (df) must be specified for chi-squared tests.")
+        return chi2(df=df), ncx2(df=df, nc=sample_size * effect_size**2)
+
+    if test_type == "anova":
+        if df1 is None:
+            raise ValueError("Degrees of freedom (df1) must be specified for ANOVA tests.")
+        df2 = sample_size - np.asarray(df1) - 1
+        return f(dfn=df1, dfd=df2), ncf(dfn=df1, dfd=df2, nc=sample_size * effect_size**2)
+
+    raise ValueError("Invalid test type. Choose 'z', 't', 'chi2', or 'anova'.")
+
+
+def _min_sample_size(test_type, df1):
+    if test_type == "anova" and df1 is not None:
+        return np.asarray(df1) + 2
+    return _MIN_SAMPLE_SIZE.get(test_type, 1)
+
+
+def _resolve_tail(tail, test_type):
+    # Chi-squared and F tests reject only in the upper tail; z and t tests default to two tails
+    if tail is None:
+        return "one-tailed" if test_type in ("chi2", "anova") else "two-tailed"
+    return tail
+
+
+def _check_power(power):
+    power = np.asarray(power, dtype="float64")
+    if np.any((power <= 0) | (power >= 1)):
+        raise ValueError("power must be between 0 and 1.")
+    return power
+
+
+def power_curve(effect_size, sample_size, alpha=0.05, test_type="z", tail=None, df=None, df1=None):
+    """
+    Compute power as a function of effect size and sample size.
+
+    Effect sizes are standardized, as in Cohen's conventions:
+
+    - 'z' and 't': ``d = (mu1 - mu0) / sigma`` for a one-sample test with
+      `sample_size` observations (t uses the noncentral t with
+      ``sample_size - 1`` degrees of freedom).
+    - 'chi2': ``w`` for a test with `df` degrees of freedom
+      (noncentrality ``sample_size * w**2``).
+    - 'anova': ``f`` for ``df1 + 1`` groups and `sample_size` observations in
+      total (noncentrality ``sample_size * f**2``).
+
+    Every numeric argument may be an array; all of them are broadcast, so a
+    grid of sample sizes against effect sizes gives a family of power curves.
+
+    Parameters:
+        effect_size (float or array): Standardized effect size (d, w or f).
+        sample_size (int or array): Number of observations (in total for ANOVA).
+        alpha (float or array): Significance level (Type I error rate).
+        test_type (str): Type of test ('z', 't', 'chi2', 'anova').
+        tail (str, optional): "one-tailed" (reject above the critical value) or
+            "two-tailed". Defaults to two tails for z and t tests and to the
+            usual upper tail for chi-squared and ANOVA tests.
+        df (int or array, optional): Degrees of freedom (chi-squared tests).
+        df1 (int or array, optional): Numerator degrees of freedom, the number
+            of groups minus one (ANOVA).
+
+    Returns:
+        np.ndarray: Power with the broadcast shape of the inputs.
+
+    Example:
+        >>> import numpy as np
+        >>> from mds_2025_helper_functions.power import power_curve
+        >>> power_curve(effect_size=[[0.2], [0.5]], sample_size=np.arange(10, 101, 10), test_type="t").shape
+        (2, 10)
+    """
+    tail = _resolve_tail(tail, test_type)
+    null, alt = _effect_distributions(test_type, effect_size, sample_size, df, df1)
+    low, high = _critical_values(null, alpha, tail)
+    power = 1 - (alt.cdf(high) - alt.cdf(low))
+    if test_type == "t" and np.isnan(power).any():
+        # scipy's noncentral t returns NaN for large noncentralities, where the
+        # t test is indistinguishable from the z test
+        power = np.where(np.isnan(power), power_curve(effect_size, sample_size, alpha, "z", tail), power)
+    return power
+
+
+def solve_sample_size(effect_size, power=0.8, alpha=0.05, test_type="z", tail=None, df=None, df1=None):
+    """
+    Find the smallest sample size reaching the target power.
+
+    z tests use the closed form ``((z_alpha + z_power) / d) ** 2``; the other
+    tests run an integer bisection on `power_curve` for all inputs at once.
+    Effect sizes and models are those of `power_curve`, and every numeric
+    argument may be an array.
+
+    Parameters:
+        effect_size (float or array): Standardized effect size (d, w or f).
+        power (float or array): Target power.
+        alpha (float or array): Significance level (Type I error rate).
+        test_type (str): Type of test ('z', 't', 'chi2', 'anova').
+        tail (str, optional): "one-tailed" or "two-tailed"; defaults as in
+            `power_curve`.
+        df (int or array, optional): Degrees of freedom (chi-squared tests).
+        df1 (int or array, optional): Numerator degrees of freedom (ANOVA).
+
+    Returns:
+        dict: Arrays with the broadcast shape of the inputs:
+            - 'sample_size': Smallest sample size (in total for ANOVA) with at
+              least the target power; NaN if it is not reached by
+              `MAX_SAMPLE_SIZE` observations (e.g. a zero or, for one-tailed
+              tests, negative effect).
+            - 'power': Power achieved at that sample size.
+
+    Raises:
+        ValueError: If the test type or tail is invalid, power or alpha is not
+            in (0, 1), or the degrees of freedom a test needs are missing.
+
+    Example:
+        >>> from mds_2025_helper_functions.power import solve_sample_size
+        >>> solve_sample_size(effect_size=[0.2, 0.5, 0.8], power=0.8, test_type="t")["sample_size"]
+        array([199.,  34.,  15.])
+    """
+    tail = _resolve_tail(tail, test_type)
+    target = _check_power(power)
+    effect_size, target, alpha = np.broadcast_arrays(
+        np.asarray(effect_size, dtype="float64"), target, np.asarray(alpha, dtype="float64")
+    )
+    if np.ndim(df) or np.ndim(df1):
+        shape = np.broadcast_shapes(effect_size.shape, np.shape(df), np.shape(df1))
+        effect_size, target, alpha = (np.broadcast_to(a, shape) for a in (effect_size, target, alpha))
+
+    def reaches(n):
+        return power_curve(effect_size, n, alpha, test_type, tail, df, df1) >= target
+
+    lowest = np.broadcast_to(_min_sample_size(test_type, df1), effect_size.shape).astype("float64")
+    if test_type == "z":
+        # Closed form; it ignores the far tail of two-tailed tests, so also try one fewer
+        tails = 2 if tail == "two-tailed" else 1
+        z_alpha = norm.ppf(1 - alpha / tails)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            n = np.ceil(((z_alpha + norm.ppf(target)) / effect_size) ** 2)
+        n = np.where(effect_size > 0 if tails == 1 else effect_size != 0, n, np.nan)
+        n = np.maximum(n, lowest)
+        fewer = np.maximum(n - 1, lowest)
+        n = np.where(reaches(fewer), fewer, n)
+        n = np.where(n > MAX_SAMPLE_SIZE, np.nan, n)
+    else:
+        # Bracket by doubling from the smallest valid size, which keeps the
+        # search short for typical designs, then bisect: power(low) < target <= power(high)
+        done = reaches(lowest)
+        low, high = lowest.copy(), lowest.copy()
+        short = ~done
+        while short.any():
+            low = np.where(short, high, low)
+            high = np.where(short, np.minimum(2 * high, MAX_SAMPLE_SIZE), high)
+            short = short & ~reaches(high) & (high < MAX_SAMPLE_SIZE)
+        solvable = done | reaches(high)
+        while np.any(high - low > 1):
+            middle = np.floor((low + high) / 2)
+            ok = reaches(middle)
+            high = np.where(ok, middle, high)
+            low = np.where(ok, low, middle)
+        n = np.where(done, lowest, np.where(solvable, high, np.nan))
+
+    unsolved = np.isnan(n)
+    achieved = power_curve(effect_size, np.where(unsolved, lowest, n), alpha, test_type, tail, df, df1)
+    achieved = np.where(unsolved, np.nan, achieved)
+    return {"sample_size": n, "power": achieved}
+
+
+def minimum_detectable_effect(sample_size, power=0.8, alpha=0.05, test_type="z", tail=None, df=None,
+                              df1=None, tol=1e-8):
+    """
+    Find the smallest standardized effect size detectable with the target power.
+
+    z tests use the closed form ``(z_alpha + z_power) / sqrt(n)``, which for
+    two-tailed tests ignores the far rejection tail and so is very slightly
+    conservative; the other tests run a bisection on `power_curve` for all
+    inputs at once. Effect sizes and models are those of `power_curve`, and
+    every numeric argument may be an array.
+
+    Parameters:
+        sample_size (int or array): Number of observations (in total for ANOVA).
+        power (float or array): Target power.
+        alpha (float or array): Significance level (Type I error rate).
+        test_type (str): Type of test ('z', 't', 'chi2', 'anova').
+        tail (str, optional): "one-tailed" or "two-tailed"; defaults as in
+            `power_curve`.
+        df (int or array, optional): Degrees of freedom (chi-squared tests).
+        df1 (int or array, optional): Numerator degrees of freedom (ANOVA).
+        tol (float): Absolute tolerance on the effect size.
+
+    Returns:
+        np.ndarray: Minimum detectable effect size (d, w or f), with the
+            broadcast shape of the inputs.
+
+    Example:
+        >>> from mds_2025_helper_functions.power import minimum_detectable_effect
+        >>> minimum_detectable_effect(sample_size=[50, 100, 200], power=0.8, test_type="z").round(3)
+        array([0.396, 0.28 , 0.198])
+    """
+    tail = _resolve_tail(tail, test_type)
+    target = _check_power(power)
+    sample_size, target, alpha = np.broadcast_arrays(
+        np.asarray(sample_size, dtype="float64"), target, np.asarray(alpha, dtype="float64")
+    )
+    if np.any(sample_size < _min_sample_size(test_type, df1)):
+        raise ValueError("sample_size is too small for this test.")
+
+    if test_type == "z":
+        _critical_values(norm(), alpha, tail)  # Validates alpha and tail
+        tails = 2 if tail == "two-tailed" else 1
+        return (norm.ppf(1 - alpha / tails) + norm.ppf(target)) / np.sqrt(sample_size)
+
+    def reaches(effect_size):
+        return power_curve(effect_size, sample_size, alpha, test_type, tail, df, df1) >= target
+
+    # Bracket the root by doubling, then bisect
+    low = np.zeros(np.broadcast_shapes(sample_size.shape, np.shape(df), np.shape(df1)))
+    high = np.ones_like(low)
+    for _ in range(64):
+        short = ~reaches(high)
+        if not short.any():
+            break
+        low = np.where(short, high, low)
+        high = np.where(short, 2 * high, high)
+    while np.any(high - low > tol):
+        middle = (low + high) / 2
+        ok = reaches(middle)
+        high = np.where(ok, middle, high)
+        low = np.where(ok, low, middle)
+    return high
+
+
+DISTRIBUTIONS = ("normal", "skewed", "heavy-tailed")
+
+
+def _noise(rng, distribution, shape):
+    """
+    Errors with mean 0 and standard deviation 1: normal, exponential
+    (skewness 2) or t with 3 degrees of freedom (infinite kurtosis).
+    """
+    if distribution == "normal":
+        return rng.standard_normal(shape)
+    if distribution == "skewed":
+        return rng.standard_exponential(shape) - 1
+    return rng.standard_t(3, shape) / np.sqrt(3)
+
+
+def _group_means(effect_size, k):
+    # Evenly spaced means whose (population) standard deviation is Cohen's f
+    offsets = np.linspace(-1, 1, k)
+    return effect_size * offsets / np.sqrt(np.mean(offsets**2))
+
+
+def _category_probabilities(effect_size, k):
+    # Uniform null, tilted linearly so that Cohen's w equals the effect size
+    null = np.full(k, 1 / k)
+    tilt = np.linspace(-1, 1, k)
+    alt = null + effect_size * tilt * np.sqrt(null) / np.sqrt(np.sum(tilt**2))
+    return null, alt
+
+
+def _simulate_chunk(design, effect_size, seed, size):
+    """
+    Number of rejections among `size` replicates simulated under H0
+    (effect 0) and under H1, from an independent seed stream.
+    """
+    test_type, sample_size, low, high, distribution, group_sigmas, k = design
+    rng = np.random.default_rng(seed)
+    rejections = []
+    for effect in (0.0, effect_size):
+        if test_type == "chi2":
+            null, alt = _category_probabilities(effect, k)
+            counts = rng.multinomial(sample_size, alt, size=size)
+            expected = sample_size * null
+            statistic = np.sum((counts - expected) ** 2 / expected, axis=1)
+        elif test_type == "anova":
+            m = sample_size // k
+            x = _noise(rng, distribution, (size, k, m)) * group_sigmas[:, None] + _group_means(effect, k)[:, None]
+            means = x.mean(axis=2)
+            between = m * np.sum((means - means.mean(axis=1, keepdims=True)) ** 2, axis=1) / (k - 1)
+            within = np.sum((x - means[..., None]) ** 2, axis=(1, 2)) / (k * m - k)
+            statistic = between / within
+        else:
+            x = _noise(rng, distribution, (size, sample_size)) + effect
+            statistic = x.mean(axis=1) * np.sqrt(sample_size)
+            if test_type == "t":
+                statistic /= x.std(axis=1, ddof=1)
+        rejections.append(int(np.count_nonzero((statistic <= low) | (statistic >= high))))
+    return rejections
+
+
+def simulate_error_rates(effect_size, sample_size, alpha=0.05, test_type="z", tail=None, df=None,
+                         df1=None, distribution="normal", group_sigmas=None, n_simulations=10_000,
+                         chunk_size=1_000, n_jobs=None, seed=None):
+    """
+    Estimate Type I and Type II error rates by Monte Carlo simulation.
+
+    Replicates are drawn with NumPy's ``Generator`` in chunks of
+    `chunk_size`, and the test statistic is computed for a whole chunk at
+    once. Each chunk gets its own stream from ``SeedSequence(seed).spawn``,
+    so results depend on `seed` only, not on `n_jobs`. The designs and
+    effect sizes are those of `power_curve`, which gives the analytic rates:
+
+    - 'z' and 't': one-sample tests on `sample_size` observations whose mean
+      is `effect_size` standard deviations away from the null.
+    - 'chi2': goodness of fit over ``df + 1`` equally likely categories,
+      tilted to Cohen's w under H1.
+    - 'anova': one-way ANOVA over ``df1 + 1`` groups of
+      ``sample_size // (df1 + 1)`` observations, with means spread to
+      Cohen's f under H1.
+
+    Parameters:
+        effect_size (float): Standardized effect size (d, w or f) under H1.
+        sample_size (int): Number of observations (in total for ANOVA).
+        alpha (float): Significance level (Type I error rate).
+        test_type (str): Type of test ('z', 't', 'chi2', 'anova').
+        tail (str, optional): "one-tailed" or "two-tailed"; defaults as in
+            `power_curve` (upper-tailed for chi-squared and ANOVA tests).
+        df (int, optional): Degrees of freedom (chi-squared tests).
+        df1 (int, optional): Numerator degrees of freedom (ANOVA).
+        distribution (str): Shape of the data: 'normal', 'skewed'
+            (exponential) or 'heavy-tailed' (t with 3 degrees of freedom),
+            always with standard deviation 1. Not used by chi-squared tests.
+        group_sigmas (sequence, optional): Relative standard deviations of the
+            ANOVA groups, rescaled so that the pooled variance is 1. Equal if None.
+        n_simulations (int): Number of replicates under each hypothesis.
+        chunk_size (int): Number of replicates simulated per array.
+        n_jobs (int, optional): Number of worker processes (-1 for all CPUs).
+        seed (int, optional): Seed of the simulation.
+
+    Returns:
+        dict:
+            - 'alpha', 'beta': Analytic Type I and Type II error rates.
+            - 'empirical_alpha', 'empirical_beta': Simulated rates.
+            - 'alpha_se', 'beta_se': Monte Carlo standard errors of the
+              simulated rates.
+            - 'n_simulations': Number of replicates under each hypothesis.
+
+    Raises:
+        ValueError: If the design is invalid, e.g. an unknown distribution,
+            `group_sigmas` for a test other than ANOVA, or an effect too large
+            for the chi-squared categories.
+
+    Example:
+        >>> from mds_2025_helper_functions.power import simulate_error_rates
+        >>> simulate_error_rates(0.5, sample_size=20, test_type="t", distribution="skewed", seed=0)
+        {'alpha': 0.05, 'beta': 0.435..., 'empirical_alpha': 0.081..., 'empirical_beta': 0.393..., ...}
+    """
+    tail = _resolve_tail(tail, test_type)
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError("distribution must be 'normal', 'skewed' or 'heavy-tailed'.")
+    if n_simulations < 1 or chunk_size < 1:
+        raise ValueError("n_simulations and chunk_size must be at least 1.")
+    if group_sigmas is not None and test_type != "anova":
+        raise ValueError("group_sigmas only applies to ANOVA tests.")
+    if test_type == "chi2" and distribution != "normal":
+        raise ValueError("distribution does not apply to chi-squared tests.")
+
+    k = None
+    if test_type == "chi2":
+        if df is None:
+            raise ValueError("Degrees of freedom (df) must be specified for chi-squared tests.")
+        k = int(df) + 1
+        if np.any(_category_probabilities(effect_size, k)[1] <= 0):
+            raise ValueError("effect_size is too large for df + 1 categories.")
+    elif test_type == "anova":
+        if df1 is None:
+            raise ValueError("Degrees of freedom (df1) must be specified for ANOVA tests.")
+        k = int(df1) + 1
+        if sample_size // k < 2:
+            raise ValueError("sample_size must give at least 2 observations per group.")
+        # Equal group sizes, so the analytic rates use the balanced total
+        sample_size = sample_size // k * k
+        group_sigmas = np.ones(k) if group_sigmas is None else np.asarray(group_sigmas, dtype="float64")
+        if group_sigmas.shape != (k,):
+            raise ValueError("group_sigmas must have one entry per group (df1 + 1).")
+        group_sigmas = group_sigmas / np.sqrt(np.mean(group_sigmas**2))
+
+    null, _ = _effect_distributions(test_type, effect_size, sample_size, df, df1)
+    low, high = (float(value) for value in _critical_values(null, alpha, tail))
+    power = float(power_curve(effect_size, sample_size, alpha, test_type, tail, df, df1))
+
+    design = (test_type, int(sample_size), low, high, distribution, group_sigmas, k)
+    sizes = [chunk_size] * (n_simulations // chunk_size)
+    if n_simulations % chunk_size:
+        sizes.append(n_simulations % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    items = [(design, effect_size, chunk_seed, size) for chunk_seed, size in zip(seeds, sizes)]
+
+    rejected_null = rejected_alt = 0
+    for null_count, alt_count in parallel_map(_simulate_chunk, items, n_jobs, "processes"):
+        rejected_null += null_count
+        rejected_alt += alt_count
+
+    empirical_alpha = rejected_null / n_simulations
+    empirical_beta = 1 - rejected_alt / n_simulations
+    return {
+        "alpha": float(alpha),
+        "beta": 1 - power,
+        "empirical_alpha": empirical_alpha,
+        "empirical_beta": empirical_beta,
+        "alpha_se": np.sqrt(empirical_alpha * (1 - empirical_alpha) / n_simulations),
+        "beta_se": np.sqrt(empirical_beta * (1 - empirical_beta) / n_simulations),
+        "n_simulations": n_simulations,
+    }
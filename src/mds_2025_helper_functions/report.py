@@ -0,0 +1,225 @@
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+
+import pandas as pd
+
+from mds_2025_helper_functions.cache import frame_fingerprint
+from mds_2025_helper_functions.eda import (
+    _correlation, _is_histogram_column, _missingness, _plot_correlation, _plot_feature, _plot_missing_values,
+    _check_max_scatter_pairs, _plot_scatter_pairs, _top_correlated_pairs, detect_outliers,
+)
+
+# Bump when the section layout changes so old sidecar files are ignored
+REPORT_VERSION = 1
+
+_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em auto; max-width: 1200px; }}
+table {{ border-collapse: collapse; margin: 1em 0; }}
+th, td {{ border: 1px solid #ccc; padding: 0.2em 0.6em; text-align: right; }}
+img {{ max-width: 100%; }}
+pre {{ background: #f6f6f6; padding: 1em; overflow-x: auto; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{sections}
+</body>
+</html>
+"""
+
+
+def write_eda_report(dataframe, path, title="EDA Report", max_categories=20, max_scatter_pairs=30,
+                     outlier_method="iqr", missing_resolution=200):
+    """
+    Write a self-contained HTML EDA report, regenerating only what changed.
+
+    The report has an overview, a missing values section, a correlation
+    section and one section per column, with figures embedded as PNG
+    images. A content hash of every column is stored next to the report in
+    ``<path>.json`` together with each rendered section. When the report is
+    written again, a section is recomputed and re-rendered only if a column
+    it depends on (or an option affecting it) changed; all other sections
+    are copied from the previous run.
+
+    Parameters:
+        dataframe (pd.DataFrame): The input dataset.
+        path (str or os.PathLike): Output HTML file.
+        title (str): Report title.
+        max_categories (int or None): Bars per count plot before the rest are
+            grouped as 'Other', as in `perform_eda`.
+        max_scatter_pairs (int or None): Maximum number of scatter pairs, as in
+            `perform_eda`.
+        outlier_method (str): 'iqr', 'zscore' or 'mad'; see `detect_outliers`.
+        missing_resolution (int): Maximum number of row blocks in the missing
+            values heatmap.
+
+    Returns:
+        dict: 'path' of the report, and the names of the 'recomputed' and
+            'reused' sections ('overview', 'missing_values', 'correlation' and
+            'column:<name>').
+
+    Example:
+        >>> from mds_2025_helper_functions.report import write_eda_report
+        >>> write_eda_report(df, "reports/sales.html")["recomputed"]
+        ['overview', 'missing_values', 'correlation', 'column:Age', ...]
+        >>> df["Bonus"] = df["Bonus"] * 2
+        >>> write_eda_report(df, "reports/sales.html")["recomputed"]
+        ['overview', 'missing_values', 'correlation', 'column:Bonus']
+    """
+    if not isinstance(dataframe, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame.")
+    _check_max_scatter_pairs(max_scatter_pairs)
+
+    path = os.fspath(path)
+    state_path = path + ".json"
+    previous = _load_state(state_path)
+
+    column_hashes = [frame_fingerprint(dataframe.iloc[:, [i]]) for i in range(dataframe.shape[1])]
+    numeric_positions = [
+        i for i, dtype in enumerate(dataframe.dtypes) if pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+    ]
+
+    # Each section: name, the content hashes and options it depends on, and how to build it
+    sections = [
+        ("overview", (column_hashes, title), lambda: _overview_section(dataframe)),
+        (
+            "missing_values", (column_hashes, missing_resolution),
+            lambda: _missing_section(dataframe, missing_resolution),
+        ),
+        (
+            "correlation", ([column_hashes[i] for i in numeric_positions], max_scatter_pairs),
+            lambda: _correlation_section(dataframe.iloc[:, numeric_positions], max_scatter_pairs),
+        ),
+    ]
+    for i, name in enumerate(dataframe.columns):
+        sections.append((
+            f"column:{name}", (column_hashes[i], max_categories, outlier_method),
+            lambda i=i: _column_section(dataframe.iloc[:, i], max_categories, outlier_method),
+        ))
+
+    import matplotlib.pyplot as plt
+
+    state = {"version": REPORT_VERSION, "columns": dict(zip(map(str, dataframe.columns), column_hashes)),
+             "sections": {}}
+    recomputed, reused = [], []
+    with plt.ioff():
+        for name, dependencies, build in sections:
+            key = hashlib.blake2b(repr(dependencies).encode(), digest_size=16).hexdigest()
+            cached = previous.get(name)
+            if cached is not None and cached["key"] == key:
+                fragment = cached["html"]
+                reused.append(name)
+            else:
+                fragment = build()
+                recomputed.append(name)
+            state["sections"][name] = {"key": key, "html": fragment}
+
+    page = _PAGE.format(
+        title=html.escape(title),
+        sections="\n".join(section["html"] for section in state["sections"].values()),
+    )
+    _write_atomic(path, page)
+    _write_atomic(state_path, json.dumps(state))
+    return {"path": path, "recomputed": recomputed, "reused": reused}
+
+
+def _load_state(state_path):
+    try:
+        with open(state_path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if state.get("version") != REPORT_VERSION:
+        return {}
+    return state.get("sections", {})
+
+
+def _write_atomic(path, text):
+    # Write next to the target and swap it in, so readers never see a partial report
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temporary, path)
+
+
+def _figure_html(fig):
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format="png")
+    finally:
+        plt.close(fig)
+    encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return f'<img src="data:image/png;base64,{encoded}">'
+
+
+def _overview_section(dataframe):
+    buffer = io.StringIO()
+    dataframe.info(buf=buffer)
+    return (
+        '<section id="overview">\n<h2>Dataset Overview</h2>\n'
+        f"<pre>{html.escape(buffer.getvalue())}</pre>\n</section>"
+    )
+
+
+def _missing_section(dataframe, missing_resolution):
+    missing_values, missing_blocks, co_missing = _missingness(dataframe, missing_resolution)
+    parts = ['<section id="missing_values">', "<h2>Missing Values</h2>"]
+    if missing_blocks is None:
+        parts.append("<p>No missing values in the dataset.</p>")
+    else:
+        report = missing_values[missing_values > 0].rename("missing_count").to_frame()
+        report["missing_percentage"] = report["missing_count"] / len(dataframe) * 100
+        parts.append(report.to_html())
+        parts.append(_figure_html(_plot_missing_values(missing_blocks, co_missing)))
+    parts.append("</section>")
+    return "\n".join(parts)
+
+
+def _correlation_section(numeric, max_scatter_pairs):
+    parts = ['<section id="correlation">', "<h2>Correlations</h2>"]
+    if numeric.shape[1] < 2:
+        parts.append("<p>Not enough numeric columns for correlation heatmap.</p>")
+    else:
+        correlation = _correlation(numeric)
+        pairs = _top_correlated_pairs(correlation, max_scatter_pairs)
+        parts.append(_figure_html(_plot_correlation(correlation)))
+        parts.append("<h3>Scatterplots for Numeric Features</h3>")
+        columns = list(dict.fromkeys(col for pair in pairs for col in pair))
+        parts.append(_figure_html(_plot_scatter_pairs(numeric[columns], pairs, cols=2)))
+    parts.append("</section>")
+    return "\n".join(parts)
+
+
+def _column_section(series, max_categories, outlier_method):
+    import matplotlib.pyplot as plt
+
+    name = html.escape(str(series.name))
+    parts = [f'<section id="column-{name}">', f"<h2>{name} <small>({html.escape(str(series.dtype))})</small></h2>"]
+    parts.append(series.describe().to_frame().transpose().to_html())
+
+    missing = int(series.isnull().sum())
+    percentage = missing / len(series) * 100 if len(series) else 0.0
+    parts.append(f"<p>Missing values: {missing} ({percentage:.2f}%)</p>")
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        outliers = detect_outliers(series.to_frame(), method=outlier_method)[series.name]
+        parts.append(f"<p>Outliers ({outlier_method}): {outliers} potential outliers</p>")
+
+    counts = None if _is_histogram_column(series) else series.value_counts()
+    if counts is None or len(counts):
+        fig, ax = plt.subplots(figsize=(8, 4), tight_layout=True)
+        _plot_feature(ax, series, counts, max_categories)
+        parts.append(_figure_html(fig))
+    parts.append("</section>")
+    return "\n".join(parts)
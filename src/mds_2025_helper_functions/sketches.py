@@ -0,0 +1,319 @@
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch based on the KLL compactor hierarchy.
+
+    Values are buffered in a stack of compactors. When a compactor grows past
+    its capacity it is sorted and every other item (starting at a random
+    offset) is promoted to the next level with twice the weight, so memory
+    stays bounded by roughly ``3 * k`` items regardless of the stream length.
+
+    Sketches merge by concatenating compactors level by level, so partial
+    sketches built on separate chunks or workers combine into a sketch of
+    the whole stream.
+
+    Parameters
+    ----------
+    k : int, default=200
+        Accuracy parameter. Larger values use more memory and give smaller
+        rank error; see `normalized_rank_error`.
+    seed : int, optional
+        Seed for the random compaction offsets.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from mds_2025_helper_functions.sketches import KLLSketch
+    >>> sketch = KLLSketch(k=200, seed=0)
+    >>> sketch.update(np.arange(100_000))
+    >>> sketch.quantile([0.25, 0.5, 0.75])
+    """
+
+    _MIN_CAPACITY = 8
+
+    def __init__(self, k=200, seed=None):
+        if k < self._MIN_CAPACITY:
+            raise ValueError(f"k must be at least {self._MIN_CAPACITY}.")
+        self.k = k
+        self.n = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._compactors = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def normalized_rank_error(self):
+        """
+        Approximate bound on the rank error of a quantile estimate, as a
+        fraction of `n` (about 1.3% for ``k=200``), using the empirical
+        99%-confidence fit published for KLL sketches. Zero while the sketch
+        still holds every value.
+        """
+        if len(self._compactors) == 1:
+            return 0.0
+        return 2.296 / self.k ** 0.9723
+
+    def _capacity(self, level):
+        depth = len(self._compactors) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), self._MIN_CAPACITY)
+
+    def _compress(self):
+        level = 0
+        while level < len(self._compactors):
+            items = self._compactors[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._compactors):
+                    self._compactors.append(np.empty(0))
+                items = np.sort(items)
+                # Keep one item back when the count is odd so weights stay exact
+                keep = items[:len(items) % 2]
+                paired = items[len(items) % 2:]
+                promoted = paired[self._rng.integers(2)::2]
+                self._compactors[level] = keep
+                self._compactors[level + 1] = np.concatenate([self._compactors[level + 1], promoted])
+                # Adding a level shrinks the lower capacities, so start over
+                level = 0
+            else:
+                level += 1
+
+    def update(self, values):
+        """
+        Add an array of values to the sketch. NaN values are ignored.
+        """
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.n += values.size
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self._compactors[0] = np.concatenate([self._compactors[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Fold another sketch into this one and return ``self``.
+        """
+        if other.n == 0:
+            return self
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append(np.empty(0))
+        for level, items in enumerate(other._compactors):
+            self._compactors[level] = np.concatenate([self._compactors[level], items])
+        self.n += other.n
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Estimate the quantile(s) ``q`` of the values seen so far.
+
+        While no compaction has happened the sketch still holds every value,
+        so the result is exact and uses the same linear interpolation as
+        ``pandas.Series.quantile``.
+        """
+        q = np.asarray(q, dtype="float64")
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        if len(self._compactors) == 1:
+            return np.quantile(self._compactors[0], q)
+
+        items = np.concatenate(self._compactors)
+        weights = np.concatenate([
+            np.full(len(level_items), 2 ** level, dtype="float64")
+            for level, level_items in enumerate(self._compactors)
+        ])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        # Midpoint ranks give an unbiased position for each retained item
+        ranks = (cumulative - weights[order] / 2) / cumulative[-1]
+        result = np.interp(q, ranks, items)
+        return np.clip(result, self.min, self.max)
+
+    def __len__(self):
+        return sum(len(items) for items in self._compactors)
+
+
+def _bit_length(values):
+    """
+    Vectorized ``int.bit_length`` for a uint64 array.
+    """
+    values = values.copy()
+    lengths = np.zeros(values.shape, dtype="int64")
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = (values >> np.uint64(shift)) != 0
+        lengths[big] += shift
+        values[big] >>= np.uint64(shift)
+    return lengths + (values != 0)
+
+
+class HyperLogLog:
+    """
+    Fixed-memory distinct count estimator.
+
+    Each 64-bit hash is routed to one of ``2 ** precision`` registers by its
+    leading bits, and the register keeps the longest run of leading zeros
+    seen in the remaining bits. Two sketches with the same precision merge
+    by taking the element-wise maximum of their registers.
+
+    Parameters
+    ----------
+    precision : int, default=14
+        Number of index bits, between 4 and 18. The sketch uses
+        ``2 ** precision`` bytes and has a relative standard error of
+        ``1.04 / sqrt(2 ** precision)`` (about 0.8% for the default).
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> from mds_2025_helper_functions.sketches import HyperLogLog
+    >>> hll = HyperLogLog(precision=12)
+    >>> hll.update(pd.Series(["a", "b", "a", "c"]))
+    >>> hll.count(), hll.relative_error
+    """
+
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype="uint8")
+
+    @property
+    def relative_error(self):
+        """Relative standard error of the estimate."""
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values):
+        """
+        Add values to the sketch. A pandas Series or array of arbitrary values
+        is hashed with ``pandas.util.hash_pandas_object``; missing values are
+        skipped. Return ``self``.
+        """
+        values = pd.Series(values).dropna()
+        return self.update_hashes(pd.util.hash_pandas_object(values, index=False).to_numpy())
+
+    def update_hashes(self, hashes):
+        """
+        Add precomputed 64-bit hashes to the sketch and return ``self``.
+        """
+        hashes = np.asarray(hashes, dtype="uint64")
+        if hashes.size == 0:
+            return self
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype("int64")
+        remainder = hashes << p
+        rank = np.minimum(64 - _bit_length(remainder) + 1, 64 - self.precision + 1).astype("uint8")
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        """
+        Fold another sketch with the same precision into this one and return ``self``.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """
+        Estimate the number of distinct values added so far.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype("int64")))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate while many registers are empty
+            estimate = m * np.log(m / zeros)
+        return float(estimate)
+
+
+class BloomFilter:
+    """
+    Fixed-memory set membership filter for 64-bit hashes.
+
+    Membership tests never give false negatives; a value that was not added
+    is reported as present with probability close to `error_rate` as long
+    as no more than `capacity` distinct values have been added. Filters
+    with the same size merge by OR-ing their bits.
+
+    Parameters
+    ----------
+    capacity : int
+        Expected number of distinct values.
+    error_rate : float, default=0.001
+        Target false positive probability at `capacity` values. The filter
+        uses ``-capacity * ln(error_rate) / ln(2) ** 2`` bits (about 1.8 MB
+        per million values for the default).
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from mds_2025_helper_functions.sketches import BloomFilter
+    >>> bloom = BloomFilter(capacity=1_000_000)
+    >>> hashes = np.array([1, 2, 3], dtype="uint64")
+    >>> bloom.add_hashes(hashes)
+    >>> bloom.contains_hashes(hashes)
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.n_bits = int(np.ceil(-capacity * np.log(error_rate) / np.log(2) ** 2))
+        self.n_hashes = max(1, int(round(self.n_bits / capacity * np.log(2))))
+        self.bits = np.zeros((self.n_bits + 7) // 8, dtype="uint8")
+
+    def _positions(self, hashes):
+        # Kirsch-Mitzenmacher double hashing: k bit positions from two 32-bit halves
+        hashes = np.asarray(hashes, dtype="uint64")
+        low = hashes & np.uint64(0xFFFFFFFF)
+        high = (hashes >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.n_hashes, dtype="uint64")
+        return (low[:, None] + steps[None, :] * high[:, None]) % np.uint64(self.n_bits)
+
+    def contains_hashes(self, hashes):
+        """
+        Return a boolean array marking the hashes that are (probably) present.
+        """
+        positions = self._positions(hashes)
+        masks = np.left_shift(1, positions & np.uint64(7)).astype("uint8")
+        return ((self.bits[positions >> np.uint64(3)] & masks) != 0).all(axis=1)
+
+    def add_hashes(self, hashes):
+        """
+        Add 64-bit hashes to the filter and return ``self``.
+        """
+        positions = self._positions(hashes).ravel()
+        masks = np.left_shift(1, positions & np.uint64(7)).astype("uint8")
+        np.bitwise_or.at(self.bits, (positions >> np.uint64(3)).astype("int64"), masks)
+        return self
+
+    def merge(self, other):
+        """
+        Fold another filter with the same size into this one and return ``self``.
+        """
+        if (other.n_bits, other.n_hashes) != (self.n_bits, self.n_hashes):
+            raise ValueError("Cannot merge Bloom filters with different sizes.")
+        np.bitwise_or(self.bits, other.bits, out=self.bits)
+        return self
+
+    def count(self):
+        """
+        Estimate the number of distinct values added from the fraction of set bits.
+        """
+        set_bits = int(np.unpackbits(self.bits)[:self.n_bits].sum())
+        if set_bits == self.n_bits:
+            return float("inf")
+        return float(-self.n_bits / self.n_hashes * np.log(1 - set_bits / self.n_bits))
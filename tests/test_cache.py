@@ -0,0 +1,78 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from mds_2025_helper_functions.cache import ResultCache, frame_fingerprint, resolve_cache, default_cache
+
+def test_frame_fingerprint_tracks_content():
+    """Test that the fingerprint is stable for equal frames and changes with values, dtypes and columns."""
+    df = pd.DataFrame({"num": [1.0, 2.0, np.nan], "cat": ["A", None, "B"], "date": pd.date_range("2024", periods=3)})
+
+    assert frame_fingerprint(df) == frame_fingerprint(df.copy())
+    changed = df.copy()
+    changed.loc[1, "num"] = 5.0
+    assert frame_fingerprint(changed) != frame_fingerprint(df)
+    assert frame_fingerprint(df.astype({"num": "float32"})) != frame_fingerprint(df)
+    assert frame_fingerprint(df.rename(columns={"cat": "other"})) != frame_fingerprint(df)
+
+def test_frame_fingerprint_keeps_object_types_apart():
+    """Test that values and labels which only match as text, like 1 and "1", give different fingerprints."""
+    mixed = pd.DataFrame({"c": [1, "x", 1]})
+    text = pd.DataFrame({"c": ["1", "x", "1"]})
+
+    assert frame_fingerprint(mixed) != frame_fingerprint(text)
+    assert frame_fingerprint(pd.DataFrame({"c": [1, True]})) != frame_fingerprint(pd.DataFrame({"c": [1, 1]}))
+    assert frame_fingerprint(pd.DataFrame({1: [0]})) != frame_fingerprint(pd.DataFrame({"1": [0]}))
+    assert frame_fingerprint(mixed.set_index("c")) != frame_fingerprint(text.set_index("c"))
+    assert (frame_fingerprint(mixed.astype("category"))
+            != frame_fingerprint(text.astype("category")))
+
+    from mds_2025_helper_functions.eda import compute_eda
+
+    cache = ResultCache()
+    compute_eda(mixed, cache=cache)
+    assert compute_eda(text, cache=cache).value_counts["c"].index.tolist() == ["1", "x"]
+
+def test_result_cache_lru_and_stats():
+    """Test LRU eviction in memory and the hit/miss counters."""
+    cache = ResultCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats() == {"hits": 2, "disk_hits": 0, "misses": 1, "entries": 2}
+
+def test_result_cache_disk_tier(tmp_path):
+    """Test that the disk tier serves entries evicted from memory and respects its size limit."""
+    cache = ResultCache(max_entries=1, directory=tmp_path, max_disk_bytes=10_000)
+    cache.set("a", pd.DataFrame({"x": [1, 2, 3]}))
+    cache.set("b", 2)
+
+    pd.testing.assert_frame_equal(cache.get("a"), pd.DataFrame({"x": [1, 2, 3]}))
+    assert cache.disk_hits == 1
+
+    cache.set("big", np.zeros(5_000))
+    assert sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path)) <= 10_000
+    cache.clear()
+    assert os.listdir(tmp_path) == []
+
+def test_result_cache_returns_copies():
+    """Test that modifying a returned value does not modify the cached value."""
+    cache = ResultCache()
+    cache.set("key", {"frame": pd.DataFrame({"x": [1]})})
+    cache.get("key")["frame"].loc[0, "x"] = 99
+
+    assert cache.get("key")["frame"].loc[0, "x"] == 1
+
+def test_resolve_cache():
+    """Test the accepted values of the cache argument."""
+    cache = ResultCache()
+    assert resolve_cache(None) is None
+    assert resolve_cache(False) is None
+    assert resolve_cache(True) is default_cache
+    assert resolve_cache(cache) is cache
+    with pytest.raises(TypeError):
+        resolve_cache("yes")
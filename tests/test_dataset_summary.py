@@ -1,7 +1,10 @@
 import pytest
 import pandas as pd
 import numpy as np
-from mds_2025_helper_functions.dataset_summary import dataset_summary
+from mds_2025_helper_functions.cache import ResultCache
+from mds_2025_helper_functions.dataset_summary import (
+    dataset_summary, dataset_summary_stream, SummaryState, _FingerprintSet, count_duplicates, optimize_dtypes
+)
 
 def test_dataset_summary_invalid_input():
     """
@@ -80,4 +83,558 @@ def test_dataset_summary_no_numeric_features():
 
     assert result["feature_types"]["numerical_features"] == 0
     assert result["feature_types"]["categorical_features"] == 2
-    assert result["numerical_summary"].empty
\ No newline at end of file
+    assert result["numerical_summary"].empty
+
+def test_dataset_summary_stream_matches_in_memory():
+    """
+    Test that summarizing a DataFrame in chunks gives the same result as the in-memory summary.
+    """
+    df = pd.DataFrame({
+        "num_col": [1, np.nan, 3, 4, 1, 6, 7, np.nan],
+        "int_col": [10, 20, 30, 40, 10, 60, 70, 80],
+        "cat_col": ["A", "B", None, "A", "A", "C", "B", "A"]
+    })
+    expected = dataset_summary(df)
+    result = dataset_summary_stream(df.iloc[i:i + 3] for i in range(0, len(df), 3))
+
+    pd.testing.assert_frame_equal(result["missing_values"], expected["missing_values"])
+    pd.testing.assert_frame_equal(result["numerical_summary"], expected["numerical_summary"])
+    pd.testing.assert_frame_equal(result["categorical_summary"], expected["categorical_summary"])
+    assert result["feature_types"] == expected["feature_types"]
+    assert result["duplicates"] == expected["duplicates"] == 1
+
+def test_dataset_summary_stream_mixed_type_categories():
+    """
+    Test that streamed and sketched distinct counts keep 1 and "1" apart, matching nunique.
+    """
+    df = pd.DataFrame({"c": pd.Series([1, "1", 2, "2", "a"], dtype=object)})
+    streamed = dataset_summary_stream([df.iloc[:2], df.iloc[2:]])["categorical_summary"]
+    sketched = dataset_summary(df, approx=True)["categorical_summary"]
+
+    assert streamed["unique_values"].tolist() == sketched["unique_values"].tolist() == [df["c"].nunique()] == [5]
+
+def test_sketched_percentiles_are_reproducible():
+    """
+    Test that approximate percentiles are the same on every call with the same data, batch and streamed.
+    """
+    df = pd.DataFrame({"x": np.random.default_rng(0).normal(size=20000)})
+    chunks = [df.iloc[i:i + 5000] for i in range(0, len(df), 5000)]
+
+    first = dataset_summary(df, approx_quantiles=True)["numerical_summary"]
+    pd.testing.assert_frame_equal(first, dataset_summary(df, approx_quantiles=True)["numerical_summary"])
+    streamed = dataset_summary_stream(chunks)["numerical_summary"]
+    pd.testing.assert_frame_equal(streamed, dataset_summary_stream(chunks)["numerical_summary"])
+
+def test_dataset_summary_stream_csv(tmp_path):
+    """
+    Test that a CSV path is read in chunks and duplicates are counted across chunks.
+    """
+    df = pd.DataFrame({
+        "num_col": [1, 2, 3, 1, 2],
+        "cat_col": ["A", "B", "C", "A", "B"]
+    })
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    result = dataset_summary_stream(path, chunksize=2)
+
+    assert result["duplicates"] == 2
+    assert result["numerical_summary"].loc["num_col", "count"] == 5
+    assert result["categorical_summary"]["unique_values"].tolist() == [3]
+
+def test_dataset_summary_stream_empty():
+    """
+    Test that an empty stream returns the empty summary.
+    """
+    result = dataset_summary_stream(iter([]))
+
+    assert result["missing_values"].empty
+    assert result["duplicates"] == 0
+    assert result["numerical_summary"].empty
+
+def test_dataset_summary_stream_invalid_input():
+    """
+    Test that the function raises a TypeError for inputs that are not paths or DataFrame iterables.
+    """
+    with pytest.raises(TypeError):
+        dataset_summary_stream(123)
+    with pytest.raises(TypeError, match="Chunks must be pandas DataFrames"):
+        dataset_summary_stream([[1, 2, 3]])
+
+def test_dataset_summary_stream_mismatched_columns():
+    """
+    Test that chunks with different columns raise a ValueError.
+    """
+    chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"b": [1, 2]})]
+    with pytest.raises(ValueError, match="same columns"):
+        dataset_summary_stream(chunks)
+
+def test_summary_state_incremental_update():
+    """
+    Test that updating a state batch by batch matches summarizing the full history.
+    """
+    first = pd.DataFrame({"num_col": [1.0, 2.0, np.nan], "cat_col": ["A", "B", "A"]})
+    second = pd.DataFrame({"num_col": [2.0, 5.0], "cat_col": ["B", "C"]})
+    state = SummaryState().update(first)
+    state.update(second)
+
+    expected = dataset_summary(pd.concat([first, second], ignore_index=True))
+    result = state.result()
+
+    pd.testing.assert_frame_equal(result["numerical_summary"], expected["numerical_summary"])
+    pd.testing.assert_frame_equal(result["categorical_summary"], expected["categorical_summary"])
+    assert result["duplicates"] == expected["duplicates"] == 1
+
+def test_summary_state_merge_workers():
+    """
+    Test that merging states built separately matches a single state and leaves the other state unchanged.
+    """
+    part_a = pd.DataFrame({"num_col": [1, 2, 3], "cat_col": ["A", "B", "C"]})
+    part_b = pd.DataFrame({"num_col": [3, 4, 5], "cat_col": ["C", "D", "E"]})
+    state_a = SummaryState().update(part_a)
+    state_b = SummaryState().update(part_b)
+    state_a.merge(state_b)
+
+    result = state_a.result()
+    assert result["numerical_summary"].loc["num_col", "count"] == 6
+    assert result["numerical_summary"].loc["num_col", "mean"] == pytest.approx(3.0)
+    assert result["categorical_summary"]["unique_values"].tolist() == [5]
+    assert result["duplicates"] == 1
+    assert state_b.n_rows == 3
+    assert state_b.result()["numerical_summary"].loc["num_col", "count"] == 3
+
+def test_summary_state_type_conflict():
+    """
+    Test that a column switching between numerical and non-numerical data raises a ValueError.
+    """
+    state = SummaryState().update(pd.DataFrame({"col": [1, 2]}))
+    with pytest.raises(ValueError, match="numerical in one chunk"):
+        state.update(pd.DataFrame({"col": ["A", "B"]}))
+
+
+def test_dataset_summary_matches_pandas_statistics():
+    """
+    Test that the per-column scan matches pandas describe, isnull and nunique on mixed dtypes.
+    """
+    df = pd.DataFrame({
+        "float_col": [1.5, np.nan, 3.25, 4.0, -2.0, 8.5],
+        "int_col": [1, 2, 3, 4, 5, 6],
+        "nullable_col": pd.array([1, None, 3, 3, None, 9], dtype="Int64"),
+        "cat_col": pd.Categorical(["A", "B", None, "A", "A", "B"], categories=["A", "B", "C"]),
+        "obj_col": ["x", None, "y", "z", "x", None],
+        "bool_col": [True, False, True, True, False, True],
+        "date_col": pd.to_datetime(["2020-01-01", None, "2020-01-03", "2020-01-04", "2020-01-05", "2020-01-06"]),
+    })
+    result = dataset_summary(df)
+
+    pd.testing.assert_frame_equal(
+        result["numerical_summary"], df.describe(include="number").transpose().astype("float64")
+    )
+    assert result["missing_values"]["missing_count"].tolist() == df.isnull().sum().tolist()
+    assert result["categorical_summary"]["unique_values"].tolist() == df[["cat_col", "obj_col"]].nunique().tolist()
+    assert result["feature_types"] == {"numerical_features": 3, "categorical_features": 4}
+
+def test_dataset_summary_approx_unique_values():
+    """
+    Test that approx=True estimates unique counts within the reported error and reports it.
+    """
+    df = pd.DataFrame({
+        "user_id": [f"user_{i % 5000}" for i in range(20000)],
+        "cat_col": pd.Categorical(["A", "B"] * 10000)
+    })
+    result = dataset_summary(df, approx=True, hll_precision=12)
+    summary = result["categorical_summary"].set_index("column")
+
+    assert "relative_error" in summary.columns
+    assert summary.loc["user_id", "unique_values"] == pytest.approx(5000, rel=4 * summary.loc["user_id", "relative_error"])
+    assert summary.loc["cat_col", "unique_values"] == 2
+
+def test_dataset_summary_stream_approx_merges_sketches():
+    """
+    Test that approximate unique counts are merged across chunks rather than summed.
+    """
+    df = pd.DataFrame({"cat_col": [f"v{i % 300}" for i in range(3000)]})
+    result = dataset_summary_stream((df.iloc[i:i + 500] for i in range(0, len(df), 500)), approx=True)
+
+    assert result["categorical_summary"]["unique_values"].iloc[0] == pytest.approx(300, rel=0.05)
+    with pytest.raises(ValueError, match="exact and approximate"):
+        SummaryState(approx=True).merge(SummaryState())
+
+def test_dataset_summary_custom_percentiles():
+    """
+    Test that custom percentiles match pandas describe, including the added median.
+    """
+    df = pd.DataFrame({"num_col": [1.0, 5.0, 2.0, 8.0, np.nan, 3.0, 13.0]})
+    result = dataset_summary(df, percentiles=[0.1, 0.9, 0.999])
+
+    expected = df.describe(percentiles=[0.1, 0.9, 0.999]).transpose()
+    pd.testing.assert_frame_equal(result["numerical_summary"], expected)
+    with pytest.raises(ValueError, match="percentiles"):
+        dataset_summary(df, percentiles=[1.5])
+
+def test_dataset_summary_approx_quantiles():
+    """
+    Test that sketched percentiles stay within the reported rank error.
+    """
+    values = np.random.default_rng(0).uniform(size=100_000)
+    df = pd.DataFrame({"num_col": values})
+    result = dataset_summary(df, percentiles=[0.05, 0.95], approx_quantiles=True, sketch_k=200)
+    summary = result["numerical_summary"]
+    rank_error = summary.attrs["quantile_rank_error"]
+
+    assert 0 < rank_error < 0.02
+    for p in [0.05, 0.5, 0.95]:
+        assert summary.loc["num_col", f"{p * 100:g}%"] == pytest.approx(p, abs=2 * rank_error)
+    assert summary.loc["num_col", "min"] == values.min()
+    assert summary.loc["num_col", "max"] == values.max()
+
+def test_dataset_summary_stream_percentiles():
+    """
+    Test that streamed summaries report the requested percentiles.
+    """
+    df = pd.DataFrame({"num_col": np.arange(100, dtype=float)})
+    result = dataset_summary_stream((df.iloc[i:i + 10] for i in range(0, 100, 10)), percentiles=[0.1])
+
+    assert list(result["numerical_summary"].columns) == ["count", "mean", "std", "min", "10%", "50%", "max"]
+    assert result["numerical_summary"].loc["num_col", "10%"] == pytest.approx(9.9)
+
+def test_fingerprint_set_matches_python_set():
+    """
+    Test that the log-structured fingerprint set counts distinct values exactly and keeps O(log n) runs.
+    """
+    rng = np.random.default_rng(0)
+    fingerprints = _FingerprintSet()
+    seen = set()
+    for _ in range(200):
+        batch = rng.integers(0, 50_000, 500).astype("uint64")
+        new = fingerprints.add(batch)
+        assert set(new.tolist()) == set(batch.tolist()) - seen
+        seen |= set(batch.tolist())
+
+    assert len(fingerprints) == len(seen)
+    assert set(fingerprints.values().tolist()) == seen
+    assert all(np.all(np.diff(run.astype("int64")) > 0) for run in fingerprints.runs)
+    assert len(fingerprints.runs) <= np.log2(len(seen)) + 1
+
+def test_count_duplicates_matches_pandas():
+    """
+    Test that fingerprint-based duplicate counting matches DataFrame.duplicated, with and without a subset.
+    """
+    df = pd.DataFrame({
+        "num_col": [1.0, 1.0, np.nan, np.nan, 0.0, -0.0],
+        "int_col": [1, 1, 2, 2, 3, 3],
+        "cat_col": ["A", "A", None, None, "B", "C"],
+        "date_col": pd.to_datetime(["2020-01-01"] * 6),
+    })
+
+    assert count_duplicates(df) == df.duplicated().sum() == 2
+    assert count_duplicates(df, subset=["int_col"]) == df.duplicated(subset=["int_col"]).sum() == 3
+    assert dataset_summary(df, duplicate_subset=["num_col", "int_col"])["duplicates"] == 3
+    with pytest.raises(KeyError):
+        count_duplicates(df, subset=["missing_col"])
+
+def test_count_duplicates_large_integer_ids():
+    """
+    Test that distinct int64 and uint64 values beyond 2**53 are not counted as duplicates.
+    """
+    df = pd.DataFrame({
+        "user_id": np.arange(2**60, 2**60 + 1000),
+        "unsigned_id": np.arange(2**63, 2**63 + 1000, dtype="uint64"),
+    })
+
+    assert count_duplicates(df) == df.duplicated().sum() == 0
+    assert count_duplicates(df, subset=["user_id"]) == 0
+    assert dataset_summary(df)["duplicates"] == 0
+
+def test_count_duplicates_mixed_type_objects():
+    """
+    Test that object values are compared like DataFrame.duplicated: 1 and "1" differ, 1, 1.0 and True match.
+    """
+    df = pd.DataFrame({"mixed": [1, "1", 1.0, True, None, "a", np.str_("a"), b"a", 2**70, float(2**70)]})
+
+    assert count_duplicates(df) == df.duplicated().sum() == 4
+    chunks = [pd.DataFrame({"id": [1, 2, 3]}), pd.DataFrame({"id": [3.0, np.nan, 4.0]})]
+    assert dataset_summary_stream(chunks)["duplicates"] == 1
+
+def test_count_duplicates_mixed_missing_objects():
+    """
+    Test that None and NaN in an object column count as the same missing value, as DataFrame.duplicated does.
+    """
+    df = pd.DataFrame({"a": ["x", None, "y", np.nan], "b": [1, 2, 1, 2]})
+
+    assert count_duplicates(df) == df.duplicated().sum() == 1
+    assert dataset_summary(df)["duplicates"] == 1
+    assert dataset_summary_stream([df.iloc[:2], df.iloc[2:]])["duplicates"] == 1
+
+def test_dataset_summary_stream_bloom_duplicates():
+    """
+    Test that Bloom-filter duplicate counting over a stream stays within the false positive budget.
+    """
+    df = pd.DataFrame({"id": np.arange(20000) % 15000, "cat_col": ["A"] * 20000})
+    chunks = (df.iloc[i:i + 2000] for i in range(0, len(df), 2000))
+    result = dataset_summary_stream(chunks, bloom_capacity=20000, bloom_error_rate=0.001)
+
+    assert 5000 <= result["duplicates"] <= 5000 + 0.005 * 15000
+
+def test_summary_state_bloom_merge():
+    """
+    Test that Bloom-filter states merge across workers and refuse to merge into exact states.
+    """
+    part_a = pd.DataFrame({"id": np.arange(0, 3000)})
+    part_b = pd.DataFrame({"id": np.arange(2000, 5000)})
+    state_a = SummaryState(bloom_capacity=10000).update(part_a)
+    state_b = SummaryState(bloom_capacity=10000).update(part_b)
+    state_a.merge(state_b)
+
+    assert state_a.result()["duplicates"] == pytest.approx(1000, abs=150)
+    with pytest.raises(ValueError, match="Bloom-filter"):
+        SummaryState().merge(state_b)
+
+@pytest.mark.parametrize("parallel_backend", ["threads", "processes"])
+def test_dataset_summary_parallel_matches_serial(parallel_backend):
+    """
+    Test that scanning columns on a worker pool gives exactly the serial result.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({f"num_{i}": rng.normal(size=200) for i in range(6)})
+    df["cat_col"] = rng.choice(["A", "B", None], size=200)
+    df = pd.concat([df, df.iloc[:20]], ignore_index=True)
+
+    expected = dataset_summary(df)
+    result = dataset_summary(df, n_jobs=3, parallel_backend=parallel_backend)
+
+    pd.testing.assert_frame_equal(result["missing_values"], expected["missing_values"])
+    pd.testing.assert_frame_equal(result["numerical_summary"], expected["numerical_summary"], check_exact=True)
+    pd.testing.assert_frame_equal(result["categorical_summary"], expected["categorical_summary"])
+    assert result["duplicates"] == expected["duplicates"] == 20
+
+def test_dataset_summary_invalid_parallel_options():
+    """
+    Test that invalid n_jobs and backend values raise a ValueError.
+    """
+    df = pd.DataFrame({"num_col": [1, 2, 3]})
+    with pytest.raises(ValueError, match="n_jobs"):
+        dataset_summary(df, n_jobs=0)
+    with pytest.raises(ValueError, match="parallel_backend"):
+        dataset_summary(df, n_jobs=2, parallel_backend="gpu")
+
+def test_dataset_summary_sample_estimates():
+    """
+    Test that a sampled summary flags estimates and its intervals cover the true values.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"num_col": rng.normal(50, 10, 100_000), "cat_col": rng.choice(["A", "B"], 100_000)})
+    df.loc[df.index[:20_000], "num_col"] = np.nan
+    result = dataset_summary(df, sample=5000, random_state=1, confidence=0.99)
+
+    sampling = result["sampling"]
+    assert sampling["sample_size"] == 5000
+    assert sampling["population_size"] == 100_000
+    assert sampling["fields"]["numerical_summary"] == "estimate"
+    assert sampling["fields"]["duplicates"] == "sample"
+
+    missing = result["missing_values"].set_index("column").loc["num_col"]
+    assert missing["missing_percentage_ci_low"] <= 20 <= missing["missing_percentage_ci_high"]
+    summary = result["numerical_summary"].loc["num_col"]
+    assert summary["mean_ci_low"] <= df["num_col"].mean() <= summary["mean_ci_high"]
+    assert summary["50%_ci_low"] <= df["num_col"].median() <= summary["50%_ci_high"]
+    assert summary["count"] == pytest.approx(80_000, rel=0.05)
+
+def test_dataset_summary_sample_fraction_and_full():
+    """
+    Test fractional sampling, and that a sample covering every row returns the exact summary.
+    """
+    df = pd.DataFrame({"num_col": np.arange(10_000, dtype=float)})
+    result = dataset_summary(df, sample=0.1, random_state=0)
+    assert result["sampling"]["sample_size"] == pytest.approx(1000, rel=0.15)
+
+    exact = dataset_summary(df, sample=20_000)
+    assert "sampling" not in exact
+    with pytest.raises(ValueError, match="sample"):
+        dataset_summary(df, sample=1.5)
+
+def test_dataset_summary_cache():
+    """
+    Test that repeated calls on unchanged data are served from the cache and changed data is recomputed.
+    """
+    cache = ResultCache()
+    df = pd.DataFrame({"num_col": [1, 2, 2], "cat_col": ["A", "B", "B"]})
+    first = dataset_summary(df, cache=cache)
+    second = dataset_summary(df.copy(), cache=cache, n_jobs=2)
+
+    assert cache.hits == 1 and cache.misses == 1
+    pd.testing.assert_frame_equal(first["numerical_summary"], second["numerical_summary"])
+
+    df.loc[0, "num_col"] = 10
+    dataset_summary(df, cache=cache)
+    assert cache.misses == 2
+
+def test_dataset_summary_cache_skips_generator_samples():
+    """
+    Test that samples drawn from a Generator are never cached, while integer seeds are.
+    """
+    cache = ResultCache()
+    df = pd.DataFrame({"num_col": np.arange(1000)})
+    rng = np.random.default_rng(0)
+
+    first = dataset_summary(df, sample=100, random_state=rng, cache=cache)
+    second = dataset_summary(df, sample=100, random_state=rng, cache=cache)
+    assert cache.hits == 0 and cache.misses == 0 and len(cache._memory) == 0
+    assert first["numerical_summary"].loc["num_col", "mean"] != second["numerical_summary"].loc["num_col", "mean"]
+
+    dataset_summary(df, sample=100, random_state=0, cache=cache)
+    dataset_summary(df, sample=100, random_state=0, cache=cache)
+    assert cache.hits == 1 and cache.misses == 1
+
+def test_dataset_summary_memory_report():
+    """
+    Test that the memory report lists per-column usage and compact dtype recommendations.
+    """
+    df = pd.DataFrame({
+        "small_int": [1, 2, 3, 4],
+        "wide_int": [-40_000, 0, 1, 2],
+        "float_col": [1.5, 2.5, np.nan, 4.0],
+        "decimal_col": [0.1, 0.2, 0.3, 0.4],
+        "big_id": [2.0**24 + 1, 1.0, 2.0, 3.0],
+        "label": ["A", "A", "A", "B"],
+        "unique_label": ["w", "x", "y", "z"],
+    })
+    report = dataset_summary(df, memory_report=True)["memory_usage"].set_index("column")
+
+    assert report["memory_bytes"].tolist() == df.memory_usage(deep=True, index=False).tolist()
+    assert report["recommended_dtype"].to_dict() == {
+        "small_int": "int8",
+        "wide_int": "int32",
+        "float_col": "float32",
+        "decimal_col": "float64",
+        "big_id": "float64",
+        "label": "category",
+        "unique_label": "object",
+    }
+    with pytest.raises(ValueError, match="memory_report"):
+        dataset_summary(df, memory_report=True, sample=2)
+
+def test_optimize_dtypes():
+    """
+    Test that optimize_dtypes applies the recommendations, preserves values and reports bytes saved.
+    """
+    df = pd.DataFrame({
+        "small_int": np.arange(1000) % 100,
+        "label": np.array(["alpha", "beta"] * 500, dtype=object),
+    })
+    optimized, bytes_saved = optimize_dtypes(df)
+
+    assert optimized["small_int"].dtype == np.int8
+    assert isinstance(optimized["label"].dtype, pd.CategoricalDtype)
+    assert (optimized["small_int"] == df["small_int"]).all()
+    lossy = pd.DataFrame({"price": [19.99, 5.25], "id": [2.0**24 + 1, 7.0]})
+    pd.testing.assert_frame_equal(optimize_dtypes(lossy)[0], lossy)
+    assert bytes_saved == df.memory_usage(deep=True, index=False).sum() - optimized.memory_usage(deep=True, index=False).sum()
+    assert bytes_saved > 0
+    with pytest.raises(ValueError, match="memory_report"):
+        optimize_dtypes(df, summary=dataset_summary(df))
+
+def _native_frame():
+    df = pd.DataFrame({
+        "float_col": [1.5, np.nan, 3.25, 4.0, -2.0, 8.5, 1.5],
+        "int_col": [1, 2, 3, 4, 5, 6, 1],
+        "obj_col": ["x", None, "y", "z", "x", None, "x"],
+        "cat_col": pd.Categorical(["A", "B", None, "A", "A", "B", "A"]),
+        "bool_col": [True, False, True, True, False, True, True],
+    })
+    return df
+
+def _assert_same_summary(result, expected):
+    pd.testing.assert_frame_equal(result["missing_values"], expected["missing_values"])
+    pd.testing.assert_frame_equal(result["numerical_summary"], expected["numerical_summary"])
+    pd.testing.assert_frame_equal(result["categorical_summary"], expected["categorical_summary"])
+    assert result["feature_types"] == expected["feature_types"]
+    assert result["duplicates"] == expected["duplicates"]
+
+def test_dataset_summary_arrow_table():
+    """
+    Test that a pyarrow Table is summarized natively with the same result as pandas.
+    """
+    pa = pytest.importorskip("pyarrow")
+    df = _native_frame()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    _assert_same_summary(dataset_summary(table), dataset_summary(df))
+    _assert_same_summary(
+        dataset_summary(table, percentiles=[0.1, 0.9], duplicate_subset=["obj_col"]),
+        dataset_summary(df, percentiles=[0.1, 0.9], duplicate_subset=["obj_col"]),
+    )
+    with pytest.raises(KeyError):
+        dataset_summary(table, duplicate_subset=["missing_col"])
+
+def test_dataset_summary_arrow_large_integers():
+    """
+    Test that int64 and uint64 Arrow columns beyond 2**53 are summarized like pandas instead of failing the cast.
+    """
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "user_id": np.arange(2**60, 2**60 + 10),
+        "unsigned_id": np.arange(2**63, 2**63 + 10, dtype="uint64"),
+    })
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    _assert_same_summary(dataset_summary(table), dataset_summary(df))
+
+def test_dataset_summary_arrow_dataset(tmp_path):
+    """
+    Test that a Parquet dataset is summarized natively and can be streamed in batches.
+    """
+    pa = pytest.importorskip("pyarrow")
+    ds = pytest.importorskip("pyarrow.dataset")
+    import pyarrow.parquet as pq
+
+    df = _native_frame()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path / "data.parquet")
+    dataset = ds.dataset(tmp_path / "data.parquet")
+
+    _assert_same_summary(dataset_summary(dataset), dataset_summary(df))
+    assert dataset_summary_stream(dataset, chunksize=3)["duplicates"] == 1
+
+def test_dataset_summary_polars():
+    """
+    Test that a Polars DataFrame is summarized natively with the same result as pandas.
+    """
+    pl = pytest.importorskip("polars")
+    df = _native_frame()
+    frame = pl.from_pandas(df)
+
+    _assert_same_summary(dataset_summary(frame), dataset_summary(df))
+    _assert_same_summary(
+        dataset_summary(frame, percentiles=[0.05], duplicate_subset=["int_col", "obj_col"]),
+        dataset_summary(df, percentiles=[0.05], duplicate_subset=["int_col", "obj_col"]),
+    )
+
+def test_dataset_summary_native_matches_pandas_conversion():
+    """
+    Test that decimal, date and nullable boolean columns are classified the same whether or not the input is converted.
+    """
+    pa = pytest.importorskip("pyarrow")
+    pl = pytest.importorskip("polars")
+    import datetime
+    import decimal
+
+    table = pa.table({
+        "num_col": [1.0, 2.0, 2.0],
+        "price": pa.array([decimal.Decimal("1.5"), None, decimal.Decimal("1.5")]),
+        "day": pa.array([datetime.date(2024, 1, 1), datetime.date(2024, 1, 2), datetime.date(2024, 1, 2)]),
+        "flag": pa.array([True, None, True]),
+    })
+
+    for data in (table, pl.from_arrow(table)):
+        _assert_same_summary(dataset_summary(data), dataset_summary(data.to_pandas()))
+        _assert_same_summary(dataset_summary(data), dataset_summary(data, cache=ResultCache()))
+
+def test_dataset_summary_native_falls_back_to_pandas():
+    """
+    Test that options without a native implementation convert Arrow input to pandas.
+    """
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"num_col": [1.0, 2.0, 2.0], "span": pd.to_timedelta([1, 2, 2], unit="s")})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    _assert_same_summary(dataset_summary(table), dataset_summary(df))
+    assert "memory_usage" in dataset_summary(table, memory_report=True)
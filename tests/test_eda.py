@@ -1,7 +1,20 @@
+import os
 import pandas as pd
 import numpy as np
 import pytest
-from mds_2025_helper_functions.eda import perform_eda
+from mds_2025_helper_functions.cache import ResultCache
+from mds_2025_helper_functions.eda import (
+    EDAResult, compute_eda, detect_outliers, perform_eda, render_eda, save_eda_figures
+)
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close every figure a test leaves open, since mocked plt.show never releases them."""
+    import matplotlib.pyplot as plt
+
+    yield
+    plt.close("all")
 
 def test_perform_eda_invalid_input():
     """Test that the function raises a TypeError when input is not a DataFrame."""
@@ -120,4 +133,317 @@ def test_perform_eda_no_numeric_columns(capfd, mocker):
     perform_eda(df)
 
     captured = capfd.readouterr()
-    assert "Not enough numeric columns for correlation heatmap." in captured.out
\ No newline at end of file
+    assert "Not enough numeric columns for correlation heatmap." in captured.out
+
+def test_perform_eda_cache(capfd, mocker):
+    """Test that cached statistics give the same report and are reused."""
+    mocker.patch("matplotlib.pyplot.show")
+    cache = ResultCache()
+    df = pd.DataFrame({
+        "num1": [1, 2, 100, 3, 4],
+        "num2": [5, 6, 7, 8, 500]
+    })
+
+    perform_eda(df, cache=cache)
+    first = capfd.readouterr().out
+    perform_eda(df, cache=cache)
+    second = capfd.readouterr().out
+
+    assert first == second
+    assert cache.hits == 1
+    assert "num1: 1 potential outliers" in second
+
+def test_compute_eda_result():
+    """Test that compute_eda returns the statistics without printing or plotting."""
+    df = pd.DataFrame({
+        "num1": [1, 2, 100, 3, 4],
+        "num2": [5.0, 6.0, np.nan, 8.0, 500.0],
+        "cat1": ["A", "B", "A", "C", "A"],
+    })
+
+    result = compute_eda(df)
+
+    assert isinstance(result, EDAResult)
+    assert result.missing_values.to_dict() == {"num1": 0, "num2": 1, "cat1": 0}
+    assert result.outliers == {"num1": 1, "num2": 1}
+    assert result.numeric_columns == ["num1", "num2"]
+    assert result.value_counts["cat1"].to_dict() == {"A": 3, "B": 1, "C": 1}
+    assert list(result.correlation.columns) == ["num1", "num2"]
+    assert "RangeIndex: 5 entries" in result.info
+    with pytest.raises(TypeError, match="Input must be a pandas DataFrame."):
+        compute_eda([])
+
+def test_eda_result_repr_is_compact():
+    """Test that the result echoes as a one-line summary instead of every table it holds."""
+    df = pd.DataFrame({"num1": [1, 2, 100, 3, np.nan], "cat1": ["A", "B", "A", None, "A"]})
+
+    assert repr(compute_eda(df)) == (
+        "EDAResult(columns=2, numeric_columns=1, missing_values=2, outliers=1, figures=0)"
+    )
+
+def test_perform_eda_without_plots(capfd, mocker):
+    """Test that plots=False prints the reports without drawing any figure."""
+    show = mocker.patch("matplotlib.pyplot.show")
+    df = pd.DataFrame({
+        "num1": [1, 2, 100, 3, np.nan],
+        "num2": [5, 6, 7, 8, 500]
+    })
+
+    result = perform_eda(df, plots=False)
+
+    assert isinstance(result, EDAResult)
+    assert "num2: 1 potential outliers" in capfd.readouterr().out
+    show.assert_not_called()
+
+def test_render_eda_reuses_result(capfd, mocker):
+    """Test that render_eda draws from a precomputed result without recomputing it."""
+    show = mocker.patch("matplotlib.pyplot.show")
+    df = pd.DataFrame({
+        "num1": [1, 2, 100, 3, 4],
+        "num2": [5, 6, 7, 8, 500]
+    })
+    result = compute_eda(df)
+    describe = mocker.patch.object(pd.DataFrame, "describe")
+
+    render_eda(df, result, rows=1, cols=2)
+
+    describe.assert_not_called()
+    assert show.call_count == 3
+    assert "num1: 1 potential outliers" in capfd.readouterr().out
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_perform_eda_output_dir(tmp_path, mocker, n_jobs):
+    """Test that figures are written to files, closed and never shown."""
+    import matplotlib.pyplot as plt
+
+    show = mocker.patch("matplotlib.pyplot.show")
+    plt.close("all")
+    df = pd.DataFrame({
+        "num1": [1, 2, 100, 3, np.nan],
+        "num2": [5, 6, 7, 8, 500],
+        "cat1": ["A", "B", "A", "C", "A"],
+    })
+
+    result = perform_eda(df, rows=2, cols=2, output_dir=tmp_path / "report", fig_format="svg", n_jobs=n_jobs)
+
+    assert sorted(result.figures) == ["correlation", "features", "missing_values", "scatter"]
+    for path in result.figures.values():
+        assert path.endswith(".svg")
+        assert os.path.dirname(path) == str(tmp_path / "report")
+        assert os.path.getsize(path) > 0
+    assert plt.get_fignums() == []
+    show.assert_not_called()
+
+def test_save_eda_figures_invalid_format(tmp_path):
+    """Test that an unsupported figure format raises a ValueError."""
+    df = pd.DataFrame({"num1": [1, 2, 3]})
+    with pytest.raises(ValueError, match="fig_format"):
+        save_eda_figures(df, compute_eda(df), tmp_path, fig_format="gif")
+
+def test_perform_eda_binned_scatter(mocker):
+    """Test that pairs above the row threshold are drawn as binned densities with matching counts."""
+    import matplotlib.pyplot as plt
+
+    mocker.patch("matplotlib.pyplot.show")
+    scatterplot = mocker.patch("seaborn.scatterplot")
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.normal(size=5000), "y": rng.normal(size=5000)})
+    df.loc[:9, "y"] = np.nan
+
+    perform_eda(df, rows=1, cols=2, scatter_threshold=1000, scatter_bins=20)
+
+    scatterplot.assert_not_called()
+    mesh = plt.gcf().axes[0].collections[0]
+    assert mesh.get_array().sum() == 4990
+    expected, _, _ = np.histogram2d(df.dropna()["x"], df.dropna()["y"], bins=20)
+    assert np.array_equal(mesh.get_array().filled(0).reshape(20, 20), expected.T)
+    plt.close("all")
+
+def test_binned_kde_matches_gaussian_kde():
+    """Test that the binned FFT KDE matches scipy's exact Gaussian KDE with Scott's bandwidth."""
+    from scipy.stats import gaussian_kde
+    from mds_2025_helper_functions.eda import _binned_kde
+
+    values = np.random.default_rng(0).gamma(2.0, size=5000)
+    values[:5] = np.nan
+    grid, density, n = _binned_kde(values)
+
+    expected = gaussian_kde(values[5:])(grid)
+    assert n == 4995
+    assert grid[0] == np.nanmin(values) and grid[-1] == np.nanmax(values)
+    np.testing.assert_allclose(density, expected, atol=1e-3 * expected.max())
+    assert _binned_kde(np.array([1.0, 1.0, np.nan])) is None
+
+def test_perform_eda_histogram_kde_line(mocker):
+    """Test that the feature grid overlays a count-scaled KDE line on numeric histograms."""
+    import matplotlib.pyplot as plt
+
+    mocker.patch("matplotlib.pyplot.show")
+    df = pd.DataFrame({"num1": np.random.default_rng(0).normal(size=1000)})
+
+    perform_eda(df, rows=1, cols=2)
+
+    ax = plt.gcf().axes[0]
+    assert len(ax.lines) == 1
+    heights = [patch.get_height() for patch in ax.patches]
+    assert 0.5 * max(heights) < ax.lines[0].get_ydata().max() < 1.5 * max(heights)
+    plt.close("all")
+
+def test_blocked_correlation_matches_pandas(monkeypatch):
+    """Test that the blocked correlation of a wide frame matches DataFrame.corr with missing values."""
+    from mds_2025_helper_functions import eda
+
+    monkeypatch.setattr(eda, "CORRELATION_BLOCK_SIZE", 4)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 10)) + 100, columns=[f"c{i}" for i in range(10)])
+    df = df.mask(rng.random(df.shape) < 0.1)
+    df["c8"] = 1.0
+    df.loc[1:, "c9"] = np.nan
+
+    result = eda._correlation(df)
+
+    pd.testing.assert_frame_equal(result, df.corr(), atol=1e-12)
+
+def test_top_correlated_pairs():
+    """Test that pairs are ranked by absolute correlation and capped at k."""
+    from mds_2025_helper_functions.eda import _top_correlated_pairs
+
+    correlation = pd.DataFrame(
+        [[1.0, 0.1, -0.9], [0.1, 1.0, np.nan], [-0.9, np.nan, 1.0]], index=list("abc"), columns=list("abc")
+    )
+
+    assert _top_correlated_pairs(correlation, 2) == [("a", "c"), ("a", "b")]
+    assert _top_correlated_pairs(correlation, None) == [("a", "b"), ("a", "c"), ("b", "c")]
+
+def test_perform_eda_caps_scatter_pairs(mocker):
+    """Test that wide frames only draw the requested number of scatter pairs."""
+    import matplotlib.pyplot as plt
+
+    mocker.patch("matplotlib.pyplot.show")
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(50, 8)), columns=[f"c{i}" for i in range(8)])
+    df["c7"] = df["c0"] * 2
+
+    perform_eda(df, rows=4, cols=2, max_scatter_pairs=3)
+
+    axes = plt.gcf().axes
+    assert len(axes) == 3
+    assert axes[0].get_title() == "c0 vs c7"
+    plt.close("all")
+
+def test_max_scatter_pairs_must_be_positive(tmp_path):
+    """Test that max_scatter_pairs below 1 raises a clear ValueError instead of failing in plt.subplots."""
+    from mds_2025_helper_functions.eda import compute_eda, render_eda, save_eda_figures
+    from mds_2025_helper_functions.report import write_eda_report
+
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [3.0, 1.0, 2.0]})
+    result = compute_eda(df)
+    for call in (
+        lambda: perform_eda(df, max_scatter_pairs=0),
+        lambda: render_eda(df, result, max_scatter_pairs=0),
+        lambda: save_eda_figures(df, result, tmp_path, max_scatter_pairs=-1),
+        lambda: write_eda_report(df, tmp_path / "report.html", max_scatter_pairs=0),
+    ):
+        with pytest.raises(ValueError, match="max_scatter_pairs"):
+            call()
+    assert not (tmp_path / "report.html").exists()
+
+@pytest.mark.parametrize("chunk_cells", [60, 8])
+def test_compute_eda_missingness_map(monkeypatch, chunk_cells):
+    """Test that missing fractions per row block and co-missingness counts match the full mask."""
+    from mds_2025_helper_functions import eda
+
+    # Force several chunks, larger and smaller than a block, so blocks are assembled across chunk boundaries
+    monkeypatch.setattr(eda, "MISSING_CHUNK_CELLS", chunk_cells)
+    row_chunks = eda._row_chunks
+    chunk_sizes = []
+
+    def spy_row_chunks(*args):
+        for start, mask in row_chunks(*args):
+            chunk_sizes.append(mask.size)
+            yield start, mask
+
+    monkeypatch.setattr(eda, "_row_chunks", spy_row_chunks)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(103, 4)), columns=list("abcd"))
+    df = df.mask(rng.random(df.shape) < 0.2)
+    df["d"] = 1.0
+
+    result = eda.compute_eda(df, missing_resolution=10)
+
+    mask = df.isnull()
+    assert result.missing_values.equals(mask.sum())
+    assert list(result.missing_blocks.index) == list(range(0, 103, 11))
+    expected_blocks = mask.groupby(np.arange(103) // 11).mean()
+    np.testing.assert_allclose(result.missing_blocks.to_numpy(), expected_blocks.to_numpy())
+    expected_co = mask[list("abc")].astype(int).T @ mask[list("abc")].astype(int)
+    pd.testing.assert_frame_equal(result.co_missing, expected_co, check_dtype=False)
+    assert max(chunk_sizes) <= max(chunk_cells, 4)
+    assert eda.compute_eda(df.fillna(0)).missing_blocks is None
+
+def test_detect_outliers_methods():
+    """Test the IQR, z-score and MAD outlier counts and row indices against per-column formulas."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "a": rng.standard_t(3, size=500),
+        "b": pd.array(rng.integers(0, 50, size=500), dtype="Int64"),
+        "c": np.r_[np.ones(499), 10.0],
+        "cat": ["x"] * 500,
+    }, index=np.arange(1000, 1500))
+    df.loc[1003, "a"] = np.nan
+    df.loc[1004, "b"] = pd.NA
+
+    a = df["a"]
+    q1, q3 = a.quantile(0.25), a.quantile(0.75)
+    iqr_mask = (a < q1 - 1.5 * (q3 - q1)) | (a > q3 + 1.5 * (q3 - q1))
+    z_mask = ((a - a.mean()) / a.std()).abs() > 3
+    mad = (a - a.median()).abs().median()
+    mad_mask = (0.6745 * (a - a.median()) / mad).abs() > 3.5
+
+    counts, indices = detect_outliers(df, return_indices=True)
+    assert counts == {"a": int(iqr_mask.sum()), "b": 0, "c": 1}
+    assert indices["a"].equals(df.index[iqr_mask.to_numpy()])
+    assert list(indices["c"]) == [1499]
+    assert detect_outliers(df, method="zscore")["a"] == int(z_mask.sum())
+    assert detect_outliers(df, method="mad") == {"a": int(mad_mask.sum()), "b": 0, "c": 0}
+    assert detect_outliers(df, method="zscore", threshold=100)["a"] == 0
+
+def test_detect_outliers_invalid_method():
+    """Test that an unknown outlier method raises a ValueError."""
+    with pytest.raises(ValueError, match="method must be one of"):
+        detect_outliers(pd.DataFrame({"a": [1, 2]}), method="tukey")
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_perform_eda_top_categories(mocker):
+    """Test that high-cardinality count plots show the top categories and an 'Other' bar without recounting."""
+    import matplotlib.pyplot as plt
+
+    mocker.patch("matplotlib.pyplot.show")
+    df = pd.DataFrame({"cat": ["a"] * 50 + ["b"] * 30 + [f"id{i}" for i in range(40)]})
+    result = compute_eda(df)
+    value_counts = mocker.spy(pd.Series, "value_counts")
+
+    render_eda(df, result, rows=1, cols=2, max_categories=2)
+
+    ax = plt.gcf().axes[0]
+    assert [label.get_text() for label in ax.get_xticklabels()] == ["a", "b", "Other (40)"]
+    assert [patch.get_height() for patch in ax.patches] == [50, 30, 40]
+    value_counts.assert_not_called()
+    plt.close("all")
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_perform_eda_count_plot_keeps_mixed_type_categories(mocker):
+    """Test that categories which only match after converting to text, like 1 and "1", keep separate bars."""
+    import matplotlib.pyplot as plt
+
+    mocker.patch("matplotlib.pyplot.show")
+    df = pd.DataFrame({"cat": pd.Series([1] * 3 + ["1"] * 2 + ["a"], dtype=object)})
+    result = compute_eda(df)
+
+    render_eda(df, result, rows=1, cols=2)
+
+    ax = plt.gcf().axes[0]
+    assert [label.get_text() for label in ax.get_xticklabels()] == ["1", "1", "a"]
+    assert [patch.get_height() for patch in ax.patches] == [3, 2, 1]
+    plt.close("all")
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 import matplotlib.pyplot as plt
-from mds_2025_helper_functions.htv import htv
+from scipy.stats import chi2, norm
+from mds_2025_helper_functions.htv import HTVisualizer, _htv_curves, htv
 
 def test_htv_z_test_two_tailed():
     test_output = {
@@ -85,4 +87,76 @@ def test_htv_invalid_test_type():
 
 def test_htv_missing_parameters():
     with pytest.raises(ValueError):
-        htv({}, test_type="chi2")
\ No newline at end of file
+        htv({}, test_type="chi2")
+
+def test_htv_caches_curves():
+    """Test that repeated calls with equal parameters reuse the cached curves."""
+    _htv_curves.cache_clear()
+    for sample_size in (30, 30.0, np.int64(30)):
+        fig, ax = htv({"mu0": 0, "mu1": 1, "sigma": 1, "sample_size": sample_size}, test_type="z")
+        plt.close(fig)
+    info = _htv_curves.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+    x = _htv_curves("z", 0.05, "two-tailed", 0.0, 1.0, 1.0, 30.0, None, None, None)[0]
+    assert not x.flags.writeable
+
+def test_htv_grid_follows_distributions():
+    """Test that the grid covers both distributions and contains the critical values."""
+    fig, ax = htv({"df": 3}, test_type="chi2", tail="one-tailed")
+    x = ax.lines[0].get_xdata()
+    critical_value = chi2.ppf(0.95, 3)
+    assert 0 <= x.min() < chi2.ppf(0.001, 3)
+    assert x.max() > chi2.isf(0.001, 4)
+    assert critical_value in x
+    # Points are denser around the critical value than elsewhere
+    near = np.abs(x - critical_value) < 1
+    assert near.sum() > 5 * (np.abs(x - x.min() - 1.5) < 1).sum()
+    plt.close(fig)
+
+def test_htv_visualizer_updates_in_place():
+    """Test that updates reuse the figure and move curves, critical values and legend."""
+    visualizer = HTVisualizer({"mu0": 100, "mu1": 105, "sigma": 15, "sample_size": 30}, blit=False)
+    figures = plt.get_fignums()
+    visualizer.update({"sample_size": 60})
+
+    assert plt.get_fignums() == figures
+    assert visualizer.test_output["sigma"] == 15
+    x, y = visualizer.ax.lines[0].get_data()
+    np.testing.assert_allclose(y, norm.pdf(x, loc=100, scale=15 / np.sqrt(60)))
+    labels = [text.get_text() for text in visualizer.ax.get_legend().get_texts()]
+    assert f"Critical Value (High) = {norm.ppf(0.975, 100, 15 / np.sqrt(60)):.2f}" in labels
+
+    visualizer.update(tail="one-tailed")
+    labels = [text.get_text() for text in visualizer.ax.get_legend().get_texts()]
+    assert len(labels) == 5 and not visualizer.ax.lines[2].get_visible()
+    visualizer.close()
+
+def test_htv_visualizer_blits_without_full_redraws(mocker):
+    """Test that updates with fixed limits only blit, after one full draw to capture the background."""
+    visualizer = HTVisualizer({"df": 4}, test_type="chi2")
+    draw = mocker.spy(visualizer.fig.canvas, "draw")
+    blit = mocker.spy(visualizer.fig.canvas, "blit")
+    for df in range(5, 10):
+        visualizer.update({"df": df}, rescale=False)
+
+    assert draw.call_count == 0
+    assert blit.call_count == 5
+    visualizer.update(test_type="anova", test_output={"df1": 3, "df2": 20})
+    assert draw.call_count > 0
+    visualizer.close()
+
+def test_htv_visualizer_invalid_update_keeps_state():
+    """Test that an invalid update raises and leaves the plot unchanged."""
+    visualizer = HTVisualizer({"df": 4}, test_type="chi2", blit=False)
+    with pytest.raises(ValueError):
+        visualizer.update(test_type="anova")
+    assert visualizer.test_type == "chi2"
+    visualizer.update({"df": 6})
+    visualizer.close()
+
+def test_htv_invalid_parameters_leave_no_figure():
+    """Test that htv does not leak a figure when the parameters are invalid."""
+    figures = plt.get_fignums()
+    with pytest.raises(ValueError):
+        htv({}, test_type="anova")
+    assert plt.get_fignums() == figures
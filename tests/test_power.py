@@ -0,0 +1,167 @@
+import numpy as np
+import pytest
+from scipy.stats import chi2, f, norm, t
+from mds_2025_helper_functions.power import (
+    minimum_detectable_effect, power_analysis, power_curve, simulate_error_rates, solve_sample_size,
+)
+
+def test_power_analysis_z_matches_closed_form():
+    """Test that z-test power matches the normal closed form for both tails."""
+    result = power_analysis(mu0=100, mu1=105, sigma=15, sample_size=10, alpha=0.05)
+    shift = 5 / (15 / np.sqrt(10))
+    expected = norm.sf(norm.ppf(0.975) - shift) + norm.cdf(-norm.ppf(0.975) - shift)
+    assert result["power"] == pytest.approx(expected)
+    assert result["critical_value_low"] == pytest.approx(norm.ppf(0.025, loc=100, scale=15 / np.sqrt(10)))
+
+    result = power_analysis(mu0=100, mu1=105, sigma=15, sample_size=10, alpha=0.05, tail="one-tailed")
+    assert result["power"] == pytest.approx(norm.sf(norm.ppf(0.95) - shift))
+    assert result["critical_value_low"] == -np.inf
+
+def test_power_analysis_other_tests_match_htv_distributions():
+    """Test that t, chi2 and ANOVA errors use the distributions htv draws."""
+    result = power_analysis(mu0=0, mu1=1.5, sample_size=25, alpha=0.01, test_type="t", tail="one-tailed")
+    assert result["beta"] == pytest.approx(t.cdf(t.ppf(0.99, 24), 24, loc=1.5))
+
+    result = power_analysis(alpha=0.05, test_type="chi2", df=4)
+    low, high = chi2.ppf([0.025, 0.975], 4)
+    assert result["beta"] == pytest.approx(chi2.cdf(high, 5) - chi2.cdf(low, 5))
+
+    result = power_analysis(alpha=0.05, test_type="anova", tail="one-tailed", df1=3, df2=20)
+    assert result["beta"] == pytest.approx(f.cdf(f.ppf(0.95, 3, 20), 3, 21))
+
+def test_power_analysis_broadcasts():
+    """Test that array inputs broadcast and agree with scalar calls."""
+    sample_size = np.arange(10, 101, 10)
+    alpha = np.array([[0.01], [0.05]])
+    result = power_analysis(mu0=0, mu1=0.5, sigma=1, sample_size=sample_size, alpha=alpha)
+
+    for key in ("critical_value_low", "critical_value_high", "alpha", "beta", "power"):
+        assert result[key].shape == (2, 10)
+    np.testing.assert_allclose(result["power"], 1 - result["beta"])
+    assert np.all(np.diff(result["power"], axis=1) > 0)
+    scalar = power_analysis(mu0=0, mu1=0.5, sigma=1, sample_size=30, alpha=0.05)
+    assert result["power"][1, 2] == pytest.approx(scalar["power"])
+
+def test_power_analysis_invalid_inputs():
+    """Test that invalid test types, tails, alphas and missing degrees of freedom raise."""
+    with pytest.raises(ValueError):
+        power_analysis(test_type="invalid")
+    with pytest.raises(ValueError):
+        power_analysis(tail="left")
+    with pytest.raises(ValueError):
+        power_analysis(alpha=[0.05, 1.5])
+    with pytest.raises(ValueError):
+        power_analysis(test_type="chi2")
+    with pytest.raises(ValueError):
+        power_analysis(test_type="anova", df1=2)
+
+def test_power_curve_matches_power_analysis_for_z():
+    """Test that the effect-size z model agrees with power_analysis and handles huge t noncentralities."""
+    curve = power_curve(effect_size=5 / 15, sample_size=np.arange(10, 101, 10))
+    expected = power_analysis(mu0=100, mu1=105, sigma=15, sample_size=np.arange(10, 101, 10))["power"]
+    np.testing.assert_allclose(curve, expected)
+
+    power = power_curve(effect_size=0.01, sample_size=[10, 10**6, 10**7], test_type="t")
+    assert not np.isnan(power).any()
+    assert power[-1] == pytest.approx(1)
+
+def test_solve_sample_size_reference_values():
+    """Test the solver against standard power tables for every test type."""
+    assert solve_sample_size(0.5, test_type="z")["sample_size"] == 32
+    np.testing.assert_array_equal(solve_sample_size([0.2, 0.5, 0.8], test_type="t")["sample_size"], [199, 34, 15])
+    assert solve_sample_size(0.3, test_type="chi2", tail="one-tailed", df=1)["sample_size"] == 88
+    # 180 in tables that round up to four equal groups
+    assert solve_sample_size(0.25, test_type="anova", tail="one-tailed", df1=3)["sample_size"] == 179
+
+def test_chi2_and_anova_default_to_upper_tail():
+    """Test that chi2 and ANOVA designs default to the upper-tailed test of standard power tables."""
+    assert solve_sample_size(0.3, test_type="chi2", df=1)["sample_size"] == 88
+    # 159 in tables that round up to three equal groups
+    assert solve_sample_size(0.25, test_type="anova", df1=2)["sample_size"] == 158
+    assert minimum_detectable_effect(100, test_type="anova", df1=2) == pytest.approx(0.315, abs=1e-3)
+    assert power_curve(0.25, 158, test_type="anova", df1=2) == power_curve(
+        0.25, 158, test_type="anova", tail="one-tailed", df1=2
+    )
+    # z and t tests keep two tails
+    assert solve_sample_size(0.5, test_type="t")["sample_size"] == 34
+
+def test_solve_sample_size_is_minimal_and_vectorized():
+    """Test that batched solutions reach the target power and one fewer observation does not."""
+    effect_size = np.array([[0.1], [0.3], [0.6]])
+    alpha = np.array([0.01, 0.05])
+    for test_type in ("z", "t", "chi2", "anova"):
+        result = solve_sample_size(effect_size, power=0.9, alpha=alpha, test_type=test_type, df=2, df1=2)
+        n = result["sample_size"]
+        assert n.shape == (3, 2)
+        assert np.all(result["power"] >= 0.9)
+        assert np.all(power_curve(effect_size, n - 1, alpha, test_type, df=2, df1=2) < 0.9)
+
+def test_solve_sample_size_unreachable_and_invalid():
+    """Test that unreachable targets give NaN and invalid targets raise."""
+    result = solve_sample_size([0.0, 0.5], test_type="t")
+    assert np.isnan(result["sample_size"][0]) and np.isnan(result["power"][0])
+    assert np.isnan(solve_sample_size(-0.5, tail="one-tailed")["sample_size"])
+    with pytest.raises(ValueError):
+        solve_sample_size(0.5, power=1.2)
+    with pytest.raises(ValueError):
+        solve_sample_size(0.5, test_type="anova")
+
+def test_minimum_detectable_effect_inverts_power():
+    """Test that the minimum detectable effect gives the target power at each sample size."""
+    sample_size = np.array([20, 50, 200])
+    for test_type in ("z", "t", "chi2", "anova"):
+        effect = minimum_detectable_effect(sample_size, power=0.8, test_type=test_type, df=3, df1=3)
+        power = power_curve(effect, sample_size, test_type=test_type, df=3, df1=3)
+        np.testing.assert_allclose(power, 0.8, atol=1e-4)
+        assert np.all(np.diff(effect) < 0)
+    with pytest.raises(ValueError):
+        minimum_detectable_effect(3, test_type="anova", df1=3)
+
+@pytest.mark.parametrize("test_type, design", [
+    ("z", {"effect_size": 0.5, "sample_size": 20}),
+    ("t", {"effect_size": 0.5, "sample_size": 20}),
+    ("chi2", {"effect_size": 0.3, "sample_size": 100, "df": 3}),
+    ("anova", {"effect_size": 0.3, "sample_size": 80, "df1": 3}),
+])
+def test_simulate_error_rates_matches_analytic_rates(test_type, design):
+    """Test that simulated error rates for ideal data agree with the analytic ones."""
+    result = simulate_error_rates(test_type=test_type, n_simulations=20_000, seed=0, **design)
+    assert abs(result["empirical_alpha"] - result["alpha"]) < 4 * result["alpha_se"]
+    assert abs(result["empirical_beta"] - result["beta"]) < 4 * result["beta_se"]
+
+def test_simulate_error_rates_upper_tail_default():
+    """Test that chi2 and ANOVA simulations default to the upper-tailed test."""
+    kwargs = {"effect_size": 0.3, "sample_size": 60, "test_type": "anova", "df1": 2, "n_simulations": 2_000, "seed": 0}
+    assert simulate_error_rates(**kwargs) == simulate_error_rates(tail="one-tailed", **kwargs)
+    assert simulate_error_rates(**kwargs)["beta"] == pytest.approx(
+        1 - power_curve(0.3, 60, test_type="anova", tail="one-tailed", df1=2)
+    )
+
+def test_simulate_error_rates_non_ideal_data():
+    """Test that skewed data and unequal group variances inflate the Type I error rate."""
+    skewed = simulate_error_rates(0.5, sample_size=20, test_type="t", distribution="skewed", seed=0)
+    assert skewed["empirical_alpha"] > 0.065
+    unequal = simulate_error_rates(0.3, sample_size=60, test_type="anova", df1=2, group_sigmas=[1, 2, 4], seed=0)
+    assert unequal["empirical_alpha"] > 0.06
+    heavy = simulate_error_rates(0.5, sample_size=20, test_type="z", distribution="heavy-tailed", seed=0)
+    assert abs(heavy["empirical_alpha"] - 0.05) < 0.01
+
+def test_simulate_error_rates_seeds_and_workers():
+    """Test that results depend only on the seed, not on the number of worker processes."""
+    kwargs = {"effect_size": 0.4, "sample_size": 30, "test_type": "t", "n_simulations": 3_000, "chunk_size": 700}
+    serial = simulate_error_rates(seed=1, **kwargs)
+    assert simulate_error_rates(seed=1, n_jobs=2, **kwargs) == serial
+    assert simulate_error_rates(seed=2, **kwargs) != serial
+
+def test_simulate_error_rates_invalid_designs():
+    """Test that invalid designs raise a ValueError."""
+    with pytest.raises(ValueError):
+        simulate_error_rates(0.5, 20, distribution="uniform")
+    with pytest.raises(ValueError):
+        simulate_error_rates(0.5, 20, group_sigmas=[1, 2])
+    with pytest.raises(ValueError):
+        simulate_error_rates(0.5, 20, test_type="anova", df1=2, group_sigmas=[1, 2])
+    with pytest.raises(ValueError):
+        simulate_error_rates(2.0, 100, test_type="chi2", df=1)
+    with pytest.raises(ValueError):
+        simulate_error_rates(0.5, 20, n_simulations=0)
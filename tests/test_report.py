@@ -0,0 +1,57 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from mds_2025_helper_functions.report import write_eda_report
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "num1": rng.normal(size=100),
+        "num2": rng.normal(size=100),
+        "cat1": rng.choice(["A", "B", None], size=100),
+        "date1": pd.date_range("2022-01-01", periods=100),
+    })
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_write_eda_report(tmp_path):
+    """Test that the report is self-contained HTML with every section and a sidecar of column hashes."""
+    path = tmp_path / "report.html"
+    result = write_eda_report(_frame(), path, title="Sales <daily>")
+
+    page = path.read_text()
+    assert result["reused"] == []
+    assert result["recomputed"] == [
+        "overview", "missing_values", "correlation", "column:num1", "column:num2", "column:cat1", "column:date1"
+    ]
+    assert "<h1>Sales &lt;daily&gt;</h1>" in page
+    assert page.count('<img src="data:image/png;base64,') == 7
+    state = json.loads((tmp_path / "report.html.json").read_text())
+    assert sorted(state["columns"]) == ["cat1", "date1", "num1", "num2"]
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_write_eda_report_incremental(tmp_path, mocker):
+    """Test that regeneration only recomputes the sections whose columns or options changed."""
+    path = tmp_path / "report.html"
+    df = _frame()
+    write_eda_report(df, path)
+    first = path.read_text()
+
+    assert write_eda_report(df, path)["recomputed"] == []
+    assert path.read_text() == first
+
+    df["cat1"] = df["cat1"].fillna("C")
+    plot_feature = mocker.patch("mds_2025_helper_functions.report._plot_feature")
+    result = write_eda_report(df, path)
+    assert result["recomputed"] == ["overview", "missing_values", "column:cat1"]
+    assert plot_feature.call_count == 1
+
+    result = write_eda_report(df, path, max_scatter_pairs=1)
+    assert result["recomputed"] == ["correlation"]
+
+def test_write_eda_report_invalid_input(tmp_path):
+    """Test that the exporter raises a TypeError when the input is not a DataFrame."""
+    with pytest.raises(TypeError, match="Input must be a pandas DataFrame."):
+        write_eda_report([], tmp_path / "report.html")
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from mds_2025_helper_functions.sketches import BloomFilter, HyperLogLog, KLLSketch
+
+def test_kll_sketch_exact_for_small_inputs():
+    """Test that the sketch returns exact quantiles before any compaction happens."""
+    values = np.array([5.0, 1.0, np.nan, 3.0, 2.0, 4.0])
+    sketch = KLLSketch(k=50).update(values)
+
+    assert sketch.n == 5
+    np.testing.assert_allclose(sketch.quantile([0.25, 0.5, 0.75]), np.nanquantile(values, [0.25, 0.5, 0.75]))
+
+def test_kll_sketch_bounded_memory_and_accuracy():
+    """Test that the sketch stays small on long streams and keeps rank error low."""
+    values = np.random.default_rng(0).uniform(size=200_000)
+    sketch = KLLSketch(k=200, seed=0)
+    for chunk in np.array_split(values, 20):
+        sketch.update(chunk)
+
+    assert len(sketch) < 3 * 200
+    np.testing.assert_allclose(sketch.quantile([0.25, 0.5, 0.75]), [0.25, 0.5, 0.75], atol=0.02)
+
+def test_kll_sketch_merge():
+    """Test that merging two sketches matches a sketch of the concatenated data."""
+    values = np.random.default_rng(1).normal(size=100_000)
+    left = KLLSketch(seed=0).update(values[:50_000])
+    right = KLLSketch(seed=1).update(values[50_000:])
+    left.merge(right)
+
+    assert left.n == 100_000
+    assert left.min == values.min()
+    assert left.max == values.max()
+    np.testing.assert_allclose(left.quantile(0.5), np.median(values), atol=0.05)
+
+def test_kll_sketch_invalid_k():
+    """Test that a too-small accuracy parameter raises a ValueError."""
+    with pytest.raises(ValueError):
+        KLLSketch(k=2)
+
+def test_hyperloglog_estimate_within_error():
+    """Test that the estimate is close to the true distinct count for small and large inputs."""
+    for n in [10, 1_000, 200_000]:
+        hll = HyperLogLog(precision=14).update(np.arange(n).astype(str))
+        assert hll.count() == pytest.approx(n, rel=4 * hll.relative_error)
+
+def test_hyperloglog_merge_and_missing_values():
+    """Test that merged sketches count the union and that missing values are ignored."""
+    left = HyperLogLog(precision=10).update(["a", "b", None, "c"])
+    right = HyperLogLog(precision=10).update(["c", "d", np.nan])
+    left.merge(right)
+
+    assert round(left.count()) == 4
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(precision=12))
+
+def test_hyperloglog_invalid_precision():
+    """Test that an out-of-range precision raises a ValueError."""
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=3)
+
+def test_kll_sketch_rank_error_bound():
+    """Test that the reported rank error is zero while exact and bounds the error afterwards."""
+    sketch = KLLSketch(k=100, seed=0).update(np.arange(50))
+    assert sketch.normalized_rank_error == 0.0
+
+    values = np.random.default_rng(2).permutation(100_000)
+    sketch = KLLSketch(k=100, seed=0).update(values)
+    estimates = sketch.quantile([0.1, 0.5, 0.9])
+    true_ranks = np.searchsorted(np.sort(values), estimates) / values.size
+
+    assert np.all(np.abs(true_ranks - [0.1, 0.5, 0.9]) <= sketch.normalized_rank_error)
+
+def test_bloom_filter_membership():
+    """Test that added hashes are always found and false positives stay near the target rate."""
+    rng = np.random.default_rng(0)
+    added = rng.integers(0, 2**63, 50_000, dtype=np.int64).astype("uint64")
+    others = rng.integers(0, 2**63, 50_000, dtype=np.int64).astype("uint64") | np.uint64(2**63)
+    bloom = BloomFilter(capacity=50_000, error_rate=0.01).add_hashes(added)
+
+    assert bloom.contains_hashes(added).all()
+    assert bloom.contains_hashes(others).mean() < 0.02
+    assert bloom.count() == pytest.approx(50_000, rel=0.05)
+
+def test_bloom_filter_merge():
+    """Test that merged filters contain both inputs and that mismatched sizes are rejected."""
+    left = BloomFilter(capacity=1000).add_hashes(np.array([1, 2], dtype="uint64"))
+    right = BloomFilter(capacity=1000).add_hashes(np.array([3], dtype="uint64"))
+    left.merge(right)
+
+    assert left.contains_hashes(np.array([1, 2, 3], dtype="uint64")).all()
+    with pytest.raises(ValueError):
+        left.merge(BloomFilter(capacity=10))
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=10, error_rate=2)